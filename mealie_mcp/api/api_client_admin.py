@@ -244,10 +244,17 @@ def post_admin_backups(self, accept_language: Any | None = None) -> Any:
         return self.request("POST", "/api/admin/backups", params=params, data=None)
 
     def get_admin_backups_file_name(
-        self, file_name: str, accept_language: Any | None = None
+        self,
+        file_name: str,
+        accept_language: Any | None = None,
+        dest: str | None = None,
     ) -> Any:
         """Get One"""
         params = None
+        if dest is not None:
+            return self.download(
+                "GET", f"/api/admin/backups/{file_name}", dest, params=params
+            )
         return self.request(
             "GET", f"/api/admin/backups/{file_name}", params=params, data=None
         )
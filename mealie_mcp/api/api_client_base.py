@@ -1,31 +1,309 @@
 #!/usr/bin/env python
+import asyncio
+import importlib.util
+import logging
+import os
+import ssl
+import time
+from collections.abc import Hashable
+from pathlib import Path
 from typing import Any
 from urllib.parse import urljoin
 
+import httpx
 import requests
 from agent_utilities.core.transport_security import (
     ResolvedTLSProfile,
     resolve_configured_tls_profile,
 )
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+from mealie_mcp.api.catalog import CatalogCache
+from mealie_mcp.api.circuit import CircuitBreaker, CircuitBreakers
+from mealie_mcp.api.downloads import (
+    CHUNK_SIZE,
+    BinaryContent,
+    DownloadSink,
+    resolve_target,
+)
+from mealie_mcp.api.errors import MealieApiError
+from mealie_mcp.api.http_cache import CacheEntry, CacheKey, HttpCache
+from mealie_mcp.api.json_codec import JsonDecoder, current_item_fields
+from mealie_mcp.api.limiter import ConcurrencyLimiter, request_priority
+from mealie_mcp.api.media_cache import MediaCache, MediaEntry, media_key
+from mealie_mcp.api.retry import RetryBudget, RetryPolicy
+from mealie_mcp.api.single_flight import (
+    COALESCED_METHODS,
+    AsyncSingleFlight,
+    SingleFlight,
+    flight_key,
+)
+from mealie_mcp.api.slug_index import SlugIndex
+from mealie_mcp.api.timeouts import (
+    TimeoutPolicy,
+    deadline_at,
+    remaining,
+    timeout_override,
+)
+from mealie_mcp.api.transport_stats import TransportStats
+
+logger = logging.getLogger("mealie_mcp.api")
+
+# Attempt outcomes that are not HTTP statuses.
+TIMED_OUT = 0
+UNREACHABLE = -1
+
+
+def _never_sent(error: requests.RequestException) -> bool:
+    """Whether ``error`` was raised before any byte of the request was sent.
+
+    requests wraps urllib3's failure (usually a ``MaxRetryError`` whose
+    ``reason`` is the underlying error) in ``args[0]``; a refused connection or
+    failed DNS lookup surfaces as ``NewConnectionError`` somewhere in that chain.
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    seen: set[int] = set()
+    pending: list[Any] = [error]
+    while pending:
+        current = pending.pop()
+        if current is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, NewConnectionError | ConnectTimeoutError):
+            return True
+        args = getattr(current, "args", ())
+        pending.extend(
+            [
+                args[0] if args else None,
+                getattr(current, "reason", None),
+                getattr(current, "__cause__", None),
+                getattr(current, "__context__", None),
+            ]
+        )
+    return False
+
+
+class _Attempt:
+    """One HTTP attempt as seen by the concurrency limiter and circuit breaker.
+
+    ``status`` is the HTTP status, :data:`TIMED_OUT`, :data:`UNREACHABLE`, or
+    ``None`` when the attempt was abandoned (cancelled) without an outcome.
+    """
+
+    __slots__ = ("method", "endpoint", "breaker", "probe", "started", "status")
+
+    def __init__(self, method: str, endpoint: str, breaker: CircuitBreaker | None):
+        self.method = method
+        self.endpoint = endpoint
+        self.breaker = breaker
+        self.probe = breaker.before() if breaker is not None else False
+        self.started: float | None = None
+        self.status: int | None = None
 
 
 class BaseApiClient:
+    _flight_group: type = SingleFlight
+
     def __init__(
         self,
         base_url: str | None,
         token: str | None = None,
         tls_profile: ResolvedTLSProfile | None = None,
         debug: bool = False,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        retry: RetryPolicy | None = None,
+        timeouts: TimeoutPolicy | None = None,
+        cache: HttpCache | None = None,
+        coalesce: bool = True,
+        limiter: ConcurrencyLimiter | None = None,
+        breakers: CircuitBreakers | None = None,
+        decoder: JsonDecoder | None = None,
+        prefetch_pages: int = 0,
+        download_dir: str | None = None,
+        catalog: CatalogCache | None = None,
+        slug_index: SlugIndex | None = None,
+        media_cache: MediaCache | None = None,
+        mirror: Any | None = None,
     ):
         self.base_url = base_url
         self.token = token
         self.debug = debug
+        self._configure_policies(
+            retry=retry,
+            timeouts=timeouts,
+            cache=cache,
+            coalesce=coalesce,
+            limiter=limiter,
+            breakers=breakers,
+            decoder=decoder,
+            prefetch_pages=prefetch_pages,
+            download_dir=download_dir,
+            catalog=catalog,
+            slug_index=slug_index,
+            media_cache=media_cache,
+            mirror=mirror,
+        )
         self.tls_profile = tls_profile or resolve_configured_tls_profile("mealie")
-        self._session = self.tls_profile.configure_requests_session(requests.Session())
+        # Size the keep-alive pool before the TLS profile configures the session so
+        # any adapter the profile mounts takes precedence over this default one.
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        self._session = self.tls_profile.configure_requests_session(session)
 
         if token:
             self._session.headers.update({"Authorization": f"Bearer {token}"})
 
+    def _configure_policies(
+        self,
+        retry: RetryPolicy | None = None,
+        timeouts: TimeoutPolicy | None = None,
+        cache: HttpCache | None = None,
+        coalesce: bool = True,
+        limiter: ConcurrencyLimiter | None = None,
+        breakers: CircuitBreakers | None = None,
+        decoder: JsonDecoder | None = None,
+        prefetch_pages: int = 0,
+        download_dir: str | None = None,
+        catalog: CatalogCache | None = None,
+        slug_index: SlugIndex | None = None,
+        media_cache: MediaCache | None = None,
+        mirror: Any | None = None,
+    ) -> None:
+        """Attach the resilience policies shared by the sync and async clients."""
+        self.retry = retry or RetryPolicy()
+        self._retry_budget = RetryBudget(self.retry.budget_ratio)
+        self.timeouts = timeouts or TimeoutPolicy()
+        self.cache = cache
+        self._flights = self._flight_group() if coalesce else None
+        self.limiter = limiter
+        self.breakers = breakers
+        self.decoder = decoder or JsonDecoder()
+        # Read by the ``iter_*`` pagination helpers.
+        self.prefetch_pages = prefetch_pages
+        self.download_dir = download_dir
+        self.catalog_cache = catalog
+        self.slug_index = slug_index if slug_index is not None else SlugIndex()
+        self.media_cache = media_cache
+        # A ``mealie_mcp.mirror.Mirror``; kept untyped so the api package does
+        # not import the server layer.
+        self.mirror = mirror
+
+    def _begin(self, method: str, endpoint: str) -> _Attempt:
+        """Start an attempt; raises ``CircuitOpenError`` when its group is open."""
+        breaker = (
+            self.breakers.for_request(method, endpoint)
+            if self.breakers is not None
+            else None
+        )
+        return _Attempt(method, endpoint, breaker)
+
+    def _settle(self, attempt: _Attempt) -> None:
+        """Report a finished attempt to the concurrency limiter and breaker."""
+        status = attempt.status
+        if attempt.breaker is not None:
+            ok = None if status is None else 0 < status < 500
+            attempt.breaker.record(ok, attempt.probe)
+        if attempt.started is None:
+            return
+        overloaded = status is not None and (
+            status in (TIMED_OUT, 429) or status >= 500
+        )
+        latency = None
+        if (
+            status is not None
+            and status > 0
+            and self.timeouts.classify(attempt.method, attempt.endpoint) == "fast"
+        ):
+            latency = time.monotonic() - attempt.started
+        self.limiter.release(attempt.started, latency, overloaded)
+
+    def _coalesced(self, method: str, data: Any, files: Any) -> bool:
+        return (
+            self._flights is not None
+            and data is None
+            and not files
+            and method.upper() in COALESCED_METHODS
+        )
+
+    def _flight(
+        self, method: str, endpoint: str, params: dict | None, timeout: float | None
+    ) -> tuple[Hashable, float | None]:
+        """Flight key and caller deadline of a coalesced read.
+
+        Callers only share a request that runs at their own priority and
+        timeout, and never one that gives up before their own deadline.
+        """
+        conditions = (
+            request_priority(endpoint),
+            timeout if timeout is not None else timeout_override(),
+        )
+        key = flight_key(method, endpoint, params, current_item_fields(), conditions)
+        return key, deadline_at()
+
+    def _cache_lookup(
+        self, method: str, endpoint: str, params: dict | None
+    ) -> tuple[CacheKey | None, CacheEntry | None, dict[str, str] | None, int]:
+        """Cache key, entry, conditional headers and generation for a ``GET``."""
+        if self.cache is None or method.upper() != "GET":
+            return None, None, None, 0
+        generation = self.cache.generation
+        key = self.cache.key(endpoint, params, current_item_fields())
+        entry = self.cache.lookup(key)
+        return key, entry, entry.validators() if entry else None, generation
+
+    def _finish(
+        self,
+        response: Any,
+        key: CacheKey | None,
+        entry: CacheEntry | None,
+        generation: int = 0,
+    ) -> Any:
+        """Decode ``response``, answering a ``304`` from the validator cache."""
+        if key is None:
+            return self._handle_response(response)
+        if response.status_code == 304 and entry is not None:
+            return self.cache.revalidated(entry)
+        result = self._handle_response(response)
+        self.cache.store(key, response, result, generation)
+        return result
+
+    def _invalidate(self, method: str, endpoint: str) -> None:
+        """Drop cached responses, catalogs and mirrored records a write may have changed."""
+        if self.cache is not None:
+            self.cache.invalidate_for(method, endpoint)
+        if self.catalog_cache is not None:
+            self.catalog_cache.invalidate_for(method, endpoint)
+        if self.media_cache is not None:
+            self.media_cache.invalidate_for(method, endpoint, self.slug_index)
+        if self.mirror is not None:
+            self.mirror.invalidate_for(method, endpoint)
+
+    def _url(self, endpoint: str) -> str:
+        return urljoin(self.base_url or "", endpoint)
+
+    def _retry_delay(
+        self, attempt: int, replayable: bool, retry_after: str | None = None
+    ) -> float | None:
+        """Backoff before the next attempt, or ``None`` to give up."""
+        if not replayable:
+            return None
+        delay = self.retry.backoff(attempt, retry_after)
+        if delay is None:
+            return None
+        budget = remaining()
+        if budget is not None and delay >= budget:
+            return None
+        if not self._retry_budget.withdraw():
+            return None
+        return delay
+
     def request(
         self,
         method: str,
@@ -33,29 +311,638 @@ def request(
         params: dict | None = None,
         data: dict | None = None,
         files: dict | None = None,
+        retry_safe: bool | None = None,
+        timeout: float | None = None,
     ) -> Any:
-        url = urljoin(self.base_url or "", endpoint)
+        endpoint = self.slug_index.canonical(method, endpoint)
+        args = (method, endpoint, params, data, files, retry_safe, timeout)
+        if self._coalesced(method, data, files):
+            key, until = self._flight(method, endpoint, params, timeout)
+            result = self._flights.do(key, lambda: self._request(*args), until)
+        else:
+            try:
+                result = self._request(*args)
+            finally:
+                self._invalidate(method, endpoint)
+        self.slug_index.learn(method, endpoint, data, result)
+        return result
 
-        response = self._session.request(
-            method=method,
-            url=url,
-            params=params,
-            json=data,
-            files=files,
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None,
+        data: dict | None,
+        files: dict | None,
+        retry_safe: bool | None,
+        timeout: float | None,
+        binary: bool = False,
+        validators: dict[str, str] | None = None,
+    ) -> Any:
+        # Uploaded file handles are consumed by the first attempt, so requests
+        # carrying files are never replayed.
+        replayable = not files and self.retry.allows(method, endpoint, retry_safe)
+        key, entry, headers, generation = (
+            (None, None, validators, 0)
+            if binary
+            else self._cache_lookup(method, endpoint, params)
         )
+        if entry is not None and self.cache.fresh(entry):
+            return self.cache.served(entry)
+        self._retry_budget.deposit()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = self._send(
+                    method, endpoint, params, data, files, timeout, headers
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                # A failed connect never reached Mealie and is always safe to replay.
+                not_sent = _never_sent(e)
+                delay = self._retry_delay(attempt, replayable or not_sent)
+                if delay is None:
+                    raise
+                logger.debug(
+                    "Retrying %s %s: error_type=%s attempt=%d",
+                    method,
+                    endpoint,
+                    type(e).__name__,
+                    attempt,
+                )
+                time.sleep(delay)
+                continue
+            if response.status_code in self.retry.retry_statuses:
+                delay = self._retry_delay(
+                    attempt, replayable, response.headers.get("Retry-After")
+                )
+                if delay is not None:
+                    logger.debug(
+                        "Retrying %s %s: status_code=%s attempt=%d",
+                        method,
+                        endpoint,
+                        response.status_code,
+                        attempt,
+                    )
+                    response.close()
+                    time.sleep(delay)
+                    continue
+            if binary:
+                return response
+            return self._finish(response, key, entry, generation)
 
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None,
+        data: dict | None,
+        files: dict | None,
+        timeout: float | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> requests.Response:
+        request_timeout = self.timeouts.resolve(method, endpoint, timeout)
+        attempt = self._begin(method, endpoint)
+        try:
+            if self.limiter is not None:
+                attempt.started = self.limiter.acquire(request_priority(endpoint))
+            response = self._session.request(
+                method=method,
+                url=self._url(endpoint),
+                params=params,
+                json=data,
+                files=files,
+                headers=headers,
+                timeout=request_timeout,
+            )
+            attempt.status = response.status_code
+            return response
+        except requests.Timeout:
+            attempt.status = TIMED_OUT
+            raise
+        except requests.ConnectionError:
+            attempt.status = UNREACHABLE
+            raise
+        finally:
+            self._settle(attempt)
+
+    def request_bytes(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        timeout: float | None = None,
+    ) -> BinaryContent:
+        """Like :meth:`request`, but return the raw body and its content type.
+
+        Recipe media is served from and stored in :attr:`media_cache`.
+        """
+        endpoint = self.slug_index.canonical(method, endpoint)
+        key, entry = self._media_lookup(method, endpoint, params)
+        if entry is not None and self.media_cache.fresh(entry):
+            return self.media_cache.hit(entry)
+        validators = entry.validators() if entry is not None else None
+        response = self._request(
+            method, endpoint, params, None, None, None, timeout, True, validators
+        )
+        return self._binary_response(response, key, entry)
+
+    def download(
+        self,
+        method: str,
+        endpoint: str,
+        dest: str | os.PathLike,
+        params: dict | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Stream a binary response to ``dest`` with bounded memory.
+
+        Returns the path, size, SHA-256 and throughput instead of the body (see
+        :mod:`mealie_mcp.api.downloads`). Fresh recipe media is copied out of
+        :attr:`media_cache` without a request.
+        """
+        endpoint = self.slug_index.canonical(method, endpoint)
+        key, entry = self._media_lookup(method, endpoint, params)
+        if entry is not None and self.media_cache.fresh(entry):
+            target = resolve_target(dest, endpoint, {}, self.download_dir)
+            return self.media_cache.copy_to(entry, target)
+        request_timeout = self.timeouts.resolve(method, endpoint, timeout)
+        attempt = self._begin(method, endpoint)
+        sink = None
+        try:
+            if self.limiter is not None:
+                attempt.started = self.limiter.acquire(request_priority(endpoint))
+            with self._session.request(
+                method=method,
+                url=self._url(endpoint),
+                params=params,
+                stream=True,
+                timeout=request_timeout,
+            ) as response:
+                attempt.status = response.status_code
+                if response.status_code >= 400:
+                    raise MealieApiError(
+                        response.status_code, response.headers.get("Retry-After")
+                    )
+                sink = DownloadSink(
+                    resolve_target(dest, endpoint, response.headers, self.download_dir)
+                )
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    sink.write(chunk)
+                summary = sink.finish(response.headers.get("Content-Type"))
+                if key is not None:
+                    self.media_cache.put_file(
+                        key, Path(summary["path"]), summary["sha256"], response.headers
+                    )
+                return summary
+        except BaseException as e:
+            if sink is not None:
+                sink.abort()
+            if isinstance(e, requests.Timeout):
+                attempt.status = TIMED_OUT
+            elif isinstance(e, requests.ConnectionError):
+                attempt.status = UNREACHABLE
+            raise
+        finally:
+            self._settle(attempt)
+
+    def _media_lookup(
+        self, method: str, endpoint: str, params: dict | None
+    ) -> tuple[str | None, MediaEntry | None]:
+        """Media cache key and entry for a binary request (both ``None`` if off)."""
+        if self.media_cache is None:
+            return None, None
+        key = media_key(method, endpoint, params)
+        return key, self.media_cache.get(key) if key is not None else None
+
+    def _binary_response(
+        self,
+        response: Any,
+        key: str | None = None,
+        entry: MediaEntry | None = None,
+    ) -> BinaryContent:
+        if entry is not None and response.status_code == 304:
+            return self.media_cache.refreshed(entry)
+        if response.status_code >= 400:
+            raise MealieApiError(
+                response.status_code, response.headers.get("Retry-After")
+            )
+        if key is not None and response.status_code == 200:
+            return self.media_cache.put(key, response.content, response.headers)
+        return BinaryContent(response.content, response.headers.get("Content-Type"))
+
+    def _handle_response(self, response: Any) -> Any:
+        """Map a ``requests``/``httpx`` response onto the client's return contract.
+
+        JSON bodies are decoded by :attr:`decoder`, applying the ``items[*]``
+        projection of the current context (see :func:`item_fields`).
+        """
         if response.status_code >= 400:
-            raise Exception(f"API error: {response.status_code}")
+            raise MealieApiError(
+                response.status_code, response.headers.get("Retry-After")
+            )
 
         if response.status_code == 204:
             return {"status": "success"}
 
         try:
-            return response.json()
+            return self.decoder.decode(response.content, current_item_fields())
         except Exception:
             return {"status": "success", "text": response.text}
 
+    def client_stats(self) -> dict[str, Any]:
+        """Resilience, cache, coalescing, concurrency and circuit counters."""
+        stats: dict[str, Any] = {
+            "retry": self._retry_budget.snapshot(),
+            "json_backend": self.decoder.backend,
+        }
+        if self._flights is not None:
+            stats["single_flight"] = self._flights.snapshot()
+        if self.limiter is not None:
+            stats["concurrency"] = self.limiter.snapshot()
+        if self.breakers is not None:
+            stats["circuits"] = self.breakers.snapshot()
+        if self.cache is not None:
+            stats["http_cache"] = self.cache.snapshot()
+        if self.catalog_cache is not None:
+            stats["catalog"] = self.catalog_cache.snapshot()
+        stats["slug_index"] = self.slug_index.snapshot()
+        if self.media_cache is not None:
+            stats["media_cache"] = self.media_cache.snapshot()
+        return stats
+
     def close(self) -> None:
         """Release transport resources and runtime-only TLS material."""
         self._session.close()
         self.tls_profile.cleanup()
+
+
+def _httpx_verify(session: requests.Session) -> ssl.SSLContext | bool:
+    """Translate a TLS-profile-configured ``requests`` session into httpx trust."""
+    if session.verify is False:
+        return False
+    if isinstance(session.verify, str):
+        if os.path.isdir(session.verify):
+            context = ssl.create_default_context(capath=session.verify)
+        else:
+            context = ssl.create_default_context(cafile=session.verify)
+    else:
+        context = ssl.create_default_context()
+    if session.cert:
+        if isinstance(session.cert, str):
+            context.load_cert_chain(session.cert)
+        else:
+            context.load_cert_chain(*session.cert)
+    return context
+
+
+class AsyncBaseApiClient(BaseApiClient):
+    """Asyncio twin of :class:`BaseApiClient` backed by a shared ``httpx`` pool.
+
+    ``request`` is a coroutine, so every generated operation inherited from the
+    ``api_client_*`` mixins returns an awaitable instead of blocking a thread.
+    The underlying ``httpx.AsyncClient`` is bound to the event loop that first
+    uses it and is rebuilt transparently if the client is reused on a new loop.
+
+    With ``http2=True`` concurrent requests are multiplexed as streams over one
+    TLS connection (requires the ``h2`` package, the ``http2`` extra); servers
+    that do not negotiate HTTP/2 are transparently served over HTTP/1.1.
+
+    ``transport`` replaces the network transport of the ``httpx`` client, e.g.
+    with an ``httpx.MockTransport`` in tests.
+    """
+
+    _flight_group = AsyncSingleFlight
+
+    def __init__(
+        self,
+        base_url: str | None,
+        token: str | None = None,
+        tls_profile: ResolvedTLSProfile | None = None,
+        debug: bool = False,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        http2: bool = False,
+        retry: RetryPolicy | None = None,
+        timeouts: TimeoutPolicy | None = None,
+        cache: HttpCache | None = None,
+        coalesce: bool = True,
+        limiter: ConcurrencyLimiter | None = None,
+        breakers: CircuitBreakers | None = None,
+        decoder: JsonDecoder | None = None,
+        prefetch_pages: int = 0,
+        download_dir: str | None = None,
+        catalog: CatalogCache | None = None,
+        slug_index: SlugIndex | None = None,
+        media_cache: MediaCache | None = None,
+        mirror: Any | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.base_url = base_url
+        self.token = token
+        self.debug = debug
+        self._configure_policies(
+            retry=retry,
+            timeouts=timeouts,
+            cache=cache,
+            coalesce=coalesce,
+            limiter=limiter,
+            breakers=breakers,
+            decoder=decoder,
+            prefetch_pages=prefetch_pages,
+            download_dir=download_dir,
+            catalog=catalog,
+            slug_index=slug_index,
+            media_cache=media_cache,
+            mirror=mirror,
+        )
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but 'h2' is not installed; using HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+        self._stats = TransportStats()
+        self.tls_profile = tls_profile or resolve_configured_tls_profile("mealie")
+        probe = self.tls_profile.configure_requests_session(requests.Session())
+        self._verify = _httpx_verify(probe)
+        self._trust_env = probe.trust_env
+        probe.close()
+        self._limits = httpx.Limits(
+            max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize
+        )
+        self._headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            headers=self._headers,
+            verify=self._verify,
+            trust_env=self._trust_env,
+            limits=self._limits,
+            timeout=None,
+            http2=self.http2,
+            transport=self._transport,
+        )
+
+    def _async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = self._build_client()
+            self._loop = loop
+        return self._client
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        data: dict | None = None,
+        files: dict | None = None,
+        retry_safe: bool | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        endpoint = self.slug_index.canonical(method, endpoint)
+        args = (method, endpoint, params, data, files, retry_safe, timeout)
+        if self._coalesced(method, data, files):
+            key, until = self._flight(method, endpoint, params, timeout)
+            result = await self._flights.do(key, lambda: self._request(*args), until)
+        else:
+            try:
+                result = await self._request(*args)
+            finally:
+                self._invalidate(method, endpoint)
+        self.slug_index.learn(method, endpoint, data, result)
+        return result
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None,
+        data: dict | None,
+        files: dict | None,
+        retry_safe: bool | None,
+        timeout: float | None,
+        binary: bool = False,
+        validators: dict[str, str] | None = None,
+    ) -> Any:
+        replayable = not files and self.retry.allows(method, endpoint, retry_safe)
+        key, entry, headers, generation = (
+            (None, None, validators, 0)
+            if binary
+            else self._cache_lookup(method, endpoint, params)
+        )
+        if entry is not None and self.cache.fresh(entry):
+            return self.cache.served(entry)
+        self._retry_budget.deposit()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self._send(
+                    method, endpoint, params, data, files, timeout, headers
+                )
+            except httpx.TransportError as e:
+                not_sent = isinstance(
+                    e, httpx.ConnectError | httpx.ConnectTimeout | httpx.PoolTimeout
+                )
+                delay = self._retry_delay(attempt, replayable or not_sent)
+                if delay is None:
+                    raise
+                logger.debug(
+                    "Retrying %s %s: error_type=%s attempt=%d",
+                    method,
+                    endpoint,
+                    type(e).__name__,
+                    attempt,
+                )
+                await asyncio.sleep(delay)
+                continue
+            if response.status_code in self.retry.retry_statuses:
+                delay = self._retry_delay(
+                    attempt, replayable, response.headers.get("Retry-After")
+                )
+                if delay is not None:
+                    logger.debug(
+                        "Retrying %s %s: status_code=%s attempt=%d",
+                        method,
+                        endpoint,
+                        response.status_code,
+                        attempt,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+            if binary:
+                return response
+            return self._finish(response, key, entry, generation)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None,
+        data: dict | None,
+        files: dict | None,
+        timeout: float | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        connect, read = self.timeouts.resolve(method, endpoint, timeout)
+        attempt = self._begin(method, endpoint)
+        try:
+            if self.limiter is not None:
+                attempt.started = await self.limiter.acquire_async(
+                    request_priority(endpoint)
+                )
+        except BaseException:
+            self._settle(attempt)
+            raise
+        self._stats.started()
+        try:
+            response = await self._async_client().request(
+                method=method,
+                url=self._url(endpoint),
+                params=params,
+                json=data,
+                files=files,
+                headers=headers,
+                timeout=httpx.Timeout(read, connect=connect),
+                extensions={"trace": self._stats.trace},
+            )
+            attempt.status = response.status_code
+            return response
+        except httpx.TimeoutException:
+            attempt.status = TIMED_OUT
+            raise
+        except httpx.TransportError:
+            attempt.status = UNREACHABLE
+            raise
+        finally:
+            self._stats.finished()
+            self._settle(attempt)
+
+    async def request_bytes(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict | None = None,
+        timeout: float | None = None,
+    ) -> BinaryContent:
+        """Like :meth:`request`, but return the raw body and its content type.
+
+        Media cache disk I/O runs in a worker thread.
+        """
+        endpoint = self.slug_index.canonical(method, endpoint)
+        key, entry = await asyncio.to_thread(
+            self._media_lookup, method, endpoint, params
+        )
+        if entry is not None and self.media_cache.fresh(entry):
+            return await asyncio.to_thread(self.media_cache.hit, entry)
+        validators = entry.validators() if entry is not None else None
+        response = await self._request(
+            method, endpoint, params, None, None, None, timeout, True, validators
+        )
+        if key is None:
+            return self._binary_response(response, key, entry)
+        return await asyncio.to_thread(self._binary_response, response, key, entry)
+
+    async def download(
+        self,
+        method: str,
+        endpoint: str,
+        dest: str | os.PathLike,
+        params: dict | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Stream a binary response to ``dest`` with bounded memory.
+
+        Chunks are written from a worker thread so disk I/O never stalls the
+        event loop, as is media cache I/O.
+        """
+        endpoint = self.slug_index.canonical(method, endpoint)
+        key, entry = await asyncio.to_thread(
+            self._media_lookup, method, endpoint, params
+        )
+        if entry is not None and self.media_cache.fresh(entry):
+            target = resolve_target(dest, endpoint, {}, self.download_dir)
+            return await asyncio.to_thread(self.media_cache.copy_to, entry, target)
+        connect, read = self.timeouts.resolve(method, endpoint, timeout)
+        attempt = self._begin(method, endpoint)
+        sink = None
+        try:
+            if self.limiter is not None:
+                attempt.started = await self.limiter.acquire_async(
+                    request_priority(endpoint)
+                )
+            self._stats.started()
+            try:
+                async with self._async_client().stream(
+                    method,
+                    self._url(endpoint),
+                    params=params,
+                    timeout=httpx.Timeout(read, connect=connect),
+                    extensions={"trace": self._stats.trace},
+                ) as response:
+                    attempt.status = response.status_code
+                    if response.status_code >= 400:
+                        raise MealieApiError(
+                            response.status_code, response.headers.get("Retry-After")
+                        )
+                    sink = DownloadSink(
+                        resolve_target(
+                            dest, endpoint, response.headers, self.download_dir
+                        )
+                    )
+                    async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                        await asyncio.to_thread(sink.write, chunk)
+                    summary = await asyncio.to_thread(
+                        sink.finish, response.headers.get("Content-Type")
+                    )
+                    if key is not None:
+                        await asyncio.to_thread(
+                            self.media_cache.put_file,
+                            key,
+                            Path(summary["path"]),
+                            summary["sha256"],
+                            response.headers,
+                        )
+                    return summary
+            finally:
+                self._stats.finished()
+        except BaseException as e:
+            if sink is not None:
+                sink.abort()
+            if isinstance(e, httpx.TimeoutException):
+                attempt.status = TIMED_OUT
+            elif isinstance(e, httpx.TransportError):
+                attempt.status = UNREACHABLE
+            raise
+        finally:
+            self._settle(attempt)
+
+    def client_stats(self) -> dict[str, Any]:
+        """Resilience and transport counters (see :class:`TransportStats`)."""
+        stats = super().client_stats()
+        stats.update(http2=self.http2, transport=self._stats.snapshot())
+        return stats
+
+    async def aclose(self) -> None:
+        """Close the connection pool on its owning event loop."""
+        client, self._client, self._loop = self._client, None, None
+        if client is not None:
+            await client.aclose()
+        self.tls_profile.cleanup()
+
+    def close(self) -> None:
+        """Best-effort synchronous close for shutdown hooks.
+
+        The pool can only be drained on its own loop; if that loop is already
+        closed its sockets are released by the runtime and only TLS material is
+        cleaned up here.
+        """
+        loop = self._loop
+        if loop is not None and not loop.is_closed() and not loop.is_running():
+            loop.run_until_complete(self.aclose())
+            return
+        self._client, self._loop = None, None
+        self.tls_profile.cleanup()
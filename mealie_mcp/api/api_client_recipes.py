@@ -331,10 +331,20 @@ def get_exported_data(self, accept_language: Any | None = None) -> Any:
         )
 
     def get_exported_data_token(
-        self, export_id: str, accept_language: Any | None = None
+        self,
+        export_id: str,
+        accept_language: Any | None = None,
+        dest: str | None = None,
     ) -> Any:
         """Get Exported Data Token"""
         params = None
+        if dest is not None:
+            return self.download(
+                "GET",
+                f"/api/recipes/bulk-actions/export/{export_id}/download",
+                dest,
+                params=params,
+            )
         return self.request(
             "GET",
             f"/api/recipes/bulk-actions/export/{export_id}/download",
@@ -359,9 +369,13 @@ def get_shared_recipe(self, token_id: str) -> Any:
             "GET", f"/api/recipes/shared/{token_id}", params=params, data=None
         )
 
-    def get_shared_recipe_as_zip(self, token_id: str) -> Any:
+    def get_shared_recipe_as_zip(self, token_id: str, dest: str | None = None) -> Any:
         """Get Shared Recipe As Zip"""
         params = None
+        if dest is not None:
+            return self.download(
+                "GET", f"/api/recipes/shared/{token_id}/zip", dest, params=params
+            )
         return self.request(
             "GET", f"/api/recipes/shared/{token_id}/zip", params=params, data=None
         )
@@ -644,11 +658,10 @@ def delete_units_item_id(
     def get_recipe_img(self, recipe_id: str, file_name: Any) -> Any:
         """Get Recipe Img"""
         params = None
-        return self.request(
+        return self.request_bytes(
             "GET",
             f"/api/media/recipes/{recipe_id}/images/{file_name}",
             params=params,
-            data=None,
         )
 
     def get_recipe_timeline_event_img(
@@ -656,28 +669,35 @@ def get_recipe_timeline_event_img(
     ) -> Any:
         """Get Recipe Timeline Event Img"""
         params = None
-        return self.request(
+        return self.request_bytes(
             "GET",
             f"/api/media/recipes/{recipe_id}/images/timeline/{timeline_event_id}/{file_name}",
             params=params,
-            data=None,
         )
 
-    def get_recipe_asset(self, recipe_id: str, file_name: str) -> Any:
+    def get_recipe_asset(
+        self, recipe_id: str, file_name: str, dest: str | None = None
+    ) -> Any:
         """Get Recipe Asset"""
         params = None
-        return self.request(
+        if dest is not None:
+            return self.download(
+                "GET",
+                f"/api/media/recipes/{recipe_id}/assets/{file_name}",
+                dest,
+                params=params,
+            )
+        return self.request_bytes(
             "GET",
             f"/api/media/recipes/{recipe_id}/assets/{file_name}",
             params=params,
-            data=None,
         )
 
     def get_user_image(self, user_id: str, file_name: str) -> Any:
         """Get User Image"""
         params = None
-        return self.request(
-            "GET", f"/api/media/users/{user_id}/{file_name}", params=params, data=None
+        return self.request_bytes(
+            "GET", f"/api/media/users/{user_id}/{file_name}", params=params
         )
 
     def get_validation_text(self) -> Any:
@@ -5,9 +5,11 @@
 
 
 class Api(BaseApiClient):
-    def download_file(self, token: Any | None = None) -> Any:
+    def download_file(self, token: Any | None = None, dest: str | None = None) -> Any:
         """Download File"""
         params: dict[str, Any] = {}
         if token is not None:
             params["token"] = token
+        if dest is not None:
+            return self.download("GET", "/api/utils/download", dest, params=params)
         return self.request("GET", "/api/utils/download", params=params, data=None)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""Concurrent batch detail fetches.
+
+Fetching full recipe bodies one ``get_recipes_slug`` call at a time costs an
+agent round trip per recipe. :meth:`BatchBase.get_recipes_batch` takes a list
+of slugs or ids, drops duplicates, fetches them concurrently (bounded by
+``concurrency`` and, underneath, the client's adaptive limiter) and returns::
+
+    {"recipes": {slug: recipe, ...},
+     "slugs": {requested key: slug, ...},
+     "errors": {requested key: {"error": ..., "status_code": ...}, ...},
+     "requested": 12, "unique": 10}
+
+Recipes are keyed by the slug Mealie returned, whether they were asked for by
+slug or id; ``slugs`` maps each requested key that was found to that slug. A
+failing item never fails the batch; it is reported under ``errors`` by the key
+it was requested with.
+"""
+
+import asyncio
+import contextvars
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from mealie_mcp.api.errors import CircuitOpenError, MealieApiError
+
+DEFAULT_CONCURRENCY = 8
+MAX_CONCURRENCY = 32
+
+
+def unique_keys(keys: Iterable[Any]) -> list[str]:
+    """Non-empty keys as strings, first occurrence order, duplicates dropped."""
+    return list(dict.fromkeys(str(k).strip() for k in keys if str(k).strip()))
+
+
+def item_error(error: Exception) -> dict[str, Any]:
+    """Per-item error record for a batch result."""
+    if isinstance(error, CircuitOpenError):
+        return error.to_dict()
+    if isinstance(error, MealieApiError):
+        return {"error": str(error), "status_code": error.status_code}
+    return {"error": type(error).__name__, "message": str(error)}
+
+
+def _bounded(concurrency: int | None) -> int:
+    if concurrency is None:
+        return DEFAULT_CONCURRENCY
+    return min(max(1, int(concurrency)), MAX_CONCURRENCY)
+
+
+def _collect(keys: list[str], requested: int, outcomes: list) -> dict[str, Any]:
+    recipes: dict[str, Any] = {}
+    slugs: dict[str, str] = {}
+    errors: dict[str, Any] = {}
+    for key, (ok, value) in zip(keys, outcomes, strict=True):
+        if ok:
+            slug = value.get("slug") if isinstance(value, dict) else None
+            slugs[key] = slug or key
+            recipes[slugs[key]] = value
+        else:
+            errors[key] = item_error(value)
+    return {
+        "recipes": recipes,
+        "slugs": slugs,
+        "errors": errors,
+        "requested": requested,
+        "unique": len(keys),
+    }
+
+
+class BatchBase:
+    """Batch companions of the generated detail operations."""
+
+    def get_recipes_batch(
+        self, slugs: list[str], concurrency: int | None = None
+    ) -> dict[str, Any]:
+        """Fetch many recipes by slug or id concurrently, keyed by slug."""
+        keys = unique_keys(slugs)
+
+        def fetch(key: str) -> tuple[bool, Any]:
+            try:
+                return True, self.get_recipes_slug(key)
+            except Exception as e:  # noqa: BLE001 — reported per item
+                return False, e
+
+        if not keys:
+            return _collect(keys, len(slugs), [])
+        with ThreadPoolExecutor(
+            max_workers=min(_bounded(concurrency), len(keys)),
+            thread_name_prefix="mealie-batch",
+        ) as executor:
+            # Carry deadline, priority and projection into the workers.
+            futures = [
+                executor.submit(contextvars.copy_context().run, fetch, key)
+                for key in keys
+            ]
+            outcomes = [future.result() for future in futures]
+        return _collect(keys, len(slugs), outcomes)
+
+
+class AsyncBatchBase(BatchBase):
+    """Async versions of the :class:`BatchBase` operations."""
+
+    async def get_recipes_batch(
+        self, slugs: list[str], concurrency: int | None = None
+    ) -> dict[str, Any]:
+        """Fetch many recipes by slug or id concurrently, keyed by slug."""
+        keys = unique_keys(slugs)
+        gate = asyncio.Semaphore(_bounded(concurrency))
+
+        async def fetch(key: str) -> tuple[bool, Any]:
+            async with gate:
+                try:
+                    return True, await self.get_recipes_slug(key)
+                except Exception as e:  # noqa: BLE001 — reported per item
+                    return False, e
+
+        outcomes = await asyncio.gather(*(fetch(key) for key in keys))
+        return _collect(keys, len(slugs), outcomes)
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+"""In-process catalog of Mealie's slow-changing lookup lists.
+
+Categories, tags, tools, foods, units and shopping labels change rarely but
+are resolved by name constantly. :meth:`CatalogBase.catalog` loads a whole
+list once (through the ``iter_*`` pagination helpers) and keeps it for
+``MEALIE_CATALOG_TTL`` seconds; :meth:`CatalogBase.catalog_lookup` then finds
+an entry by id, slug or case-insensitive name without a request.
+
+The cache is shared by every client of one connection identity (base URL,
+token and TLS profile), and any mutating
+request (``POST``/``PUT``/``PATCH``/``DELETE``) that may change a catalog's list
+endpoint according to :mod:`mealie_mcp.api.dependencies` -- including merges,
+the group seeders and recipe writes that create organizers on the fly -- drops
+that catalog, so the next read reloads it.
+"""
+
+import threading
+import time
+from collections.abc import Hashable
+from typing import Any
+
+from mealie_mcp.api.dependencies import invalidated_reads, is_stale
+
+# Catalog -> (list operation, list endpoint).
+CATALOGS: dict[str, tuple[str, str]] = {
+    "categories": ("get_organizers_categories", "/api/organizers/categories"),
+    "tags": ("get_organizers_tags", "/api/organizers/tags"),
+    "tools": ("get_organizers_tools", "/api/organizers/tools"),
+    "foods": ("get_foods", "/api/foods"),
+    "units": ("get_units", "/api/units"),
+    "labels": ("get_groups_labels", "/api/groups/labels"),
+}
+
+# Catalogs are small; large pages keep a full load to a few requests.
+LOAD_PER_PAGE = 500
+
+
+class CatalogEntry:
+    """One loaded catalog with its id/slug/name indexes."""
+
+    __slots__ = ("items", "loaded", "_index")
+
+    def __init__(self, items: list):
+        self.items = items
+        self.loaded = time.monotonic()
+        self._index: dict[str, Any] = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            for key in ("id", "slug"):
+                if item.get(key) is not None:
+                    self._index.setdefault(str(item[key]), item)
+            if isinstance(item.get("name"), str):
+                self._index.setdefault(item["name"].casefold(), item)
+
+    def find(self, key: str) -> Any | None:
+        key = str(key).strip()
+        return self._index.get(key) or self._index.get(key.casefold())
+
+
+class CatalogCache:
+    """TTL store of :class:`CatalogEntry` objects with write invalidation."""
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: dict[str, CatalogEntry] = {}
+        # Bumped on invalidation so a load that raced a write is not stored.
+        self._generation: dict[str, int] = dict.fromkeys(CATALOGS, 0)
+        self.hits = 0
+        self.loads = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_settings(cls) -> "CatalogCache | None":
+        from agent_utilities.core.config import setting
+
+        if not setting("MEALIE_CATALOG_CACHE", True):
+            return None
+        return cls(ttl=float(setting("MEALIE_CATALOG_TTL", 300.0)))
+
+    def get(self, kind: str) -> tuple[CatalogEntry | None, int]:
+        """The fresh entry for ``kind`` (or ``None``) and the load generation."""
+        with self._lock:
+            entry = self._entries.get(kind)
+            if entry is not None and time.monotonic() - entry.loaded < self.ttl:
+                self.hits += 1
+                return entry, self._generation[kind]
+            return None, self._generation[kind]
+
+    def put(self, kind: str, items: list, generation: int) -> CatalogEntry:
+        entry = CatalogEntry(items)
+        with self._lock:
+            self.loads += 1
+            if self._generation[kind] == generation:
+                self._entries[kind] = entry
+        return entry
+
+    def invalidate(self, kind: str | None = None) -> None:
+        with self._lock:
+            for name in [kind] if kind else list(CATALOGS):
+                self._generation[name] += 1
+                if self._entries.pop(name, None) is not None:
+                    self.invalidations += 1
+
+    def invalidate_for(self, method: str, endpoint: str) -> None:
+        """Drop the catalogs a ``method`` request to ``endpoint`` may change."""
+        patterns = invalidated_reads(method, endpoint)
+        for kind, (_, list_endpoint) in CATALOGS.items():
+            if is_stale(patterns, list_endpoint):
+                self.invalidate(kind)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "cached": sorted(self._entries),
+                "hits": self.hits,
+                "loads": self.loads,
+                "invalidations": self.invalidations,
+            }
+
+
+_catalogs: dict[Hashable, CatalogCache] = {}
+_catalogs_lock = threading.Lock()
+
+
+def shared_catalog(identity: Hashable) -> CatalogCache | None:
+    """The :class:`CatalogCache` shared by the clients of one connection identity.
+
+    Foods, units, labels and organizers are group-scoped in Mealie, so a
+    catalog is never shared across tokens.
+    """
+    with _catalogs_lock:
+        if identity not in _catalogs:
+            catalog = CatalogCache.from_settings()
+            if catalog is None:
+                return None
+            _catalogs[identity] = catalog
+        return _catalogs[identity]
+
+
+def _operation(kind: str) -> str:
+    if kind not in CATALOGS:
+        raise ValueError(
+            f"Unknown catalog {kind!r}; expected one of {sorted(CATALOGS)}"
+        )
+    return CATALOGS[kind][0]
+
+
+class CatalogBase:
+    """Cached full-list lookups over the generated list operations."""
+
+    catalog_cache: CatalogCache | None = None
+
+    def catalog(self, kind: str) -> list:
+        """Every entry of catalog ``kind`` (e.g. ``"foods"``), from cache if fresh."""
+        return self._catalog_entry(kind).items
+
+    def catalog_lookup(self, kind: str, key: str) -> Any | None:
+        """Catalog entry whose id, slug or (case-insensitive) name is ``key``."""
+        return self._catalog_entry(kind).find(key)
+
+    def _catalog_entry(self, kind: str) -> CatalogEntry:
+        operation = _operation(kind)
+        cache = self.catalog_cache
+        entry, generation = cache.get(kind) if cache else (None, 0)
+        if entry is None:
+            items = list(self.iter_items(operation, per_page=LOAD_PER_PAGE))
+            entry = cache.put(kind, items, generation) if cache else CatalogEntry(items)
+        return entry
+
+
+class AsyncCatalogBase(CatalogBase):
+    """Async versions of the :class:`CatalogBase` lookups."""
+
+    async def catalog(self, kind: str) -> list:
+        """Every entry of catalog ``kind`` (e.g. ``"foods"``), from cache if fresh."""
+        return (await self._catalog_entry(kind)).items
+
+    async def catalog_lookup(self, kind: str, key: str) -> Any | None:
+        """Catalog entry whose id, slug or (case-insensitive) name is ``key``."""
+        return (await self._catalog_entry(kind)).find(key)
+
+    async def _catalog_entry(self, kind: str) -> CatalogEntry:
+        operation = _operation(kind)
+        cache = self.catalog_cache
+        entry, generation = cache.get(kind) if cache else (None, 0)
+        if entry is None:
+            items = [
+                item
+                async for item in self.iter_items(operation, per_page=LOAD_PER_PAGE)
+            ]
+            entry = cache.put(kind, items, generation) if cache else CatalogEntry(items)
+        return entry
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+"""Circuit breakers per Mealie endpoint group.
+
+Endpoints are grouped by the path prefixes of the generated ``api_client_*``
+modules (``recipes``, ``foods``, ``admin``, ...). The endpoints that depend on
+outside services get their own groups, so an outage there does not trip the
+plain CRUD endpoints:
+
+- ``scraper``: URL / HTML scrapes and image-URL scrapes;
+- ``openai``: image-to-recipe and the OpenAI debug endpoint;
+- ``parser``: ingredient parsing.
+
+After ``failure_threshold`` consecutive failures (``5xx``, timeouts, connection
+errors) a group's circuit opens and its requests fail immediately with
+:class:`~mealie_mcp.api.errors.CircuitOpenError`. Once ``reset_timeout`` has
+passed the circuit half-opens and lets ``half_open_probes`` requests through:
+a success closes it, a failure opens it again.
+"""
+
+import re
+import threading
+import time
+from typing import Any
+
+from mealie_mcp.api.errors import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_GROUPS = (
+    ("openai", re.compile(r"^/api/(recipes/create/image|admin/debug/openai)$"), None),
+    (
+        "scraper",
+        re.compile(
+            r"^/api/recipes/(create/(url|url/bulk|html-or-json)|test-scrape-url)$"
+        ),
+        None,
+    ),
+    ("scraper", re.compile(r"^/api/recipes/[^/]+/image$"), "POST"),
+    ("parser", re.compile(r"^/api/parser/"), None),
+)
+
+
+def endpoint_group(method: str, endpoint: str) -> str:
+    """Breaker group of a request, e.g. ``"scraper"`` or ``"foods"``."""
+    path = endpoint.split("?", 1)[0]
+    for name, pattern, only_method in _GROUPS:
+        if pattern.match(path) and only_method in (None, method.upper()):
+            return name
+    parts = path.strip("/").split("/")
+    return parts[1] if len(parts) > 1 and parts[0] == "api" else parts[0]
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        group: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_probes: int = 1,
+    ):
+        self.group = group
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.state = CLOSED
+        self.failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def before(self) -> bool:
+        """Admit a request or raise :class:`CircuitOpenError`.
+
+        Returns ``True`` when the request is a half-open probe.
+        """
+        with self._lock:
+            if self.state == OPEN:
+                wait = self._opened_at + self.reset_timeout - time.monotonic()
+                if wait > 0:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.group, wait)
+                self.state = HALF_OPEN
+                self._probes = 0
+            if self.state == HALF_OPEN:
+                if self._probes >= self.half_open_probes:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.group, self.reset_timeout)
+                self._probes += 1
+                return True
+            return False
+
+    def record(self, ok: bool | None, probe: bool = False) -> None:
+        """Record an attempt's outcome; ``None`` means it was abandoned."""
+        with self._lock:
+            if probe:
+                self._probes = max(0, self._probes - 1)
+            if ok is None:
+                return
+            if ok:
+                self.failures = 0
+                if self.state == HALF_OPEN and probe:
+                    self.state = CLOSED
+                return
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.opened += 1
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+
+
+class CircuitBreakers:
+    """The breakers of one Mealie server, created per group on first use."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_probes: int = 1,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> "CircuitBreakers | None":
+        from agent_utilities.core.config import setting
+
+        if not setting("MEALIE_CIRCUIT_BREAKER", True):
+            return None
+        return cls(
+            failure_threshold=setting("MEALIE_CIRCUIT_FAILURES", 5),
+            reset_timeout=setting("MEALIE_CIRCUIT_RESET", 30.0),
+        )
+
+    def for_request(self, method: str, endpoint: str) -> CircuitBreaker:
+        group = endpoint_group(method, endpoint)
+        with self._lock:
+            breaker = self._breakers.get(group)
+            if breaker is None:
+                breaker = self._breakers[group] = CircuitBreaker(
+                    group,
+                    self.failure_threshold,
+                    self.reset_timeout,
+                    self.half_open_probes,
+                )
+            return breaker
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {g: b.snapshot() for g, b in sorted(self._breakers.items())}
+
+
+_SHARED: dict[str, CircuitBreakers | None] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_breakers(base_url: str) -> CircuitBreakers | None:
+    """The process-wide breakers for ``base_url``, built from settings on first use."""
+    key = (base_url or "").rstrip("/")
+    with _SHARED_LOCK:
+        if key not in _SHARED:
+            _SHARED[key] = CircuitBreakers.from_settings()
+        return _SHARED[key]
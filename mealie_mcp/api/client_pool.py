@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""Process-wide registry of long-lived Mealie API clients.
+
+Building an ``Api`` per tool call opens a fresh ``requests.Session`` (and with it a
+new connection pool and TLS profile) on every invocation and never closes it. The
+registry hands out one keep-alive client per connection identity instead, and
+closes every client it created on shutdown.
+"""
+
+import hashlib
+import logging
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+logger = logging.getLogger("mealie_mcp.api.client_pool")
+
+
+def client_key(
+    base_url: str | None, token: str | None, tls_key: Hashable = None
+) -> tuple[str, str, Hashable]:
+    """Build the registry key for a connection identity.
+
+    The token is reduced to a digest so the key can be logged or inspected
+    without exposing the credential.
+    """
+    token_digest = hashlib.sha256((token or "").encode("utf-8")).hexdigest()[:16]
+    return ((base_url or "").rstrip("/"), token_digest, tls_key)
+
+
+class ClientRegistry:
+    """Thread-safe cache of clients keyed by ``(base_url, token, TLS profile)``."""
+
+    def __init__(self) -> None:
+        self._clients: dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the client for ``key``, building it with ``factory()`` once.
+
+        ``factory`` only runs on a miss, so TLS profile resolution and session
+        setup happen once per identity rather than once per call.
+        """
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = factory()
+                self._clients[key] = client
+            return client
+
+    def close_all(self) -> None:
+        """Close and forget every client; safe to call more than once."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception as e:  # noqa: BLE001 — shutdown must not raise
+                logger.debug("Client close failed: error_type=%s", type(e).__name__)
+
+    def __len__(self) -> int:
+        return len(self._clients)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+"""Which cached reads a Mealie write can change.
+
+Caches in front of :meth:`BaseApiClient.request` ask :func:`invalidated_reads`
+which ``GET`` endpoints a finished ``POST``/``PUT``/``PATCH``/``DELETE`` may
+have made stale. A write always invalidates its own resource tree -- the
+written path, everything below it and each ancestor collection, so
+``PUT /api/foods/{item_id}`` drops that food and the ``/api/foods`` list pages.
+Effects that cross resources are declared in :data:`DEPENDENCIES`, keyed by the
+path templates of the generated ``api_client_*`` modules: renaming a food
+changes the recipes and shopping items that embed it, a bulk tag action changes
+every tagged recipe and the tag lists, and so on.
+
+Read patterns use the templates' ``{name}`` placeholders; a placeholder the
+write path also binds is filled in, any other matches one path segment, as does
+``*``. A trailing ``**`` matches the path and everything below it. The
+``POST`` endpoints in :data:`NO_EFFECT` compute rather than store and
+invalidate nothing.
+"""
+
+from dataclasses import dataclass
+
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Every recipe read: lists, details and per-recipe sub-resources.
+_RECIPES = ("/api/recipes/**", "/api/explore/groups/*/recipes/**")
+
+# Write template prefix -> reads it affects beyond its own resource tree.
+DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    # Recipe writes can create tags, categories and tools on the fly, change
+    # cookbook contents and remove favorites, ratings and comments.
+    "/api/recipes": (
+        "/api/recipes",
+        "/api/recipes/*",
+        "/api/organizers/**",
+        "/api/explore/groups/*/recipes/**",
+        "/api/explore/groups/*/organizers/**",
+        "/api/explore/groups/*/cookbooks/**",
+        "/api/households/cookbooks/**",
+        "/api/households/self/recipes/**",
+        "/api/households/statistics",
+        "/api/users/self/favorites",
+        "/api/users/self/ratings/**",
+        "/api/users/*/favorites",
+        "/api/users/*/ratings",
+    ),
+    # Bulk actions name their recipes in the body, so any recipe may change.
+    "/api/recipes/bulk-actions": _RECIPES,
+    "/api/recipes/{slug}/last-made": ("/api/recipes/timeline/events/**",),
+    "/api/comments": ("/api/recipes/*/comments",),
+    "/api/organizers": (
+        *_RECIPES,
+        "/api/organizers/*",
+        "/api/organizers/*/empty",
+        "/api/organizers/*/slug/*",
+        "/api/explore/groups/*/organizers/**",
+        "/api/households/cookbooks/**",
+        "/api/explore/groups/*/cookbooks/**",
+    ),
+    "/api/foods": (
+        *_RECIPES,
+        "/api/households/shopping/**",
+        "/api/explore/groups/*/foods/**",
+    ),
+    "/api/foods/merge": ("/api/foods/*",),
+    "/api/units": (*_RECIPES, "/api/households/shopping/**"),
+    "/api/units/merge": ("/api/units/*",),
+    "/api/groups/labels": ("/api/foods/**", "/api/households/shopping/**"),
+    "/api/groups/seeders/foods": ("/api/foods/**",),
+    "/api/groups/seeders/units": ("/api/units/**",),
+    "/api/groups/seeders/labels": ("/api/groups/labels/**",),
+    "/api/groups/migrations": (
+        *_RECIPES,
+        "/api/organizers/**",
+        "/api/foods/**",
+        "/api/units/**",
+    ),
+    "/api/groups/preferences": ("/api/groups/self", "/api/explore/**"),
+    "/api/households/shopping/items": ("/api/households/shopping/lists/**",),
+    "/api/households/shopping/lists": ("/api/households/shopping/items/**",),
+    "/api/households/mealplans": ("/api/households/mealplans/today",),
+    "/api/households/cookbooks": ("/api/explore/groups/*/cookbooks/**",),
+    "/api/households/preferences": ("/api/households/self",),
+    "/api/households/permissions": (
+        "/api/households/members",
+        "/api/groups/members/**",
+        "/api/users/self",
+    ),
+    "/api/users": (
+        "/api/users/self/**",
+        "/api/groups/members/**",
+        "/api/households/members",
+        "/api/admin/users/**",
+    ),
+    "/api/users/{id}/ratings": ("/api/recipes", "/api/recipes/*"),
+    "/api/admin/users": (
+        "/api/users/**",
+        "/api/groups/members/**",
+        "/api/households/members",
+    ),
+    "/api/admin/groups": ("/api/groups/**",),
+    "/api/admin/households": ("/api/groups/households/**", "/api/households/self"),
+    "/api/admin/backups/{file_name}/restore": ("/api/**",),
+    "/api/shared/recipes": ("/api/recipes/shared/**",),
+}
+
+# Write template prefixes that store nothing.
+NO_EFFECT: tuple[str, ...] = (
+    "/api/auth",
+    "/api/parser",
+    "/api/recipes/test-scrape-url",
+    "/api/admin/email",
+    "/api/admin/debug",
+    "/api/users/forgot-password",
+    "/api/households/events/notifications/{item_id}/test",
+    "/api/households/webhooks/{item_id}/test",
+    "/api/households/webhooks/rerun",
+    "/api/households/recipe-actions/{item_id}/trigger",
+)
+
+
+def _segments(path: str) -> tuple[str, ...]:
+    return tuple(s for s in path.split("?", 1)[0].split("/") if s)
+
+
+def _placeholder(segment: str) -> bool:
+    return segment.startswith("{") and segment.endswith("}")
+
+
+def _bind(template: tuple[str, ...], path: tuple[str, ...]) -> dict[str, str] | None:
+    """Placeholder values when ``template`` is a prefix of ``path``, else ``None``."""
+    if len(path) < len(template):
+        return None
+    bindings = {}
+    for expected, actual in zip(template, path, strict=False):
+        if _placeholder(expected):
+            bindings[expected] = actual
+        elif expected != actual:
+            return None
+    return bindings
+
+
+@dataclass(frozen=True, slots=True)
+class ReadPattern:
+    """``GET`` endpoints one write invalidates (``None`` segments match any)."""
+
+    segments: tuple[str | None, ...]
+    subtree: bool = False
+
+    def matches(self, endpoint: str) -> bool:
+        path = _segments(endpoint)
+        if len(path) < len(self.segments) or (
+            not self.subtree and len(path) != len(self.segments)
+        ):
+            return False
+        return all(
+            expected is None or expected == actual
+            for expected, actual in zip(self.segments, path, strict=False)
+        )
+
+
+def _pattern(read: str, bindings: dict[str, str]) -> ReadPattern:
+    segments = list(_segments(read))
+    subtree = bool(segments) and segments[-1] == "**"
+    if subtree:
+        segments.pop()
+    return ReadPattern(
+        tuple(
+            None if s == "*" else bindings.get(s) if _placeholder(s) else s
+            for s in segments
+        ),
+        subtree,
+    )
+
+
+_DEPENDENCIES = [
+    (_segments(template), reads) for template, reads in DEPENDENCIES.items()
+]
+_NO_EFFECT = [_segments(template) for template in NO_EFFECT]
+
+
+def invalidated_reads(method: str, endpoint: str) -> list[ReadPattern]:
+    """Read patterns a ``method`` request to ``endpoint`` may have made stale."""
+    if method.upper() in _READ_METHODS:
+        return []
+    path = _segments(endpoint)
+    if any(_bind(template, path) is not None for template in _NO_EFFECT):
+        return []
+    # The written resource and everything below it, then each ancestor
+    # collection (but not ``/api`` itself).
+    patterns = [ReadPattern(path, subtree=True)]
+    patterns += [ReadPattern(path[:end]) for end in range(2, len(path))]
+    for template, reads in _DEPENDENCIES:
+        bindings = _bind(template, path)
+        if bindings is not None:
+            patterns += [_pattern(read, bindings) for read in reads]
+    return patterns
+
+
+def is_stale(patterns: list[ReadPattern], endpoint: str) -> bool:
+    """Whether a cached read of ``endpoint`` is matched by any of ``patterns``."""
+    return any(pattern.matches(endpoint) for pattern in patterns)
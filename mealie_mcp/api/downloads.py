@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+"""Binary responses: images in memory, large files streamed to disk.
+
+Media endpoints (recipe and timeline images, user avatars) go through
+:meth:`~mealie_mcp.api.api_client_base.BaseApiClient.request_bytes`, which
+shares the retry, timeout, limiter and circuit handling of ``request()`` but
+returns a :class:`BinaryContent` instead of decoding the body as JSON.
+
+Backups, exports, shared zips and recipe assets can be hundreds of megabytes.
+Instead of buffering the body (and attempting to decode it as JSON or text),
+:meth:`~mealie_mcp.api.api_client_base.BaseApiClient.download` streams it in
+chunks to a temporary file next to the target, hashing as it goes, and renames
+it into place once complete. The caller gets a summary, not the payload::
+
+    {"path": ..., "size": ..., "sha256": ..., "content_type": ...,
+     "seconds": ..., "bytes_per_second": ...}
+
+When the client has a ``download_dir``, relative targets are resolved inside
+it and targets outside it are refused.
+"""
+
+import base64
+import hashlib
+import os
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+CHUNK_SIZE = 1024 * 1024
+
+_FILENAME = re.compile(r"""filename\*?=(?:UTF-8'')?["']?([^"';]+)""", re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
+class BinaryContent:
+    """Raw response body plus its media metadata.
+
+    ``path`` is set when the body is also a file on disk (a media cache blob)
+    that can be memory-mapped or sent with ``sendfile`` instead of copied.
+    """
+
+    content: bytes
+    content_type: str | None = None
+    path: str | None = None
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-safe form for tool results (body as base64)."""
+        result = {
+            "content_type": self.content_type,
+            "size": self.size,
+            "data": base64.b64encode(self.content).decode("ascii"),
+        }
+        if self.path is not None:
+            result["path"] = self.path
+        return result
+
+
+def resolve_target(
+    dest: str | os.PathLike,
+    endpoint: str,
+    headers: Any,
+    download_dir: str | os.PathLike | None = None,
+) -> Path:
+    """File path for a download; a directory ``dest`` gets the server's filename."""
+    target = Path(dest).expanduser()
+    if download_dir is not None:
+        root = Path(download_dir).expanduser().resolve()
+        target = (root / target).resolve()
+        if not target.is_relative_to(root):
+            raise ValueError(f"Download target must be inside {root}")
+    if target.is_dir() or str(dest).endswith(("/", os.sep)):
+        match = _FILENAME.search(headers.get("Content-Disposition", ""))
+        name = match.group(1) if match else endpoint.split("?", 1)[0].rsplit("/", 1)[-1]
+        target = target / (Path(name).name or "download")
+    return target
+
+
+class DownloadSink:
+    """Temporary file plus running digest for one download."""
+
+    def __init__(self, target: Path):
+        self.target = target
+        target.parent.mkdir(parents=True, exist_ok=True)
+        self._part = target.with_name(f".{target.name}.part")
+        self._file = open(self._part, "wb")  # noqa: SIM115 - closed in finish/abort
+        self._digest = hashlib.sha256()
+        self._started = time.monotonic()
+        self.size = 0
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+        self._digest.update(chunk)
+        self.size += len(chunk)
+
+    def finish(self, content_type: str | None = None) -> dict[str, Any]:
+        self._file.close()
+        os.replace(self._part, self.target)
+        seconds = time.monotonic() - self._started
+        return {
+            "path": str(self.target),
+            "size": self.size,
+            "sha256": self._digest.hexdigest(),
+            "content_type": content_type,
+            "seconds": round(seconds, 3),
+            "bytes_per_second": round(self.size / seconds) if seconds > 0 else None,
+        }
+
+    def abort(self) -> None:
+        self._file.close()
+        self._part.unlink(missing_ok=True)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+"""Exceptions raised by the Mealie API clients."""
+
+
+class MealieApiError(Exception):
+    """Mealie answered with an error status.
+
+    The message keeps the historical ``"API error: <status>"`` form so existing
+    callers matching on it keep working.
+    """
+
+    def __init__(self, status_code: int, retry_after: str | None = None):
+        super().__init__(f"API error: {status_code}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(TimeoutError):
+    """The caller's deadline ran out before the request could be (re)sent."""
+
+
+class CircuitOpenError(MealieApiError):
+    """The endpoint group's circuit breaker is open; the request was not sent."""
+
+    def __init__(self, group: str, retry_after: float):
+        super().__init__(503, str(max(1, round(retry_after))))
+        self.group = group
+        self.args = (
+            f"API error: 503 (circuit open for '{group}' endpoints, "
+            f"retry after {self.retry_after}s)",
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "error": "circuit_open",
+            "group": self.group,
+            "status_code": self.status_code,
+            "retry_after": int(self.retry_after),
+            "message": str(self),
+        }
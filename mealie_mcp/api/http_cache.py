@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+"""Client-side HTTP validator cache for Mealie ``GET`` requests.
+
+Responses that carry an ``ETag`` or ``Last-Modified`` validator are kept, already
+decoded, in a bounded LRU. The next identical ``GET`` is sent with
+``If-None-Match`` / ``If-Modified-Since``; a ``304 Not Modified`` is answered from
+the cache without transferring or decoding the body again.
+
+With a freshness window (``MEALIE_HTTP_CACHE_TTL`` > 0) an entry younger than
+the window is answered without any request, validator or not. Writes made
+through the client drop every entry :mod:`mealie_mcp.api.dependencies` says
+they may have changed, so a read after a write never sees the old body; edits
+made outside this process are picked up once the window lapses.
+
+Cached values are shared between callers and must be treated as read-only.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+from mealie_mcp.api.dependencies import invalidated_reads, is_stale
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...], tuple[str, ...] | None]
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    size: int
+    etag: str | None = None
+    last_modified: str | None = None
+    stored: float = field(default_factory=time.monotonic)
+
+    def validators(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """Bounded LRU of decoded ``GET`` responses keyed by endpoint and params."""
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl: float = 0.0,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # Bumped by every invalidation so a read that raced a write is not stored.
+        self.generation = 0
+        self.hits = 0
+        self.fresh_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_settings(cls) -> "HttpCache | None":
+        from agent_utilities.core.config import setting
+
+        if not setting("MEALIE_HTTP_CACHE", True):
+            return None
+        return cls(
+            max_entries=setting("MEALIE_HTTP_CACHE_ENTRIES", 512),
+            max_bytes=setting("MEALIE_HTTP_CACHE_MAX_BYTES", 32 * 1024 * 1024),
+            ttl=float(setting("MEALIE_HTTP_CACHE_TTL", 0.0)),
+        )
+
+    @staticmethod
+    def key(
+        endpoint: str,
+        params: dict | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> CacheKey:
+        """Cache key; ``fields`` is the item projection the body was decoded with."""
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        return endpoint, tuple(items), fields
+
+    def lookup(self, key: CacheKey) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def fresh(self, entry: CacheEntry) -> bool:
+        """Whether ``entry`` may be answered without asking Mealie."""
+        return self.ttl > 0 and time.monotonic() - entry.stored < self.ttl
+
+    def served(self, entry: CacheEntry) -> Any:
+        """Record a fresh hit answered from ``entry`` and return its value."""
+        with self._lock:
+            self.fresh_hits += 1
+        return entry.value
+
+    def revalidated(self, entry: CacheEntry) -> Any:
+        """Record a ``304`` served from ``entry`` and return its value."""
+        with self._lock:
+            self.hits += 1
+        return entry.value
+
+    def store(
+        self,
+        key: CacheKey,
+        response: Any,
+        value: Any,
+        generation: int | None = None,
+    ) -> None:
+        """Keep ``value`` when ``response`` is a ``200`` worth caching.
+
+        That is one carrying a validator or, with a freshness window, any ``200``.
+        Pass the :attr:`generation` read before sending the request: if a write
+        invalidated anything since, the body may predate it and is not kept.
+        """
+        with self._lock:
+            self.misses += 1
+        if response.status_code != 200:
+            return
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified and self.ttl <= 0:
+            return
+        size = len(response.content)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = CacheEntry(value, size, etag, last_modified)
+            self._bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self.evictions += 1
+
+    def invalidate_for(self, method: str, endpoint: str) -> None:
+        """Drop the entries a ``method`` request to ``endpoint`` may have changed."""
+        patterns = invalidated_reads(method, endpoint)
+        if not patterns:
+            return
+        with self._lock:
+            self.generation += 1
+            for key in [k for k in self._entries if is_stale(patterns, k[0])]:
+                self._bytes -= self._entries.pop(key).size
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def snapshot(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "fresh_hits": self.fresh_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+
+_SHARED: dict[Hashable, HttpCache | None] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_cache(identity: Hashable) -> HttpCache | None:
+    """The cache shared by the sync and async clients of one connection identity.
+
+    Sharing it means a write through either client invalidates both; it is never
+    shared across tokens, since responses depend on the caller.
+    """
+    with _SHARED_LOCK:
+        if identity not in _SHARED:
+            _SHARED[identity] = HttpCache.from_settings()
+        return _SHARED[identity]
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+"""Response decoding for the Mealie clients.
+
+Bodies are decoded with the fastest installed backend (``orjson``, then
+``msgspec``, then the standard library), selectable with ``MEALIE_JSON_BACKEND``.
+
+Callers that only need a few fields of each listed item can scope a projection
+with :func:`item_fields`. Paginated responses (``{"items": [...], "page": ...}``)
+are then decoded keeping only those item fields; with ``msgspec`` installed
+the other fields are skipped by the parser instead of being materialised and
+discarded. Other response shapes are decoded in full.
+
+:func:`select_fields` applies dotted-path sparse fieldsets to any decoded
+response after the fact; the MCP layer uses it for the ``fields`` call option
+and, on list actions, also scopes :func:`item_fields` to the item fields those
+paths need (see :func:`page_item_fields`) so pages are decoded projected.
+"""
+
+import importlib.util
+import json
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from functools import lru_cache
+from typing import Any
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+# Pagination envelope keys kept alongside ``items`` by projected decodes.
+PAGE_KEYS = ("page", "per_page", "total", "total_pages", "next", "previous")
+
+_FIELDS: ContextVar[tuple[str, ...] | None] = ContextVar(
+    "mealie_item_fields", default=None
+)
+
+
+def set_item_fields(fields: Iterable[str] | None) -> Token:
+    """Project ``items[*]`` of responses decoded in the current context."""
+    return _FIELDS.set(tuple(sorted(set(fields))) if fields else None)
+
+
+@contextmanager
+def item_fields(fields: Iterable[str] | None) -> Iterator[None]:
+    """Scope an ``items[*]`` field projection over a block of requests."""
+    token = set_item_fields(fields)
+    try:
+        yield
+    finally:
+        _FIELDS.reset(token)
+
+
+def current_item_fields() -> tuple[str, ...] | None:
+    return _FIELDS.get()
+
+
+def project_items(payload: Any, fields: Iterable[str]) -> Any:
+    """Keep only ``fields`` of each ``items[*]`` object of a decoded page."""
+    if not isinstance(payload, dict) or not isinstance(payload.get("items"), list):
+        return payload
+    keep = set(fields)
+    projected = dict(payload)
+    projected["items"] = [
+        {k: v for k, v in item.items() if k in keep} if isinstance(item, dict) else item
+        for item in payload["items"]
+    ]
+    return projected
+
+
+def _field_tree(paths: Iterable[str]) -> dict[str, dict]:
+    tree: dict[str, dict] = {}
+    for path in paths:
+        node = tree
+        for part in path.replace("[*]", "").split("."):
+            if part:
+                node = node.setdefault(part, {})
+    return tree
+
+
+def _merge(tree: dict[str, dict], other: dict[str, dict]) -> None:
+    for key, sub in other.items():
+        if key not in tree:
+            tree[key] = sub
+        elif tree[key] and sub:
+            _merge(tree[key], sub)
+        else:
+            tree[key] = {}  # one side keeps the whole value
+
+
+def _select(value: Any, tree: dict[str, dict]) -> Any:
+    if not tree:
+        return value
+    if isinstance(value, list):
+        return [_select(v, tree) for v in value]
+    if not isinstance(value, dict):
+        return value
+    wildcard = tree.get("*")
+    selected = {}
+    for key, child in value.items():
+        sub = tree.get(key, wildcard)
+        if sub is not None:
+            selected[key] = _select(child, sub)
+    return selected
+
+
+def select_fields(payload: Any, paths: Iterable[str]) -> Any:
+    """Keep only the dotted ``paths`` of a decoded response.
+
+    Lists are traversed element-wise (``items[*].slug`` and ``items.slug`` are
+    equivalent) and ``*`` matches any key. On a page, paths that do not name
+    a top-level key apply to each item, and the pagination envelope is kept.
+    """
+    tree = _field_tree(paths)
+    if not tree or not isinstance(payload, dict):
+        return _select(payload, tree)
+    if isinstance(payload.get("items"), list):
+        relative = {k: v for k, v in tree.items() if k not in payload}
+        tree = {k: v for k, v in tree.items() if k in payload}
+        _merge(tree, {k: {} for k in PAGE_KEYS if k in payload})
+        if relative:
+            _merge(tree, {"items": relative})
+    return _select(payload, tree)
+
+
+def page_item_fields(paths: Iterable[str]) -> tuple[str, ...] | None:
+    """Top-level item fields that :func:`select_fields` may keep on a page.
+
+    ``None`` when the paths can keep whole items (``items`` or ``*``), so
+    decoding must not project them.
+    """
+    names = set()
+    for path in paths:
+        parts = [p for p in path.replace("[*]", "").split(".") if p]
+        if parts[:1] == ["items"]:
+            parts = parts[1:]
+        elif parts[:1] and parts[0] in PAGE_KEYS:
+            continue
+        if not parts or parts[0] == "*":
+            return None
+        names.add(parts[0])
+    return tuple(sorted(names)) or None
+
+
+def _available(backend: str) -> bool:
+    return backend == "json" or importlib.util.find_spec(backend) is not None
+
+
+def _loader(backend: str) -> Callable[[bytes], Any]:
+    if backend == "orjson":
+        import orjson
+
+        return orjson.loads
+    if backend == "msgspec":
+        import msgspec
+
+        def loads(content: bytes) -> Any:
+            try:
+                return msgspec.json.decode(content)
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+
+        return loads
+    return json.loads
+
+
+@lru_cache(maxsize=64)
+def _page_decoder(fields: tuple[str, ...]) -> Any:
+    """``msgspec`` decoder of a pagination envelope with projected items."""
+    import msgspec
+
+    item = msgspec.defstruct("Item", [(f, Any, msgspec.UNSET) for f in fields])
+    page = msgspec.defstruct(
+        "Page",
+        [("items", list[item])] + [(k, Any, msgspec.UNSET) for k in PAGE_KEYS],
+    )
+    return msgspec.json.Decoder(page)
+
+
+class JsonDecoder:
+    """Decode response bodies, optionally projecting paginated items."""
+
+    def __init__(self, backend: str = "auto"):
+        if backend == "auto":
+            backend = next(b for b in BACKENDS if _available(b))
+        elif backend not in BACKENDS:
+            raise ValueError(f"JSON backend must be 'auto' or one of {BACKENDS}")
+        elif not _available(backend):
+            raise ValueError(f"JSON backend '{backend}' is not installed")
+        self.backend = backend
+        self._loads = _loader(backend)
+        self._projecting = _available("msgspec")
+
+    @classmethod
+    def from_settings(cls) -> "JsonDecoder":
+        from agent_utilities.core.config import setting
+
+        return cls(setting("MEALIE_JSON_BACKEND", "auto"))
+
+    def decode(self, content: bytes, fields: Iterable[str] | None = None) -> Any:
+        """Decode ``content``; raises ``ValueError`` when it is not JSON."""
+        if fields and self._projecting:
+            import msgspec
+
+            try:
+                decoder = _page_decoder(tuple(fields))
+            except (TypeError, ValueError):
+                decoder = None
+            if decoder is not None:
+                try:
+                    return msgspec.to_builtins(decoder.decode(content))
+                except msgspec.ValidationError:
+                    pass
+                except msgspec.DecodeError as e:
+                    raise ValueError(str(e)) from e
+        payload = self._loads(content)
+        return project_items(payload, fields) if fields else payload
@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+"""Adaptive (AIMD) concurrency limiting for requests to one Mealie server.
+
+Mealie is often a small single-process deployment, so the number of requests
+in flight against a base URL is capped by a limit that adapts to how the server
+copes:
+
+- every completed request without distress raises the limit additively
+  (roughly +1 per limit's worth of completions);
+- a ``429``, a ``5xx``, a timeout, or a p95 latency of plain reads rising well
+  above the p95 baseline cuts it multiplicatively — once per congestion event,
+  ignoring requests that started before the previous cut.
+
+The baseline follows a better p95 at once and drifts towards a worse one as an
+exponentially weighted average, so a lasting latency shift (a larger library,
+a slower host) becomes the new normal instead of pinning the limit at its floor.
+
+Requests carry a priority (see :func:`priority`). A share of the limit is
+reserved for ``interactive`` calls, so ``bulk`` traffic (bulk actions, bulk
+scrapes, knowledge-graph ingestion) never occupies every slot, and queued
+interactive calls are admitted first.
+"""
+
+import asyncio
+import math
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+PRIORITIES = (INTERACTIVE, BULK)
+
+_BULK_ENDPOINTS = (
+    re.compile(r"^/api/recipes/bulk-actions/"),
+    re.compile(r"^/api/recipes/create/url/bulk$"),
+)
+
+_PRIORITY: ContextVar[str | None] = ContextVar("mealie_priority", default=None)
+
+# Latency samples kept, and how many new samples between p95 checks.
+_WINDOW = 100
+_CHECK_EVERY = 20
+# Weight of each p95 check in the baseline when latency has risen.
+_BASELINE_WEIGHT = 0.2
+
+
+def set_priority(level: str | None) -> Token:
+    """Set the priority of requests issued in the current context."""
+    if level is not None and level not in PRIORITIES:
+        raise ValueError(f"priority must be one of {PRIORITIES}")
+    return _PRIORITY.set(level)
+
+
+@contextmanager
+def priority(level: str | None) -> Iterator[None]:
+    """Scope a request priority (``"interactive"`` or ``"bulk"``) over a block."""
+    token = set_priority(level)
+    try:
+        yield
+    finally:
+        _PRIORITY.reset(token)
+
+
+def request_priority(endpoint: str) -> str:
+    """Priority of a request: the ambient one, else derived from the endpoint."""
+    level = _PRIORITY.get()
+    if level is not None:
+        return level
+    path = endpoint.split("?", 1)[0]
+    return BULK if any(p.match(path) for p in _BULK_ENDPOINTS) else INTERACTIVE
+
+
+class _Waiter:
+    __slots__ = ("wake", "admitted")
+
+    def __init__(self, wake):
+        self.wake = wake
+        self.admitted = False
+
+
+class ConcurrencyLimiter:
+    """AIMD in-flight limit shared by every client of one base URL.
+
+    Usable from threads (:meth:`acquire`) and event loops
+    (:meth:`acquire_async`) at the same time.
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 20,
+        reserve: float = 0.25,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.reserve = reserve
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.limit = float(min(max(initial, min_limit), max_limit))
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.throttled = 0
+        self.decreases = 0
+        self._lock = threading.Lock()
+        self._queues: dict[str, deque[_Waiter]] = {p: deque() for p in PRIORITIES}
+        self._latencies: deque[float] = deque(maxlen=_WINDOW)
+        self._since_check = 0
+        self._p95: float | None = None
+        self._baseline_p95: float | None = None
+        self._last_decrease = 0.0
+
+    @classmethod
+    def from_settings(cls) -> "ConcurrencyLimiter | None":
+        from agent_utilities.core.config import setting
+
+        if not setting("MEALIE_ADAPTIVE_CONCURRENCY", True):
+            return None
+        return cls(
+            initial=setting("MEALIE_CONCURRENCY_INITIAL", 8),
+            max_limit=setting("MEALIE_CONCURRENCY_MAX", 20),
+            reserve=setting("MEALIE_CONCURRENCY_RESERVE", 0.25),
+        )
+
+    def _capacity(self, level: str) -> int:
+        limit = max(self.min_limit, math.floor(self.limit))
+        if level == INTERACTIVE:
+            return limit
+        return max(1, limit - max(1, math.ceil(limit * self.reserve)))
+
+    def _can_admit(self, level: str) -> bool:
+        if self.in_flight >= self._capacity(level):
+            return False
+        if level == BULK:
+            return not self._queues[INTERACTIVE] and not self._queues[BULK]
+        return not self._queues[INTERACTIVE]
+
+    def _admit(self) -> None:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def _wake(self) -> None:
+        for level in PRIORITIES:
+            queue = self._queues[level]
+            while queue and self.in_flight < self._capacity(level):
+                waiter = queue.popleft()
+                waiter.admitted = True
+                self._admit()
+                waiter.wake()
+            if queue:
+                return
+
+    def acquire(self, level: str = INTERACTIVE) -> float:
+        """Block until a slot is free; returns the admission timestamp."""
+        with self._lock:
+            if self._can_admit(level):
+                self._admit()
+                return time.monotonic()
+            event = threading.Event()
+            self._queues[level].append(_Waiter(event.set))
+            self.throttled += 1
+        event.wait()
+        return time.monotonic()
+
+    async def acquire_async(self, level: str = INTERACTIVE) -> float:
+        """Await a free slot; returns the admission timestamp."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def wake():
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+        with self._lock:
+            if self._can_admit(level):
+                self._admit()
+                return time.monotonic()
+            waiter = _Waiter(wake)
+            self._queues[level].append(waiter)
+            self.throttled += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.admitted:
+                    self.in_flight -= 1
+                    self._wake()
+                else:
+                    self._queues[level].remove(waiter)
+            raise
+        return time.monotonic()
+
+    def release(
+        self, started: float, latency: float | None = None, overloaded: bool = False
+    ) -> None:
+        """Free a slot and feed the request's outcome back into the limit.
+
+        ``latency`` is only given for plain reads, whose duration reflects server
+        load rather than the work requested.
+        """
+        with self._lock:
+            # Only grow while the limit is actually being used.
+            busy = self.in_flight * 2 >= math.floor(self.limit)
+            self.in_flight -= 1
+            if overloaded or (latency is not None and self._slower(latency)):
+                self._decrease(started)
+            elif busy:
+                self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self._wake()
+
+    def _slower(self, latency: float) -> bool:
+        """Record a read latency; ``True`` when p95 rose past the tolerance."""
+        self._latencies.append(latency)
+        self._since_check += 1
+        if self._since_check < _CHECK_EVERY or len(self._latencies) < _CHECK_EVERY:
+            return False
+        self._since_check = 0
+        ordered = sorted(self._latencies)
+        self._p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        baseline = self._baseline_p95
+        if baseline is None or self._p95 < baseline:
+            self._baseline_p95 = self._p95
+            return False
+        self._baseline_p95 = baseline + _BASELINE_WEIGHT * (self._p95 - baseline)
+        return self._p95 > baseline * self.latency_tolerance
+
+    def _decrease(self, started: float) -> None:
+        if started < self._last_decrease:
+            return
+        self._last_decrease = time.monotonic()
+        self.limit = max(float(self.min_limit), self.limit * self.backoff)
+        self.decreases += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "limit": round(self.limit, 2),
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "queued": {p: len(q) for p, q in self._queues.items()},
+                "throttled": self.throttled,
+                "decreases": self.decreases,
+                "p95_seconds": self._p95,
+                "baseline_p95_seconds": self._baseline_p95,
+            }
+
+
+_SHARED: dict[str, ConcurrencyLimiter | None] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_limiter(base_url: str) -> ConcurrencyLimiter | None:
+    """The process-wide limiter for ``base_url``, built from settings on first use."""
+    key = (base_url or "").rstrip("/")
+    with _SHARED_LOCK:
+        if key not in _SHARED:
+            _SHARED[key] = ConcurrencyLimiter.from_settings()
+        return _SHARED[key]
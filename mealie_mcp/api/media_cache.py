@@ -0,0 +1,385 @@
+#!/usr/bin/env python
+"""Content-addressed on-disk cache for recipe media.
+
+Recipe images, timeline images and assets (``/api/media/recipes/...``) are
+immutable for long stretches but fetched again by every agent call and by the
+knowledge-graph image pipeline. :class:`MediaCache` keeps them on disk:
+
+- Bodies are stored once per SHA-256 digest under ``blobs/<ab>/<digest>``, so
+  the same image reached through two paths is stored once, and written to a
+  temporary name and renamed so a reader never sees a partial file.
+- A SQLite index maps each media path (recipe id + file name) to its digest,
+  content type and ``ETag``/``Last-Modified`` validator.
+- An entry younger than ``MEALIE_MEDIA_CACHE_TTL`` is served without touching
+  Mealie; an older one is revalidated with a conditional ``GET`` and a
+  ``304`` refreshes it.
+- Total blob bytes are capped at ``MEALIE_MEDIA_CACHE_MAX_BYTES``; the least
+  recently used entries are evicted first.
+- Replacing or deleting a recipe image, asset or timeline image through the
+  client drops the affected entries.
+
+The cache may live in a shared temporary directory, so its directories are
+created ``0700`` and its blobs and index ``0600`` regardless of the umask.
+
+Cached bodies are plain files, so callers can ``mmap`` them or hand them to
+``sendfile``: :class:`~mealie_mcp.api.downloads.BinaryContent` carries the
+blob ``path`` and asset downloads are copied out of the cache with
+:func:`shutil.copyfile`, which uses ``sendfile`` where the OS supports it.
+"""
+
+import hashlib
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from mealie_mcp.api.downloads import BinaryContent
+
+MEDIA_PREFIX = "/api/media/recipes/"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS media (
+    key TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    content_type TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    stored REAL NOT NULL,
+    used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS media_digest ON media (digest);
+CREATE INDEX IF NOT EXISTS media_used ON media (used);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class MediaEntry:
+    """One cached media path and the blob holding its body."""
+
+    key: str
+    path: Path
+    digest: str
+    size: int
+    content_type: str | None
+    etag: str | None
+    last_modified: str | None
+    stored: float
+
+    def validators(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def binary(self) -> BinaryContent:
+        return BinaryContent(self.path.read_bytes(), self.content_type, str(self.path))
+
+
+def media_key(method: str, endpoint: str, params: dict | None = None) -> str | None:
+    """Cache key for a cacheable media request, ``None`` for anything else."""
+    path = endpoint.split("?", 1)[0]
+    if method.upper() != "GET" or params or not path.startswith(MEDIA_PREFIX):
+        return None
+    return path
+
+
+def _private_dir(path: Path) -> None:
+    """Create ``path`` (and missing parents) readable by the owner only."""
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    os.chmod(path, 0o700)
+
+
+def _private_file(path: Path) -> int:
+    """Open ``path`` for writing, truncated and readable by the owner only."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.chmod(path, 0o600)
+    return fd
+
+
+def _segments(endpoint: str) -> list[str]:
+    return [s for s in endpoint.split("?", 1)[0].split("/") if s]
+
+
+class MediaCache:
+    """Disk blob store plus SQLite index with LRU eviction; thread-safe."""
+
+    def __init__(
+        self,
+        root: str | os.PathLike,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl: float = 86400.0,
+    ):
+        self.root = Path(root).expanduser()
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._blobs = self.root / "blobs"
+        _private_dir(self.root)
+        _private_dir(self._blobs)
+        self._lock = threading.Lock()
+        index = self.root / "index.db"
+        os.close(os.open(index, os.O_WRONLY | os.O_CREAT, 0o600))
+        os.chmod(index, 0o600)
+        self._db = sqlite3.connect(str(index), check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_settings(cls, namespace: str = "") -> "MediaCache | None":
+        from agent_utilities.core.config import setting
+
+        if not setting("MEALIE_MEDIA_CACHE", True):
+            return None
+        root = setting("MEALIE_MEDIA_CACHE_DIR", "") or os.path.join(
+            tempfile.gettempdir(), "mealie-mcp-media"
+        )
+        return cls(
+            root=os.path.join(root, namespace),
+            max_bytes=int(setting("MEALIE_MEDIA_CACHE_MAX_BYTES", 256 * 1024 * 1024)),
+            ttl=float(setting("MEALIE_MEDIA_CACHE_TTL", 86400.0)),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _blob(self, digest: str) -> Path:
+        return self._blobs / digest[:2] / digest
+
+    # -- reads -----------------------------------------------------------
+
+    def get(self, key: str) -> MediaEntry | None:
+        """The entry for ``key`` (marked as used), or ``None``."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT digest, size, content_type, etag, last_modified, stored "
+                "FROM media WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            entry = MediaEntry(key, self._blob(row[0]), *row)
+            if not entry.path.exists():
+                # Blob removed behind our back (tmp cleaner, manual rm).
+                self._db.execute("DELETE FROM media WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+            self._db.execute(
+                "UPDATE media SET used = ? WHERE key = ?", (time.time(), key)
+            )
+            self._db.commit()
+        return entry
+
+    def fresh(self, entry: MediaEntry) -> bool:
+        return time.time() - entry.stored < self.ttl
+
+    def hit(self, entry: MediaEntry) -> BinaryContent:
+        """Serve a fresh ``entry``."""
+        with self._lock:
+            self.hits += 1
+        return entry.binary()
+
+    def refreshed(self, entry: MediaEntry) -> BinaryContent:
+        """Serve ``entry`` after Mealie answered ``304 Not Modified``."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE media SET stored = ? WHERE key = ?", (time.time(), entry.key)
+            )
+            self._db.commit()
+            self.revalidated += 1
+        return entry.binary()
+
+    # -- writes ----------------------------------------------------------
+
+    def put(self, key: str, content: bytes, headers: Any) -> BinaryContent:
+        """Store a ``200`` body for ``key``; returns it backed by the blob."""
+        with self._lock:
+            self.misses += 1
+        if len(content) > self.max_bytes:
+            return BinaryContent(content, headers.get("Content-Type"))
+        digest = hashlib.sha256(content).hexdigest()
+        blob = self._blob(digest)
+        if not blob.exists():
+            _private_dir(blob.parent)
+            part = blob.with_name(f".{digest}.{threading.get_ident()}.part")
+            with os.fdopen(_private_file(part), "wb") as f:
+                f.write(content)
+            os.replace(part, blob)
+        self._index(key, digest, len(content), headers)
+        return BinaryContent(content, headers.get("Content-Type"), str(blob))
+
+    def put_file(self, key: str, source: Path, digest: str, headers: Any) -> None:
+        """Store a copy of the downloaded file ``source`` for ``key``."""
+        with self._lock:
+            self.misses += 1
+        size = source.stat().st_size
+        if size > self.max_bytes:
+            return
+        blob = self._blob(digest)
+        if not blob.exists():
+            # A copy, not a hard link: the caller may edit its file afterwards.
+            _private_dir(blob.parent)
+            part = blob.with_name(f".{digest}.{threading.get_ident()}.part")
+            os.close(_private_file(part))  # copyfile keeps an existing file's mode
+            shutil.copyfile(source, part)
+            os.replace(part, blob)
+        self._index(key, digest, size, headers)
+
+    def copy_to(self, entry: MediaEntry, target: Path) -> dict[str, Any]:
+        """Serve a fresh ``entry`` as a download to ``target``."""
+        started = time.monotonic()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        part = target.with_name(f".{target.name}.part")
+        shutil.copyfile(entry.path, part)
+        os.replace(part, target)
+        with self._lock:
+            self.hits += 1
+        seconds = time.monotonic() - started
+        return {
+            "path": str(target),
+            "size": entry.size,
+            "sha256": entry.digest,
+            "content_type": entry.content_type,
+            "seconds": round(seconds, 3),
+            "bytes_per_second": round(entry.size / seconds) if seconds > 0 else None,
+            "cached": True,
+        }
+
+    def _index(self, key: str, digest: str, size: int, headers: Any) -> None:
+        now = time.time()
+        with self._lock:
+            previous = self._db.execute(
+                "SELECT digest FROM media WHERE key = ?", (key,)
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO media VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    digest,
+                    size,
+                    headers.get("Content-Type"),
+                    headers.get("ETag"),
+                    headers.get("Last-Modified"),
+                    now,
+                    now,
+                ),
+            )
+            if previous is not None and previous[0] != digest:
+                self._release(previous[0])
+            self._evict()
+            self._db.commit()
+
+    def _release(self, digest: str) -> int:
+        """Delete the blob of ``digest`` unless still referenced; bytes freed."""
+        referenced = self._db.execute(
+            "SELECT 1 FROM media WHERE digest = ? LIMIT 1", (digest,)
+        ).fetchone()
+        if referenced:
+            return 0
+        blob = self._blob(digest)
+        try:
+            size = blob.stat().st_size
+            blob.unlink()
+        except FileNotFoundError:
+            return 0
+        return size
+
+    def _evict(self) -> None:
+        total = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM "
+            "(SELECT DISTINCT digest, size FROM media)"
+        ).fetchone()[0]
+        while total > self.max_bytes:
+            row = self._db.execute(
+                "SELECT key, digest FROM media ORDER BY used LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return
+            self._db.execute("DELETE FROM media WHERE key = ?", (row[0],))
+            total -= self._release(row[1])
+            self.evictions += 1
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT key, digest FROM media WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix),
+            ).fetchall()
+            for key, digest in rows:
+                self._db.execute("DELETE FROM media WHERE key = ?", (key,))
+                self._release(digest)
+            self._db.commit()
+
+    def invalidate_for(self, method: str, endpoint: str, slug_index: Any) -> None:
+        """Drop the media a ``method`` request to ``endpoint`` replaces or deletes."""
+        if method.upper() not in ("POST", "PUT", "PATCH", "DELETE"):
+            return
+        path = _segments(endpoint)
+        if path[:2] != ["api", "recipes"] or len(path) < 3:
+            if path[:3] == ["api", "admin", "backups"] and path[-1:] == ["restore"]:
+                self.invalidate_prefix(MEDIA_PREFIX)
+            return
+        if path[2] == "timeline" and len(path) >= 5:
+            # Timeline images live under the recipe id, which is not in the path.
+            with self._lock:
+                keys = self._db.execute(
+                    "SELECT key FROM media WHERE key LIKE ?",
+                    (f"%/images/timeline/{path[4]}/%",),
+                ).fetchall()
+            for (key,) in keys:
+                self.invalidate_prefix(key)
+            return
+        if path[2] == "bulk-actions" and path[3:4] == ["delete"]:
+            self.invalidate_prefix(MEDIA_PREFIX)
+            return
+        recipe_delete = len(path) == 3 and method.upper() == "DELETE"
+        if recipe_delete or path[3:4] in (["image"], ["assets"]):
+            known = slug_index.resolve(path[2]) if slug_index is not None else None
+            if known is None:
+                self.invalidate_prefix(MEDIA_PREFIX)
+            else:
+                self.invalidate_prefix(f"{MEDIA_PREFIX}{known['id']}/")
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            entries, blobs, size = self._db.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT digest), "
+                "(SELECT COALESCE(SUM(size), 0) FROM "
+                "(SELECT DISTINCT digest, size FROM media)) FROM media"
+            ).fetchone()
+        return {
+            "entries": entries,
+            "blobs": blobs,
+            "bytes": size,
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+_SHARED: dict[Any, MediaCache | None] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_media_cache(identity: Any) -> MediaCache | None:
+    """The media cache of one connection identity, built from settings.
+
+    Each identity gets its own directory under ``MEALIE_MEDIA_CACHE_DIR`` so
+    media one token may not see is never served to another.
+    """
+    with _SHARED_LOCK:
+        if identity not in _SHARED:
+            digest = hashlib.sha256(repr(identity).encode("utf-8")).hexdigest()
+            _SHARED[identity] = MediaCache.from_settings(namespace=digest[:16])
+        return _SHARED[identity]
@@ -0,0 +1,401 @@
+#!/usr/bin/env python
+"""Auto-paginating iterators over Mealie's paginated list endpoints.
+
+Every list operation that takes ``page``/``per_page`` has an ``iter_*``
+companion (``get_recipes`` -> ``iter_recipes``, ``get_admin_users`` ->
+``iter_admin_users``) that walks all pages and yields the items one by one,
+holding a single page in memory. On :class:`~mealie_mcp.api_client.AsyncApi`
+the companions are async generators.
+
+Pages are requested with a fixed ``pagination_seed`` so ``order_by="random"``
+listings keep one order across pages; iteration stops after ``total_pages``.
+
+Once the first page reports ``total_pages`` the remaining pages are
+independent, so up to ``prefetch`` of them are fetched concurrently while the
+consumer works on the current one; pages are still delivered in order.
+
+Offset paging is not a snapshot: while others edit, items shift between pages
+and show up twice or not at all. :meth:`PaginationBase.scan` walks a listing
+as a :class:`ConsistentScan` instead. It pins the order to the immutable ``id``
+(plus a fixed seed), drops items already seen, and reports the ids of items
+updated after the scan began so they can be re-fetched one by one::
+
+    scan = client.scan("get_recipes")
+    for recipe in scan:
+        ...
+    scan.report()  # {"items": 812, "duplicates": 1, "changed": ["..."], ...}
+
+``total_at_start``/``total_at_end`` of the report differ when items were
+created or deleted mid-scan; with ``id`` ordering those are the only shifts.
+A creation pushes later items forward, where de-duplication absorbs them, but
+a deletion pulls them back past the offset already read, so they are skipped
+without a trace. ``possibly_missed`` is set whenever that can have happened
+(the totals differ, or fewer items were seen than still exist); re-run the
+scan to pick up the skipped items.
+"""
+
+import asyncio
+import contextvars
+import uuid
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime
+from typing import Any
+
+DEFAULT_PER_PAGE = 50
+
+# Sort key of consistent scans: ids never change when a record is edited.
+CONSISTENT_ORDER = "id"
+
+_UPDATED_KEYS = ("updatedAt", "updateAt", "updated_at", "update_at", "dateUpdated")
+
+# Item fields a consistent scan reads to drop duplicates and spot changes.
+SCAN_FIELDS = (CONSISTENT_ORDER, *_UPDATED_KEYS)
+
+
+def page_items(page: Any) -> list:
+    """Items of one page (a non-paginated list response is a single page)."""
+    if isinstance(page, dict):
+        items = page.get("items")
+        return items if isinstance(items, list) else []
+    return page if isinstance(page, list) else []
+
+
+def is_last_page(page: Any, number: int) -> bool:
+    """``True`` when no page follows page ``number``."""
+    if not isinstance(page, dict) or not page_items(page):
+        return True
+    total_pages = page.get("total_pages")
+    if not isinstance(total_pages, int):
+        return True
+    return number >= total_pages
+
+
+def parse_timestamp(value: str) -> datetime:
+    """ISO date or datetime; naive values (Mealie's default) are taken as UTC."""
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def updated_at(record: Any) -> datetime | None:
+    """The record's update timestamp, if it carries a parseable one."""
+    if not isinstance(record, dict):
+        return None
+    for key in _UPDATED_KEYS:
+        value = record.get(key)
+        if isinstance(value, str):
+            try:
+                return parse_timestamp(value)
+            except ValueError:
+                return None
+    return None
+
+
+def _paging_args(kwargs: dict) -> dict:
+    """Keep one ``pagination_seed`` for all pages of a random-order listing."""
+    if kwargs.get("order_by") == "random" and kwargs.get("pagination_seed") is None:
+        kwargs = {**kwargs, "pagination_seed": uuid.uuid4().hex}
+    return kwargs
+
+
+def _items_of(operation: str) -> Callable[..., Any]:
+    def companion(self, **kwargs: Any) -> Any:
+        return self.iter_items(operation, **kwargs)
+
+    companion.__name__ = companion.__qualname__ = (
+        f"iter_{operation.removeprefix('get_')}"
+    )
+    companion.__doc__ = f"Iterate every item of :meth:`{operation}` across all pages."
+    return companion
+
+
+class ConsistentScan:
+    """One de-duplicated, change-reporting walk of a list operation.
+
+    ``cutoff`` (default: when the scan was created, UTC) separates items
+    updated before the scan from those changed during it.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        operation: str | Callable[..., Any],
+        /,
+        *,
+        order_by: str = CONSISTENT_ORDER,
+        cutoff: datetime | None = None,
+        **kwargs: Any,
+    ):
+        self._client = client
+        self._operation = operation
+        self._kwargs = {
+            "order_by": order_by,
+            "order_direction": "asc",
+            "pagination_seed": uuid.uuid4().hex,
+            **kwargs,
+        }
+        self.cutoff = cutoff or datetime.now(UTC)
+        self._seen: dict[Any, datetime | None] = {}
+        self._changed: dict[Any, None] = {}
+        self.duplicates = 0
+        self.total_at_start: int | None = None
+        self.total_at_end: int | None = None
+
+    def _admit(self, page: Any) -> Any:
+        """``page`` without the items an earlier page already delivered."""
+        if isinstance(page, dict) and isinstance(page.get("total"), int):
+            if self.total_at_start is None:
+                self.total_at_start = page["total"]
+            self.total_at_end = page["total"]
+        fresh = []
+        for item in page_items(page):
+            key = item.get("id") if isinstance(item, dict) else None
+            if key is None:
+                fresh.append(item)
+                continue
+            stamp = updated_at(item)
+            if key in self._seen:
+                self.duplicates += 1
+                if stamp != self._seen[key]:
+                    self._changed[key] = None
+                continue
+            self._seen[key] = stamp
+            if stamp is not None and stamp >= self.cutoff:
+                self._changed[key] = None
+            fresh.append(item)
+        return {**page, "items": fresh} if isinstance(page, dict) else fresh
+
+    def pages(self) -> Iterator[Any]:
+        for page in self._client.iter_pages(self._operation, **self._kwargs):
+            yield self._admit(page)
+
+    def __iter__(self) -> Iterator[Any]:
+        for page in self.pages():
+            yield from page_items(page)
+
+    @property
+    def possibly_missed(self) -> bool:
+        """Whether a mid-scan deletion may have shifted items past the scan."""
+        if self.total_at_start is None or self.total_at_end is None:
+            return False
+        return (
+            self.total_at_start != self.total_at_end
+            or len(self._seen) < self.total_at_end
+        )
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "items": len(self._seen),
+            "duplicates": self.duplicates,
+            "changed": list(self._changed),
+            "total_at_start": self.total_at_start,
+            "total_at_end": self.total_at_end,
+            "possibly_missed": self.possibly_missed,
+            "cutoff": self.cutoff.isoformat(),
+        }
+
+
+class AsyncConsistentScan(ConsistentScan):
+    """:class:`ConsistentScan` over an async client."""
+
+    async def pages(self) -> AsyncIterator[Any]:
+        async for page in self._client.iter_pages(self._operation, **self._kwargs):
+            yield self._admit(page)
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        async for page in self.pages():
+            for item in page_items(page):
+                yield item
+
+
+class PaginationBase:
+    """Page-walking helpers shared by the generated list operations."""
+
+    # Pages fetched ahead of the consumer; set from ``MEALIE_PREFETCH_PAGES``.
+    prefetch_pages: int = 0
+
+    def _prefetch_depth(self, prefetch: int | None) -> int:
+        return max(0, self.prefetch_pages if prefetch is None else prefetch)
+
+    def iter_pages(
+        self,
+        operation: str | Callable[..., Any],
+        /,
+        *,
+        per_page: int = DEFAULT_PER_PAGE,
+        start_page: int = 1,
+        prefetch: int | None = None,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Yield successive pages of ``operation`` (a method name or callable).
+
+        ``prefetch`` caps the pages fetched ahead in worker threads (default
+        :attr:`prefetch_pages`; ``0`` fetches one page at a time).
+        """
+        func = getattr(self, operation) if isinstance(operation, str) else operation
+        kwargs = _paging_args(kwargs)
+        depth = self._prefetch_depth(prefetch)
+        number = start_page
+        page = func(page=number, per_page=per_page, **kwargs)
+        yield page
+        if is_last_page(page, number):
+            return
+        if depth == 0:
+            while True:
+                number += 1
+                page = func(page=number, per_page=per_page, **kwargs)
+                yield page
+                if is_last_page(page, number):
+                    return
+        total_pages = page["total_pages"]
+        pending: deque[Future] = deque()
+        executor = ThreadPoolExecutor(
+            max_workers=depth, thread_name_prefix="mealie-prefetch"
+        )
+        try:
+            while pending or number < total_pages:
+                while number < total_pages and len(pending) < depth:
+                    number += 1
+                    # Carry deadline, priority and projection into the worker.
+                    context = contextvars.copy_context()
+                    pending.append(
+                        executor.submit(
+                            context.run, func, page=number, per_page=per_page, **kwargs
+                        )
+                    )
+                page = pending.popleft().result()
+                yield page
+                if not page_items(page):
+                    return
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_items(
+        self, operation: str | Callable[..., Any], /, **kwargs: Any
+    ) -> Iterator[Any]:
+        """Yield every item of ``operation`` across all pages."""
+        for page in self.iter_pages(operation, **kwargs):
+            yield from page_items(page)
+
+    def scan(
+        self, operation: str | Callable[..., Any], /, **kwargs: Any
+    ) -> ConsistentScan:
+        """Snapshot-consistent walk of ``operation`` (see :class:`ConsistentScan`)."""
+        return ConsistentScan(self, operation, **kwargs)
+
+    iter_admin_users = _items_of("get_admin_users")
+    iter_admin_households = _items_of("get_admin_households")
+    iter_admin_groups = _items_of("get_admin_groups")
+    iter_explore_groups_group_slug_foods = _items_of(
+        "get_explore_groups_group_slug_foods"
+    )
+    iter_explore_groups_group_slug_households = _items_of(
+        "get_explore_groups_group_slug_households"
+    )
+    iter_explore_groups_group_slug_organizers_categories = _items_of(
+        "get_explore_groups_group_slug_organizers_categories"
+    )
+    iter_explore_groups_group_slug_organizers_tags = _items_of(
+        "get_explore_groups_group_slug_organizers_tags"
+    )
+    iter_explore_groups_group_slug_organizers_tools = _items_of(
+        "get_explore_groups_group_slug_organizers_tools"
+    )
+    iter_explore_groups_group_slug_cookbooks = _items_of(
+        "get_explore_groups_group_slug_cookbooks"
+    )
+    iter_explore_groups_group_slug_recipes = _items_of(
+        "get_explore_groups_group_slug_recipes"
+    )
+    iter_all_households = _items_of("get_all_households")
+    iter_group_members = _items_of("get_group_members")
+    iter_groups_labels = _items_of("get_groups_labels")
+    iter_households_cookbooks = _items_of("get_households_cookbooks")
+    iter_households_events_notifications = _items_of(
+        "get_households_events_notifications"
+    )
+    iter_households_recipe_actions = _items_of("get_households_recipe_actions")
+    iter_household_members = _items_of("get_household_members")
+    iter_households_shopping_lists = _items_of("get_households_shopping_lists")
+    iter_households_shopping_items = _items_of("get_households_shopping_items")
+    iter_households_webhooks = _items_of("get_households_webhooks")
+    iter_households_mealplans_rules = _items_of("get_households_mealplans_rules")
+    iter_households_mealplans = _items_of("get_households_mealplans")
+    iter_organizers_categories = _items_of("get_organizers_categories")
+    iter_organizers_tags = _items_of("get_organizers_tags")
+    iter_organizers_tools = _items_of("get_organizers_tools")
+    iter_recipes = _items_of("get_recipes")
+    iter_recipes_timeline_events = _items_of("get_recipes_timeline_events")
+    iter_comments = _items_of("get_comments")
+    iter_foods = _items_of("get_foods")
+    iter_units = _items_of("get_units")
+
+
+class AsyncPaginationBase(PaginationBase):
+    """Async-generator versions of the :class:`PaginationBase` iterators."""
+
+    async def iter_pages(
+        self,
+        operation: str | Callable[..., Any],
+        /,
+        *,
+        per_page: int = DEFAULT_PER_PAGE,
+        start_page: int = 1,
+        prefetch: int | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Yield successive pages of ``operation`` (a method name or callable).
+
+        ``prefetch`` caps the pages fetched ahead as tasks (default
+        :attr:`prefetch_pages`; ``0`` fetches one page at a time).
+        """
+        func = getattr(self, operation) if isinstance(operation, str) else operation
+        kwargs = _paging_args(kwargs)
+        depth = self._prefetch_depth(prefetch)
+        number = start_page
+        page = await func(page=number, per_page=per_page, **kwargs)
+        yield page
+        if is_last_page(page, number):
+            return
+        if depth == 0:
+            while True:
+                number += 1
+                page = await func(page=number, per_page=per_page, **kwargs)
+                yield page
+                if is_last_page(page, number):
+                    return
+        total_pages = page["total_pages"]
+        pending: deque[asyncio.Task] = deque()
+        try:
+            while pending or number < total_pages:
+                while number < total_pages and len(pending) < depth:
+                    number += 1
+                    pending.append(
+                        asyncio.ensure_future(
+                            func(page=number, per_page=per_page, **kwargs)
+                        )
+                    )
+                page = await pending.popleft()
+                yield page
+                if not page_items(page):
+                    return
+        finally:
+            for task in pending:
+                if task.done() and not task.cancelled():
+                    task.exception()
+                task.cancel()
+
+    async def iter_items(
+        self, operation: str | Callable[..., Any], /, **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        """Yield every item of ``operation`` across all pages."""
+        async for page in self.iter_pages(operation, **kwargs):
+            for item in page_items(page):
+                yield item
+
+    def scan(
+        self, operation: str | Callable[..., Any], /, **kwargs: Any
+    ) -> AsyncConsistentScan:
+        """Snapshot-consistent walk of ``operation`` (see :class:`ConsistentScan`)."""
+        return AsyncConsistentScan(self, operation, **kwargs)
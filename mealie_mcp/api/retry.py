@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+"""Retry policy for transient Mealie failures.
+
+Retries use capped exponential backoff with full jitter, honour ``Retry-After``
+and draw from a shared :class:`RetryBudget` so a struggling backend is not hit
+with a retry storm. Only idempotent requests are retried by default: ``GET``,
+``HEAD``, ``OPTIONS``, ``PUT`` and ``DELETE``, plus the ``POST`` endpoints listed
+in :data:`SAFE_POST_ENDPOINTS` that compute without writing. Any other ``POST``
+(``post_recipes``, ``parse_recipe_url_bulk``, ...) is retried only inside a
+:func:`retry_safe` block or when the request passes ``retry_safe=True``.
+"""
+
+import random
+import re
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# POST endpoints that only parse or preview and never create server-side state.
+SAFE_POST_ENDPOINTS = (
+    re.compile(r"^/api/parser/ingredients?$"),
+    re.compile(r"^/api/recipes/test-scrape-url$"),
+)
+
+_RETRY_SAFE: ContextVar[bool] = ContextVar("mealie_retry_safe", default=False)
+
+
+@contextmanager
+def retry_safe() -> Iterator[None]:
+    """Mark every request issued in this block as safe to retry.
+
+    Use it around non-idempotent calls whose repetition is harmless to the
+    caller, e.g. a bulk import that de-duplicates by URL afterwards.
+    """
+    token = _RETRY_SAFE.set(True)
+    try:
+        yield
+    finally:
+        _RETRY_SAFE.reset(token)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryBudget:
+    """Token bucket limiting retries to a fraction of recent traffic.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so at
+    steady state at most ``ratio`` retries are issued per request. ``reserve``
+    tokens are available up front so low-traffic clients can still retry.
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: float = 10.0):
+        self.ratio = ratio
+        self.capacity = max(reserve, 100.0 * ratio)
+        self._balance = reserve
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.exhausted = 0
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._balance < 1.0:
+                self.exhausted += 1
+                return False
+            self._balance -= 1.0
+            self.retries += 1
+            return True
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "retries": self.retries,
+            "budget_exhausted": self.exhausted,
+            "budget_balance": round(self._balance, 2),
+        }
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    max_retry_after: float = 60.0
+    budget_ratio: float = 0.2
+    retry_statuses: frozenset[int] = field(default=RETRYABLE_STATUSES)
+
+    @classmethod
+    def from_settings(cls) -> "RetryPolicy":
+        from agent_utilities.core.config import setting
+
+        return cls(
+            max_attempts=setting("MEALIE_RETRY_MAX_ATTEMPTS", cls.max_attempts),
+            backoff_base=setting("MEALIE_RETRY_BACKOFF", cls.backoff_base),
+            backoff_max=setting("MEALIE_RETRY_BACKOFF_MAX", cls.backoff_max),
+            budget_ratio=setting("MEALIE_RETRY_BUDGET", cls.budget_ratio),
+        )
+
+    def allows(
+        self, method: str, endpoint: str, retry_safe: bool | None = None
+    ) -> bool:
+        """Whether a request may be replayed after a transient failure."""
+        if retry_safe is not None:
+            return retry_safe
+        method = method.upper()
+        if method in IDEMPOTENT_METHODS or _RETRY_SAFE.get():
+            return True
+        path = endpoint.split("?", 1)[0]
+        return method == "POST" and any(p.match(path) for p in SAFE_POST_ENDPOINTS)
+
+    def backoff(self, attempt: int, retry_after: str | None = None) -> float | None:
+        """Delay before retrying after failed ``attempt`` (1-based).
+
+        Returns ``None`` when attempts are exhausted or the server asked for a
+        longer pause than ``max_retry_after``.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        hinted = parse_retry_after(retry_after)
+        if hinted is not None:
+            return hinted if hinted <= self.max_retry_after else None
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""Single-flight coalescing of identical concurrent Mealie reads.
+
+While a ``GET`` is in flight, identical calls (same method, endpoint and params)
+on the same client wait for it instead of issuing their own request, and all of
+them receive the one decoded result (or exception). Clients are pooled per base
+URL and token, so a flight group never spans two auth identities.
+
+The waiters inherit the leader's request, so they must also accept its
+conditions: the key carries the priority and per-attempt timeout the request
+runs with, and a caller never joins a flight whose deadline (the leader's
+ambient :func:`~mealie_mcp.api.timeouts.deadline`) ends before its own; it
+starts its own flight instead, which later callers with the same or an earlier
+deadline join.
+
+Shared results must be treated as read-only.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+COALESCED_METHODS = frozenset({"GET", "HEAD"})
+
+
+def flight_key(
+    method: str,
+    endpoint: str,
+    params: dict | None,
+    fields: tuple[str, ...] | None = None,
+    conditions: Hashable = None,
+) -> Hashable:
+    """Identity of a request.
+
+    ``fields`` is the item projection it is decoded with and ``conditions``
+    whatever else shapes how it runs (priority, timeout).
+    """
+    items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+    return method.upper(), endpoint, tuple(items), fields, conditions
+
+
+def _covers(leader: float | None, own: float | None) -> bool:
+    """Whether a flight with deadline ``leader`` may serve a caller's ``own``."""
+    return leader is None or (own is not None and leader >= own)
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "deadline")
+
+    def __init__(self, deadline: float | None = None):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.deadline = deadline
+
+
+class SingleFlight:
+    """Thread-based flight group for the synchronous client."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.leaders = 0
+        self.collapsed = 0
+
+    def do(
+        self, key: Hashable, fn: Callable[[], Any], deadline: float | None = None
+    ) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None or not _covers(call.deadline, deadline)
+            if leader:
+                call = self._calls[key] = _Call(deadline)
+                self.leaders += 1
+            else:
+                self.collapsed += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+    def snapshot(self) -> dict[str, int]:
+        return {"leaders": self.leaders, "collapsed": self.collapsed}
+
+
+class AsyncSingleFlight:
+    """Task-based flight group for the asyncio client.
+
+    The upstream call runs in its own task and every caller awaits it through
+    :func:`asyncio.shield`, so cancelling one waiter (including the one that
+    started the call) does not cancel the request for the others.
+    """
+
+    def __init__(self):
+        self._tasks: dict[Hashable, tuple[asyncio.Task, float | None]] = {}
+        self.leaders = 0
+        self.collapsed = 0
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        deadline: float | None = None,
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        task, leader_deadline = self._tasks.get(key, (None, None))
+        if (
+            task is not None
+            and task.get_loop() is loop
+            and not task.done()
+            and _covers(leader_deadline, deadline)
+        ):
+            self.collapsed += 1
+        else:
+            task = loop.create_task(fn())
+            self._tasks[key] = (task, deadline)
+            self.leaders += 1
+            task.add_done_callback(lambda t: self._forget(key, t))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tasks.get(key, (None,))[0] is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception retrieved when every waiter has gone away.
+            task.exception()
+
+    def snapshot(self) -> dict[str, int]:
+        return {"leaders": self.leaders, "collapsed": self.collapsed}
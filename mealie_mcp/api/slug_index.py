@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+"""In-memory recipe slug <-> id index.
+
+Half of Mealie's recipe endpoints are keyed by slug (``/api/recipes/{slug}``,
+favorites, ratings) and the other half by id (the ``/api/media/recipes``
+images and assets, shopping-list recipe references, meal plan ``recipeId``).
+:class:`SlugIndex` learns both from every recipe the client receives -- list
+pages, details, suggestions, meal plan entries -- and keeps them current from
+write responses: a rename re-points the id at its new slug and a delete
+forgets it. Translating one into the other then costs no request.
+
+The client uses the index to rewrite paths transparently: a known id passed
+where a write endpoint expects a slug is replaced by its slug, and a known
+slug passed to an id-keyed endpoint by its id. Reads of
+``/api/recipes/{slug}`` already accept either and are left alone.
+:meth:`RecipeIndexBase.resolve_recipes` answers explicit lookups and falls
+back to Mealie for keys it has not seen.
+"""
+
+import contextlib
+import threading
+from collections.abc import Iterable
+from typing import Any
+
+from mealie_mcp.api.batch import unique_keys
+from mealie_mcp.api.errors import MealieApiError
+
+# Path templates with a recipe key segment: "=slug" or "=id" marks the segment
+# and what the endpoint expects there, "*" matches any segment. The flag says
+# whether the rewrite applies to writes only.
+_REWRITES: tuple[tuple[tuple[str, ...], bool], ...] = (
+    (("api", "recipes", "=slug"), True),
+    (("api", "users", "*", "favorites", "=slug"), False),
+    # ``self`` first: the wildcard below would otherwise claim it.
+    (("api", "users", "self", "ratings", "=id"), False),
+    (("api", "users", "*", "ratings", "=slug"), False),
+    (("api", "households", "self", "recipes", "=slug"), False),
+    (("api", "households", "recipe-actions", "*", "trigger", "=slug"), False),
+    (("api", "households", "shopping", "lists", "*", "recipe", "=id"), False),
+    (("api", "media", "recipes", "=id"), False),
+)
+
+# Responses that carry recipes (directly, as page items, or nested under
+# ``recipe``); anything else with an ``id`` and a ``slug`` is not a recipe.
+_RECIPE_SOURCES: tuple[tuple[str, ...], ...] = (
+    ("api", "recipes"),
+    ("api", "explore", "groups", "*", "recipes"),
+    ("api", "households", "self", "recipes"),
+    ("api", "households", "mealplans"),
+)
+
+_WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+LOAD_PER_PAGE = 500
+
+
+def _segments(endpoint: str) -> list[str]:
+    return [s for s in endpoint.split("?", 1)[0].split("/") if s]
+
+
+def _starts_with(path: list[str], template: tuple[str, ...]) -> bool:
+    return len(path) >= len(template) and all(
+        t == "*" or t.startswith("=") or t == p
+        for t, p in zip(template, path, strict=False)
+    )
+
+
+class SlugIndex:
+    """Bounded bidirectional map of recipe ids and slugs; thread-safe."""
+
+    def __init__(self, max_entries: int = 50000):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._ids: dict[str, str] = {}  # slug -> id
+        self._slugs: dict[str, str] = {}  # id -> slug
+        self.rewrites = 0
+
+    @classmethod
+    def from_settings(cls) -> "SlugIndex":
+        from agent_utilities.core.config import setting
+
+        return cls(max_entries=int(setting("MEALIE_SLUG_INDEX_ENTRIES", 50000)))
+
+    def add(self, recipe_id: str, slug: str) -> None:
+        with self._lock:
+            old_slug = self._slugs.pop(recipe_id, None)
+            if old_slug is not None and old_slug != slug:
+                self._ids.pop(old_slug, None)
+            old_id = self._ids.pop(slug, None)
+            if old_id is not None and old_id != recipe_id:
+                self._slugs.pop(old_id, None)
+            self._slugs[recipe_id] = slug
+            self._ids[slug] = recipe_id
+            while len(self._slugs) > self.max_entries:
+                oldest = next(iter(self._slugs))
+                self._ids.pop(self._slugs.pop(oldest), None)
+
+    def forget(self, key: str) -> None:
+        with self._lock:
+            recipe_id = key if key in self._slugs else self._ids.get(key)
+            if recipe_id is not None:
+                self._ids.pop(self._slugs.pop(recipe_id), None)
+
+    def resolve(self, key: str) -> dict[str, str] | None:
+        """``{"id", "slug"}`` for a known recipe id or slug, else ``None``."""
+        key = str(key).strip()
+        with self._lock:
+            if key in self._slugs:
+                return {"id": key, "slug": self._slugs[key]}
+            if key in self._ids:
+                return {"id": self._ids[key], "slug": key}
+        return None
+
+    def canonical(self, method: str, endpoint: str) -> str:
+        """``endpoint`` with a recipe key swapped for the kind it expects."""
+        path = _segments(endpoint)
+        for template, writes_only in _REWRITES:
+            if writes_only and method.upper() not in _WRITE_METHODS:
+                continue
+            if not _starts_with(path, template):
+                continue
+            position = len(template) - 1
+            known = self.resolve(path[position])
+            wanted = known[template[-1][1:]] if known else path[position]
+            if wanted == path[position]:
+                return endpoint
+            self.rewrites += 1
+            path[position] = wanted
+            query = endpoint.partition("?")[1:]
+            return "/" + "/".join(path) + "".join(query)
+        return endpoint
+
+    def learn(self, method: str, endpoint: str, data: Any, result: Any) -> None:
+        """Record the recipes in a response; drop deleted ones."""
+        path = _segments(endpoint)
+        recipe_path = len(path) == 3 and path[:2] == ["api", "recipes"]
+        if recipe_path and method.upper() == "DELETE":
+            self.forget(path[2])
+            return
+        if path[:4] == ["api", "recipes", "bulk-actions", "delete"]:
+            for key in (data or {}).get("recipes") or []:
+                self.forget(str(key))
+            return
+        if not any(_starts_with(path, source) for source in _RECIPE_SOURCES):
+            return
+        records = result if isinstance(result, list) else [result]
+        if isinstance(result, dict) and isinstance(result.get("items"), list):
+            records = result["items"]
+        for record in records:
+            if isinstance(record, dict):
+                self._admit(record)
+                self._admit(record.get("recipe"))
+
+    def _admit(self, record: Any) -> None:
+        if not isinstance(record, dict):
+            return
+        recipe_id, slug = record.get("id"), record.get("slug")
+        if recipe_id and isinstance(slug, str) and slug:
+            self.add(str(recipe_id), slug)
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._slugs), "rewrites": self.rewrites}
+
+
+_SHARED: dict[Any, SlugIndex] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_slug_index(identity: Any) -> SlugIndex:
+    """The index shared by the sync and async clients of one connection identity.
+
+    Slugs are unique per group only, so the index is never shared across tokens.
+    """
+    with _SHARED_LOCK:
+        if identity not in _SHARED:
+            _SHARED[identity] = SlugIndex.from_settings()
+        return _SHARED[identity]
+
+
+def _not_found(error: MealieApiError) -> bool:
+    return error.status_code in (404, 422)
+
+
+def _outcome(index: SlugIndex, keys: list[str]) -> dict[str, Any]:
+    resolved = {key: index.resolve(key) for key in keys}
+    return {
+        "resolved": {k: v for k, v in resolved.items() if v is not None},
+        "missing": [k for k, v in resolved.items() if v is None],
+    }
+
+
+class RecipeIndexBase:
+    """Slug/id resolution over the client's :class:`SlugIndex`."""
+
+    slug_index: SlugIndex
+
+    def resolve_recipes(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Map recipe slugs or ids to ``{"id", "slug"}``.
+
+        Unknown keys are looked up in Mealie: one detail fetch for a single
+        miss, otherwise one walk over the recipe list pages, which stops as
+        soon as every key is known.
+        """
+        keys = unique_keys(keys)
+        missing = _outcome(self.slug_index, keys)["missing"]
+        if len(missing) == 1:
+            try:
+                self.get_recipes_slug(missing[0])
+            except MealieApiError as e:
+                if not _not_found(e):
+                    raise
+        elif missing:
+            for _ in self.iter_pages("get_recipes", per_page=LOAD_PER_PAGE):
+                if not _outcome(self.slug_index, missing)["missing"]:
+                    break
+        return _outcome(self.slug_index, keys)
+
+
+class AsyncRecipeIndexBase(RecipeIndexBase):
+    """Async version of :meth:`RecipeIndexBase.resolve_recipes`."""
+
+    async def resolve_recipes(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Map recipe slugs or ids to ``{"id", "slug"}``.
+
+        Unknown keys are looked up in Mealie: one detail fetch for a single
+        miss, otherwise one walk over the recipe list pages, which stops as
+        soon as every key is known.
+        """
+        keys = unique_keys(keys)
+        missing = _outcome(self.slug_index, keys)["missing"]
+        if len(missing) == 1:
+            try:
+                await self.get_recipes_slug(missing[0])
+            except MealieApiError as e:
+                if not _not_found(e):
+                    raise
+        elif missing:
+            pages = self.iter_pages("get_recipes", per_page=LOAD_PER_PAGE)
+            async with contextlib.aclosing(pages):
+                async for _ in pages:
+                    if not _outcome(self.slug_index, missing)["missing"]:
+                        break
+        return _outcome(self.slug_index, keys)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+"""Endpoint-class timeouts and caller deadlines for Mealie requests.
+
+Every request gets a read timeout from its endpoint class:
+
+- ``fast``: plain reads (``GET``/``HEAD``);
+- ``write``: ordinary create/update/delete calls;
+- ``slow``: scrapes, AI/OpenAI image parsing, ingredient parsing, migrations,
+  seeders, bulk actions and maintenance jobs;
+- ``download``: backups, exports, zips, media and file downloads.
+
+A per-call override (``request(..., timeout=...)`` or :func:`request_timeout`)
+replaces the class value, and an ambient deadline (:func:`deadline`, typically set
+from the MCP request) caps it so an abandoned call releases its connection once
+the caller's budget is spent.
+"""
+
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+
+from mealie_mcp.api.errors import DeadlineExceeded
+
+_DOWNLOAD_ENDPOINTS = (
+    re.compile(r"^/api/media/"),
+    re.compile(r"^/api/utils/download$"),
+    re.compile(r"^/api/admin/backups(/|$)"),
+    re.compile(r"^/api/recipes/shared/[^/]+/zip$"),
+    re.compile(r"^/api/recipes/[^/]+/exports$"),
+    re.compile(r"^/api/recipes/bulk-actions/export"),
+)
+_SLOW_ENDPOINTS = (
+    re.compile(r"^/api/recipes/create/"),
+    re.compile(r"^/api/recipes/test-scrape-url$"),
+    re.compile(r"^/api/recipes/bulk-actions/"),
+    re.compile(r"^/api/parser/"),
+    re.compile(r"^/api/admin/debug/openai$"),
+    re.compile(r"^/api/admin/maintenance/clean/"),
+    re.compile(r"^/api/groups/migrations$"),
+    re.compile(r"^/api/groups/seeders/"),
+)
+# ``POST /api/recipes/{slug}/image`` scrapes an image URL; ``PUT`` uploads one.
+_SCRAPE_IMAGE = re.compile(r"^/api/recipes/[^/]+/image$")
+
+_DEADLINE: ContextVar[float | None] = ContextVar("mealie_deadline", default=None)
+_OVERRIDE: ContextVar[float | None] = ContextVar("mealie_timeout", default=None)
+
+
+def set_deadline(seconds: float | None) -> Token:
+    """Cap the remaining budget of every request in the current context.
+
+    An existing, earlier deadline is kept. Returns the token for
+    ``reset_deadline``; callers that scope a whole task may simply let the
+    context end.
+    """
+    current = _DEADLINE.get()
+    if seconds is None:
+        return _DEADLINE.set(current)
+    candidate = time.monotonic() + max(0.0, seconds)
+    return _DEADLINE.set(candidate if current is None else min(current, candidate))
+
+
+def start_deadline(seconds: float | None) -> Token:
+    """Begin a fresh deadline for a new top-level call, dropping any inherited one."""
+    at = None if seconds is None else time.monotonic() + max(0.0, seconds)
+    return _DEADLINE.set(at)
+
+
+def reset_deadline(token: Token) -> None:
+    _DEADLINE.reset(token)
+
+
+@contextmanager
+def deadline(seconds: float | None) -> Iterator[None]:
+    """Scope a caller deadline over a block of requests."""
+    token = set_deadline(seconds)
+    try:
+        yield
+    finally:
+        reset_deadline(token)
+
+
+def set_request_timeout(seconds: float | None) -> Token:
+    """Override the endpoint-class timeout for the rest of the current context."""
+    return _OVERRIDE.set(seconds)
+
+
+@contextmanager
+def request_timeout(seconds: float | None) -> Iterator[None]:
+    """Override the endpoint-class timeout for requests issued in this block."""
+    token = set_request_timeout(seconds)
+    try:
+        yield
+    finally:
+        _OVERRIDE.reset(token)
+
+
+def timeout_override() -> float | None:
+    """The ambient :func:`request_timeout` override, if any."""
+    return _OVERRIDE.get()
+
+
+def deadline_at() -> float | None:
+    """Monotonic time of the ambient deadline, or ``None`` when unbounded."""
+    return _DEADLINE.get()
+
+
+def remaining() -> float | None:
+    """Seconds left before the ambient deadline, or ``None`` when unbounded."""
+    at = _DEADLINE.get()
+    return None if at is None else at - time.monotonic()
+
+
+@dataclass
+class TimeoutPolicy:
+    connect: float = 5.0
+    fast: float = 15.0
+    write: float = 30.0
+    slow: float = 180.0
+    download: float = 600.0
+
+    @classmethod
+    def from_settings(cls) -> "TimeoutPolicy":
+        from agent_utilities.core.config import setting
+
+        return cls(
+            connect=setting("MEALIE_TIMEOUT_CONNECT", cls.connect),
+            fast=setting("MEALIE_TIMEOUT_FAST", cls.fast),
+            write=setting("MEALIE_TIMEOUT_WRITE", cls.write),
+            slow=setting("MEALIE_TIMEOUT_SLOW", cls.slow),
+            download=setting("MEALIE_TIMEOUT_DOWNLOAD", cls.download),
+        )
+
+    def classify(self, method: str, endpoint: str) -> str:
+        """Endpoint class of a request: ``fast``, ``write``, ``slow`` or ``download``."""
+        path = endpoint.split("?", 1)[0]
+        method = method.upper()
+        if any(p.match(path) for p in _DOWNLOAD_ENDPOINTS):
+            return "download"
+        if any(p.match(path) for p in _SLOW_ENDPOINTS) or (
+            method == "POST" and _SCRAPE_IMAGE.match(path)
+        ):
+            return "slow"
+        return "fast" if method in ("GET", "HEAD", "OPTIONS") else "write"
+
+    def resolve(
+        self, method: str, endpoint: str, override: float | None = None
+    ) -> tuple[float, float]:
+        """``(connect, read)`` timeouts for a request, capped by the deadline.
+
+        Raises :class:`DeadlineExceeded` when the caller's budget is already
+        spent, so no request is started that nobody will wait for.
+        """
+        if override is None:
+            override = _OVERRIDE.get()
+        read = (
+            override
+            if override is not None
+            else getattr(self, self.classify(method, endpoint))
+        )
+        budget = remaining()
+        if budget is None:
+            return self.connect, read
+        if budget <= 0:
+            raise DeadlineExceeded(f"Deadline exceeded before {method} {endpoint}")
+        return min(self.connect, budget), min(read, budget)
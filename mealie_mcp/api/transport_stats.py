@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""Connection and stream accounting for the ``httpx`` transport.
+
+Counts are collected from httpcore's ``trace`` request extension, so they reflect
+what actually happened on the wire: how many TCP connections were opened, how many
+of those negotiated HTTP/2, and how many requests rode an existing HTTP/2
+connection as an extra stream instead of opening a new one.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class TransportStats:
+    requests: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    connections_opened: int = 0
+    http2_connections: int = 0
+    http2_streams: int = 0
+    http11_requests: int = 0
+
+    async def trace(self, event: str, info: dict[str, Any]) -> None:
+        """httpcore ``trace`` extension callback."""
+        if event == "connection.connect_tcp.complete":
+            self.connections_opened += 1
+        elif event == "http2.send_connection_init.complete":
+            self.http2_connections += 1
+        elif event == "http2.send_request_headers.started":
+            self.http2_streams += 1
+        elif event == "http11.send_request_headers.started":
+            self.http11_requests += 1
+
+    def started(self) -> None:
+        self.requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def finished(self) -> None:
+        self.in_flight -= 1
+
+    def snapshot(self) -> dict[str, int]:
+        """Return the counters plus ``multiplexed_streams``.
+
+        ``multiplexed_streams`` counts HTTP/2 streams that reused an open
+        connection instead of opening a new one.
+        """
+        return {
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "connections_opened": self.connections_opened,
+            "http2_connections": self.http2_connections,
+            "http2_streams": self.http2_streams,
+            "http11_requests": self.http11_requests,
+            "multiplexed_streams": max(0, self.http2_streams - self.http2_connections),
+        }
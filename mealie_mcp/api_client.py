@@ -2,6 +2,7 @@
 
 from mealie_mcp.api.api_client_admin import Api as AdminApi
 from mealie_mcp.api.api_client_app import Api as AppApi
+from mealie_mcp.api.api_client_base import AsyncBaseApiClient
 from mealie_mcp.api.api_client_explore import Api as ExploreApi
 from mealie_mcp.api.api_client_groups import Api as GroupsApi
 from mealie_mcp.api.api_client_households import Api as HouseholdsApi
@@ -10,9 +11,17 @@
 from mealie_mcp.api.api_client_shared import Api as SharedApi
 from mealie_mcp.api.api_client_users import Api as UsersApi
 from mealie_mcp.api.api_client_utils import Api as UtilsApi
+from mealie_mcp.api.batch import AsyncBatchBase, BatchBase
+from mealie_mcp.api.catalog import AsyncCatalogBase, CatalogBase
+from mealie_mcp.api.pagination import AsyncPaginationBase, PaginationBase
+from mealie_mcp.api.slug_index import AsyncRecipeIndexBase, RecipeIndexBase
 
 
 class Api(
+    PaginationBase,
+    BatchBase,
+    CatalogBase,
+    RecipeIndexBase,
     AppApi,
     UsersApi,
     HouseholdsApi,
@@ -25,3 +34,23 @@ class Api(
     UtilsApi,
 ):
     pass
+
+
+class AsyncApi(
+    AsyncBaseApiClient,
+    AsyncPaginationBase,
+    AsyncBatchBase,
+    AsyncCatalogBase,
+    AsyncRecipeIndexBase,
+    AppApi,
+    UsersApi,
+    HouseholdsApi,
+    GroupsApi,
+    RecipesApi,
+    OrganizerApi,
+    SharedApi,
+    AdminApi,
+    ExploreApi,
+    UtilsApi,
+):
+    """Same operations as :class:`Api`; each one returns an awaitable."""
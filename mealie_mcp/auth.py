@@ -1,22 +1,96 @@
 """Authentication module for mealie-mcp."""
 
+import atexit
+import os
+import tempfile
+from typing import Any
+
 from agent_utilities.base_utilities import get_logger
 from agent_utilities.core.config import setting
 from agent_utilities.core.transport_security import resolve_configured_tls_profile
 
-from mealie_mcp.api_client import Api
+from mealie_mcp.api.catalog import shared_catalog
+from mealie_mcp.api.circuit import shared_breakers
+from mealie_mcp.api.client_pool import ClientRegistry, client_key
+from mealie_mcp.api.http_cache import shared_cache
+from mealie_mcp.api.json_codec import JsonDecoder
+from mealie_mcp.api.limiter import shared_limiter
+from mealie_mcp.api.media_cache import shared_media_cache
+from mealie_mcp.api.retry import RetryPolicy
+from mealie_mcp.api.slug_index import shared_slug_index
+from mealie_mcp.api.timeouts import TimeoutPolicy
+from mealie_mcp.api_client import Api, AsyncApi
+from mealie_mcp.mirror import current_mirror
 
 logger = get_logger(__name__)
 
+_CLIENTS = ClientRegistry()
+_ASYNC_CLIENTS = ClientRegistry()
+
+
+def _tls_key() -> tuple[str | None, str | None]:
+    """Identify the configured TLS profile without resolving its material."""
+    return (
+        setting("MEALIE_TLS_PROFILE", None),
+        setting("MEALIE_TLS_PROFILE_REF", None),
+    )
+
 
-def get_client():
-    """Get authenticated client for mealie-mcp."""
+def _pooled(registry: ClientRegistry, client_cls: type, **options: Any) -> Any:
     base_url = setting("MEALIE_BASE_URL", None)
     token = setting("MEALIE_TOKEN", None)
     if not base_url:
         raise RuntimeError("MEALIE_BASE_URL not set")
-    return Api(
-        base_url=base_url,
-        token=token,
-        tls_profile=resolve_configured_tls_profile("mealie"),
-    )
+
+    identity = client_key(base_url, token, _tls_key())
+
+    def build() -> Any:
+        return client_cls(
+            base_url=base_url,
+            token=token,
+            tls_profile=resolve_configured_tls_profile("mealie"),
+            pool_connections=setting("MEALIE_POOL_CONNECTIONS", 10),
+            pool_maxsize=setting("MEALIE_POOL_MAXSIZE", 20),
+            retry=RetryPolicy.from_settings(),
+            timeouts=TimeoutPolicy.from_settings(),
+            cache=shared_cache(identity),
+            coalesce=setting("MEALIE_COALESCE_GETS", True),
+            limiter=shared_limiter(base_url),
+            breakers=shared_breakers(base_url),
+            decoder=JsonDecoder.from_settings(),
+            prefetch_pages=setting("MEALIE_PREFETCH_PAGES", 4),
+            catalog=shared_catalog(identity),
+            slug_index=shared_slug_index(identity),
+            media_cache=shared_media_cache(identity),
+            mirror=current_mirror(),
+            download_dir=setting(
+                "MEALIE_DOWNLOAD_DIR",
+                os.path.join(tempfile.gettempdir(), "mealie-mcp-downloads"),
+            ),
+            **options,
+        )
+
+    return registry.get(identity, build)
+
+
+def get_client() -> Api:
+    """Get authenticated client for mealie-mcp.
+
+    Clients are pooled per ``(base_url, token, TLS profile)`` so every tool call
+    reuses the same keep-alive connections instead of opening a new session.
+    """
+    return _pooled(_CLIENTS, Api)
+
+
+def get_async_client() -> AsyncApi:
+    """Get the pooled asyncio client used by the condensed MCP tools."""
+    return _pooled(_ASYNC_CLIENTS, AsyncApi, http2=setting("MEALIE_HTTP2", False))
+
+
+def close_clients() -> None:
+    """Close every pooled client and release its TLS material."""
+    _CLIENTS.close_all()
+    _ASYNC_CLIENTS.close_all()
+
+
+atexit.register(close_clients)
@@ -0,0 +1,158 @@
+"""Response byte budget with continuation cursors for oversized tool results.
+
+A list result larger than the budget (``MEALIE_RESPONSE_MAX_BYTES``, or the
+``max_bytes`` call option) is cut after the last item that fits, in the order
+Mealie returned them. The rest is parked in a process-local cache under an
+opaque cursor::
+
+    {..., "items": [first items], "cursor": "q3V...", "remaining": 412}
+
+Calling the same action with ``{"cursor": "q3V..."}`` returns the next chunk
+from the cache without querying Mealie again. Cursors expire after
+``MEALIE_CURSOR_TTL`` seconds; the oldest are dropped beyond
+``MEALIE_CURSOR_ENTRIES``. Results that are not item lists are never cut.
+"""
+
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+# Room left in the budget for the ``cursor``/``remaining`` keys.
+_CURSOR_OVERHEAD = 64
+
+
+def json_size(value: Any) -> int:
+    """Size of ``value`` as compact JSON, the way a tool result is sent."""
+    return len(json.dumps(value, separators=(",", ":"), default=str))
+
+
+class CursorExpired(LookupError):
+    """The cursor is unknown, expired, or belongs to another action."""
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "error": "cursor_expired",
+            "message": "Cursor is unknown or expired; repeat the original call.",
+        }
+
+
+class _Remainder:
+    __slots__ = ("action", "envelope", "items", "expires")
+
+    def __init__(self, action: str, envelope: dict, items: list, expires: float):
+        self.action = action
+        self.envelope = envelope
+        self.items = items
+        self.expires = expires
+
+
+def _split(result: Any) -> tuple[dict, list] | None:
+    """``(envelope, items)`` of a list result, ``None`` for other shapes."""
+    if isinstance(result, list):
+        return {}, result
+    if isinstance(result, dict) and isinstance(result.get("items"), list):
+        return {k: v for k, v in result.items() if k != "items"}, result["items"]
+    return None
+
+
+def _fits(envelope: dict, items: list, max_bytes: int) -> int:
+    """How many leading ``items`` fit in the budget (always at least one)."""
+    used = json_size({**envelope, "items": []}) + _CURSOR_OVERHEAD
+    for count, item in enumerate(items):
+        used += json_size(item) + 1
+        if used > max_bytes:
+            return max(count, 1)
+    return len(items)
+
+
+class ResultBudget:
+    """Cuts oversized list results and serves the remainder by cursor."""
+
+    def __init__(self, max_bytes: int = 131072, ttl: float = 600.0, entries: int = 64):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.entries = entries
+        self._lock = threading.Lock()
+        self._remainders: OrderedDict[str, _Remainder] = OrderedDict()
+        self.issued = 0
+        self.resumed = 0
+        self.expired = 0
+
+    @classmethod
+    def from_settings(cls) -> "ResultBudget":
+        from agent_utilities.core.config import setting
+
+        return cls(
+            max_bytes=int(setting("MEALIE_RESPONSE_MAX_BYTES", 131072)),
+            ttl=float(setting("MEALIE_CURSOR_TTL", 600.0)),
+            entries=int(setting("MEALIE_CURSOR_ENTRIES", 64)),
+        )
+
+    def apply(self, action: str, result: Any, max_bytes: int | None = None) -> Any:
+        """``result`` if it fits the budget, otherwise its first chunk + cursor."""
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        parts = _split(result)
+        if budget <= 0 or parts is None or json_size(result) <= budget:
+            return result
+        envelope, items = parts
+        return self._chunk(action, envelope, items, budget)
+
+    def resume(self, action: str, cursor: str, max_bytes: int | None = None) -> Any:
+        """Next chunk of the result parked under ``cursor``."""
+        with self._lock:
+            self._expire()
+            remainder = self._remainders.pop(cursor, None)
+            if remainder is None or remainder.action != action:
+                raise CursorExpired(cursor)
+            self.resumed += 1
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        return self._chunk(action, remainder.envelope, remainder.items, budget)
+
+    def _chunk(self, action: str, envelope: dict, items: list, budget: int) -> Any:
+        count = _fits(envelope, items, budget) if budget > 0 else len(items)
+        head, rest = items[:count], items[count:]
+        if not rest:
+            return {**envelope, "items": head}
+        cursor = secrets.token_urlsafe(16)
+        with self._lock:
+            self._expire()
+            self._remainders[cursor] = _Remainder(
+                action, envelope, rest, time.monotonic() + self.ttl
+            )
+            while len(self._remainders) > self.entries:
+                self._remainders.popitem(last=False)
+                self.expired += 1
+            self.issued += 1
+        return {**envelope, "items": head, "cursor": cursor, "remaining": len(rest)}
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for cursor in [c for c, r in self._remainders.items() if r.expires <= now]:
+            del self._remainders[cursor]
+            self.expired += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "max_bytes": self.max_bytes,
+                "pending": len(self._remainders),
+                "issued": self.issued,
+                "resumed": self.resumed,
+                "expired": self.expired,
+            }
+
+
+_budget: ResultBudget | None = None
+_budget_lock = threading.Lock()
+
+
+def result_budget() -> ResultBudget:
+    """The process-wide :class:`ResultBudget`, built from settings on first use."""
+    global _budget
+    with _budget_lock:
+        if _budget is None:
+            _budget = ResultBudget.from_settings()
+        return _budget
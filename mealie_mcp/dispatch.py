@@ -0,0 +1,319 @@
+"""Action dispatch shared by the condensed MCP tools.
+
+The condensed tools route ``action`` + ``params_json`` onto a method of the pooled
+:class:`~mealie_mcp.api_client.AsyncApi`. Those methods are coroutines, so the
+call is awaited on the event loop instead of occupying a worker thread.
+
+``params_json`` may also carry reserved call options that are consumed here and
+never forwarded to Mealie:
+
+- ``timeout``: seconds; replaces the endpoint-class HTTP timeout for this call.
+- ``priority``: ``"interactive"`` (default) or ``"bulk"``; bulk calls never take
+  the concurrency reserved for interactive ones.
+- ``all_pages``: walk every page of a paginated list action and return
+  ``{"items": [...], "total": ..., "pages": ...}``, reporting MCP progress per
+  page. If the call's deadline runs out, the pages fetched so far are returned
+  with ``"truncated": true`` and the ``next_page`` to resume from.
+- ``stream``: with ``all_pages``, also send each page's items to the client as
+  an MCP log notification (logger ``mealie_mcp.page``) as soon as it arrives.
+- ``consistent``: with ``all_pages``, walk the listing as a consistent scan
+  (``id`` order, duplicates dropped) and add its report under ``"scan"``,
+  including the ids of items changed mid-scan and whether a deletion may have
+  skipped any (see :class:`~mealie_mcp.api.pagination.ConsistentScan`).
+- ``fields``: dotted paths (list or comma-separated string) to keep in the
+  result, e.g. ``["slug", "name", "recipeIngredient.note"]``; on list actions
+  plain names select item fields (see :func:`select_fields`), and pages are
+  decoded keeping only those item fields (see
+  :func:`~mealie_mcp.api.json_codec.item_fields`). The bytes saved per action
+  are reported by :func:`projection_stats`.
+- ``max_bytes``: response budget for this call (default
+  ``MEALIE_RESPONSE_MAX_BYTES``; ``0`` disables it). A larger list result is
+  cut and returned with a ``cursor`` (see :mod:`mealie_mcp.continuation`).
+- ``cursor``: return the next chunk of an earlier cut result of the same
+  action, from the server-side cache, without calling Mealie.
+- ``retry_safe``: also retry this call's non-idempotent requests (e.g. a
+  ``POST`` whose repetition is harmless to the caller) on transient failures;
+  see :func:`~mealie_mcp.api.retry.retry_safe`.
+- ``local_first``: answer supported read actions from the local SQLite mirror
+  (default ``MEALIE_LOCAL_FIRST``) when it was synced within ``max_age``
+  seconds (default ``MEALIE_MIRROR_MAX_AGE``); see :mod:`mealie_mcp.mirror`.
+
+Cancelling the MCP request cancels the in-flight HTTP calls and any prefetched
+pages.
+
+The HTTP budget of a call is additionally capped by a ``timeout`` hint in the MCP
+request ``_meta`` and by ``MEALIE_TOOL_DEADLINE``, whichever is shorter.
+"""
+
+import contextlib
+import inspect
+import logging
+import threading
+from collections.abc import Callable
+from contextvars import ContextVar
+from typing import Any
+
+from agent_utilities.core.config import setting
+
+from mealie_mcp.api.downloads import BinaryContent
+from mealie_mcp.api.errors import CircuitOpenError, DeadlineExceeded
+from mealie_mcp.api.json_codec import item_fields, page_item_fields, select_fields
+from mealie_mcp.api.limiter import set_priority
+from mealie_mcp.api.pagination import SCAN_FIELDS, page_items
+from mealie_mcp.api.retry import retry_safe
+from mealie_mcp.api.timeouts import set_request_timeout, start_deadline
+from mealie_mcp.continuation import CursorExpired, json_size, result_budget
+from mealie_mcp.mirror import current_mirror
+
+logger = logging.getLogger("mealie_mcp.dispatch")
+
+# REST-body parameter name used by every generated ``api_client_*`` method.
+_BODY_PARAM = "data"
+
+_CTX: ContextVar[Any] = ContextVar("mealie_tool_ctx", default=None)
+_ALL_PAGES: ContextVar[bool] = ContextVar("mealie_all_pages", default=False)
+_STREAM: ContextVar[bool] = ContextVar("mealie_stream", default=False)
+_CONSISTENT: ContextVar[bool] = ContextVar("mealie_consistent", default=False)
+_FIELDS: ContextVar[tuple[str, ...] | None] = ContextVar("mealie_fields", default=None)
+
+_CURSOR: ContextVar[str | None] = ContextVar("mealie_cursor", default=None)
+_MAX_BYTES: ContextVar[int | None] = ContextVar("mealie_max_bytes", default=None)
+_RETRY_SAFE: ContextVar[bool] = ContextVar("mealie_call_retry_safe", default=False)
+_LOCAL_FIRST: ContextVar[bool] = ContextVar("mealie_local_first", default=False)
+_MAX_AGE: ContextVar[float] = ContextVar("mealie_max_age", default=300.0)
+
+_projection_lock = threading.Lock()
+_projection: dict[str, dict[str, int]] = {}
+
+
+def _fold_body_kwargs(func: Callable[..., Any], kwargs: dict) -> dict:
+    """Collect stray fields into ``data`` when ``func`` takes a REST body.
+
+    Agents often pass body fields flat (``{"slug": ..., "name": ...}``) instead of
+    nesting them under ``data``; folding them keeps create/update actions working
+    instead of failing on an unexpected keyword argument.
+    """
+    try:
+        params = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return kwargs
+    if _BODY_PARAM not in params or _BODY_PARAM in kwargs:
+        return kwargs
+    stray = {k: v for k, v in kwargs.items() if k not in params}
+    if not stray:
+        return kwargs
+    folded = {k: v for k, v in kwargs.items() if k in params}
+    folded[_BODY_PARAM] = stray
+    return folded
+
+
+def _meta_timeout(ctx: Any) -> float | None:
+    """Seconds the MCP client is willing to wait, when it says so in ``_meta``."""
+    request_context = getattr(ctx, "request_context", None) if ctx else None
+    meta = getattr(request_context, "meta", None)
+    if meta is None:
+        return None
+    value = meta.get("timeout") if isinstance(meta, dict) else None
+    if value is None:
+        value = getattr(meta, "timeout", None)
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def prepare_call(ctx: Any, kwargs: dict) -> dict:
+    """Consume reserved call options and scope the call's HTTP deadline.
+
+    The options live in context variables of the tool call's task, so they apply
+    to every request the action makes and vanish when the call ends.
+    """
+    timeout = kwargs.pop("timeout", None)
+    set_request_timeout(float(timeout) if timeout is not None else None)
+    set_priority(kwargs.pop("priority", None))
+    _ALL_PAGES.set(bool(kwargs.pop("all_pages", False)))
+    _STREAM.set(bool(kwargs.pop("stream", False)))
+    _CONSISTENT.set(bool(kwargs.pop("consistent", False)))
+    _FIELDS.set(_field_paths(kwargs.pop("fields", None)))
+    _CURSOR.set(kwargs.pop("cursor", None) or None)
+    max_bytes = kwargs.pop("max_bytes", None)
+    _MAX_BYTES.set(int(max_bytes) if max_bytes is not None else None)
+    _RETRY_SAFE.set(bool(kwargs.pop("retry_safe", False)))
+    _LOCAL_FIRST.set(
+        bool(kwargs.pop("local_first", setting("MEALIE_LOCAL_FIRST", False)))
+    )
+    max_age = kwargs.pop("max_age", None)
+    _MAX_AGE.set(
+        float(max_age)
+        if max_age is not None
+        else float(setting("MEALIE_MIRROR_MAX_AGE", 300.0))
+    )
+    _CTX.set(ctx)
+    budgets = [
+        b for b in (_meta_timeout(ctx), setting("MEALIE_TOOL_DEADLINE", 0.0)) if b
+    ]
+    start_deadline(min(budgets) if budgets else None)
+    return kwargs
+
+
+def _field_paths(fields: Any) -> tuple[str, ...] | None:
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    paths = tuple(p.strip() for p in fields or () if p and p.strip())
+    return paths or None
+
+
+def _decoded_item_fields() -> tuple[str, ...] | None:
+    """Item fields a list action's pages can be decoded down to, if any."""
+    fields = _FIELDS.get()
+    names = page_item_fields(fields) if fields else None
+    if names and _CONSISTENT.get():
+        names = (*names, *SCAN_FIELDS)
+    return names
+
+
+def _project(action: str, result: Any, fields: tuple[str, ...]) -> Any:
+    """Apply the ``fields`` call option and account the bytes it saved."""
+    projected = select_fields(result, fields)
+    before, after = json_size(result), json_size(projected)
+    with _projection_lock:
+        stats = _projection.setdefault(
+            action, {"calls": 0, "bytes_before": 0, "bytes_after": 0}
+        )
+        stats["calls"] += 1
+        stats["bytes_before"] += before
+        stats["bytes_after"] += after
+    logger.debug("Projected %s: %d -> %d bytes", action, before, after)
+    return projected
+
+
+def projection_stats() -> dict[str, dict[str, int]]:
+    """Per-action response bytes before/after ``fields`` projection."""
+    with _projection_lock:
+        return {
+            action: {
+                **stats,
+                "bytes_saved": stats["bytes_before"] - stats["bytes_after"],
+            }
+            for action, stats in _projection.items()
+        }
+
+
+async def report_progress(
+    progress: float, total: float | None = None, message: str | None = None
+) -> None:
+    """Send an MCP progress notification for the current tool call, if any."""
+    ctx = _CTX.get()
+    if ctx is None:
+        return
+    try:
+        await ctx.report_progress(progress, total, message)
+    except Exception as e:  # noqa: BLE001 - progress is best-effort
+        logger.debug("Progress notification failed: %s", e)
+
+
+async def _send_page(number: int, items: list) -> None:
+    ctx = _CTX.get()
+    if ctx is None:
+        return
+    try:
+        await ctx.log(
+            f"page {number}: {len(items)} items",
+            level="info",
+            logger_name="mealie_mcp.page",
+            extra={"page": number, "items": items},
+        )
+    except Exception as e:  # noqa: BLE001 - streaming is best-effort
+        logger.debug("Page notification failed: %s", e)
+
+
+def _paginated(func: Callable[..., Any]) -> bool:
+    try:
+        params = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+    owner = getattr(func, "__self__", None)
+    return "page" in params and "per_page" in params and hasattr(owner, "iter_pages")
+
+
+async def _collect_pages(func: Callable[..., Any], kwargs: dict) -> dict:
+    """Walk every page of ``func``, reporting progress after each one."""
+    start = kwargs.pop("page", 1)
+    scan = None
+    if _CONSISTENT.get():
+        scan = func.__self__.scan(func, start_page=start, **kwargs)
+        pages = scan.pages()
+    else:
+        pages = func.__self__.iter_pages(func, start_page=start, **kwargs)
+    items: list = []
+    result: dict[str, Any] = {"items": items}
+    number = start - 1
+    try:
+        async with contextlib.aclosing(pages):
+            async for page in pages:
+                number += 1
+                chunk = page_items(page)
+                items.extend(chunk)
+                total_pages = page.get("total_pages") if isinstance(page, dict) else 1
+                if isinstance(page, dict) and "total" in page:
+                    result["total"] = page["total"]
+                await report_progress(
+                    number - start + 1,
+                    total_pages - start + 1 if isinstance(total_pages, int) else None,
+                    f"Fetched page {number} ({len(items)} items)",
+                )
+                if _STREAM.get():
+                    await _send_page(number, chunk)
+    except DeadlineExceeded:
+        result.update(truncated=True, next_page=number + 1)
+    result["pages"] = number - start + 1
+    if scan is not None:
+        result["scan"] = scan.report()
+    return result
+
+
+async def run_action(func: Callable[..., Any], /, **kwargs: Any) -> Any:
+    """Call a client operation and await its result when it is a coroutine.
+
+    With the ``all_pages`` call option a paginated list operation is walked to
+    the end (see module docstring). An open circuit breaker is reported as a
+    structured error result instead of an exception, so agents see when to
+    retry rather than a generic failure. Binary media bodies are returned
+    base64-encoded with their content type. With ``local_first``, a read the
+    mirror can answer never reaches Mealie. With ``retry_safe``, the action's
+    requests run inside :func:`~mealie_mcp.api.retry.retry_safe`. The ``fields``
+    call option scopes a projected decode of list pages and is then applied to
+    whatever the action returned, followed by the response budget.
+    """
+    action = getattr(func, "__name__", "action")
+    cursor = _CURSOR.get()
+    if cursor:
+        try:
+            return result_budget().resume(action, cursor, _MAX_BYTES.get())
+        except CursorExpired as e:
+            return e.to_dict()
+    mirror = current_mirror() if _LOCAL_FIRST.get() else None
+    local = mirror.answer(action, kwargs, _MAX_AGE.get()) if mirror else None
+    try:
+        with contextlib.ExitStack() as scope:
+            if _RETRY_SAFE.get():
+                scope.enter_context(retry_safe())
+            decoded = _decoded_item_fields() if local is None else None
+            if decoded and _paginated(func):
+                scope.enter_context(item_fields(decoded))
+            if local is not None:
+                result = local
+            elif _ALL_PAGES.get() and _paginated(func):
+                result = await _collect_pages(func, kwargs)
+            else:
+                result = func(**_fold_body_kwargs(func, kwargs))
+                if inspect.isawaitable(result):
+                    result = await result
+    except CircuitOpenError as e:
+        return e.to_dict()
+    if isinstance(result, BinaryContent):
+        result = result.to_dict()
+    fields = _FIELDS.get()
+    if fields:
+        result = _project(action, result, fields)
+    return result_budget().apply(action, result, _MAX_BYTES.get())
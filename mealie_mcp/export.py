@@ -0,0 +1,195 @@
+"""Full-catalog export to JSON Lines files.
+
+Streams every recipe, food, unit, tag, category, tool and meal plan into one
+``<entity>.jsonl`` (or ``.jsonl.gz``) file per entity type, one record per
+line, walking the list endpoints page by page through the ``iter_*``
+companions so memory stays constant however large the catalog is::
+
+    mealie-export ./catalog --gzip --since 2025-01-01
+
+With ``--since``, only records updated at or after the cutoff are written.
+The cutoff is pushed to Mealie as a ``queryFilter`` on ``updatedAt`` where the
+endpoint supports it and re-checked locally on each record; records without an
+update timestamp are always exported. Each file is written to a temporary name
+and renamed into place once complete.
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import os
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO, Any
+
+from mealie_mcp.api.errors import MealieApiError
+from mealie_mcp.api.limiter import BULK, priority
+from mealie_mcp.api.pagination import parse_timestamp, updated_at
+
+logger = logging.getLogger("mealie_mcp.export")
+
+# Entity type -> paginated list operation.
+ENTITIES = {
+    "recipes": "get_recipes",
+    "foods": "get_foods",
+    "units": "get_units",
+    "tags": "get_organizers_tags",
+    "categories": "get_organizers_categories",
+    "tools": "get_organizers_tools",
+    "mealplans": "get_households_mealplans",
+}
+
+
+def _records(
+    client: Any, operation: str, since: datetime | None, per_page: int
+) -> Iterator[Any]:
+    if since is None:
+        yield from client.iter_items(operation, per_page=per_page)
+        return
+    # Mealie compares naive timestamps, which it stores in UTC.
+    cutoff = since.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S")
+    items: Iterable[Any] = client.iter_items(
+        operation, per_page=per_page, query_filter=f'updatedAt >= "{cutoff}"'
+    )
+    try:
+        first = next(iter(items), None)
+    except MealieApiError as e:
+        if e.status_code not in (400, 422):
+            raise
+        logger.debug("%s rejects an updatedAt filter; filtering locally", operation)
+        items = client.iter_items(operation, per_page=per_page)
+        first = None
+    else:
+        if first is not None:
+            items = _chain(first, items)
+    for record in items:
+        stamp = updated_at(record)
+        if stamp is None or stamp >= since:
+            yield record
+
+
+def _chain(first: Any, rest: Iterable[Any]) -> Iterator[Any]:
+    yield first
+    yield from rest
+
+
+def _open(path: Path, compress: bool) -> IO[str]:
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8")
+    return open(path, "w", encoding="utf-8")  # noqa: SIM115 - closed by caller
+
+
+def export_entity(
+    client: Any,
+    entity: str,
+    out_dir: str | os.PathLike,
+    *,
+    since: datetime | None = None,
+    compress: bool = False,
+    per_page: int = 100,
+) -> dict[str, Any]:
+    """Write one entity type to ``<out_dir>/<entity>.jsonl[.gz]``."""
+    target = Path(out_dir) / f"{entity}.jsonl{'.gz' if compress else ''}"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    part = target.with_name(f".{target.name}.part")
+    started = time.monotonic()
+    count = 0
+    try:
+        with _open(part, compress) as out:
+            for record in _records(client, ENTITIES[entity], since, per_page):
+                out.write(json.dumps(record, separators=(",", ":"), default=str))
+                out.write("\n")
+                count += 1
+        os.replace(part, target)
+    except BaseException:
+        part.unlink(missing_ok=True)
+        raise
+    seconds = time.monotonic() - started
+    return {
+        "path": str(target),
+        "records": count,
+        "seconds": round(seconds, 3),
+        "records_per_second": round(count / seconds, 1) if seconds > 0 else None,
+    }
+
+
+def export_catalog(
+    client: Any,
+    out_dir: str | os.PathLike,
+    *,
+    entities: Iterable[str] | None = None,
+    since: datetime | None = None,
+    compress: bool = False,
+    per_page: int = 100,
+) -> dict[str, Any]:
+    """Export each of ``entities`` (default: all of :data:`ENTITIES`)."""
+    selected = list(entities or ENTITIES)
+    unknown = [e for e in selected if e not in ENTITIES]
+    if unknown:
+        raise ValueError(f"Unknown entity types: {', '.join(unknown)}")
+    started = time.monotonic()
+    results = {}
+    with priority(BULK):
+        for entity in selected:
+            results[entity] = export_entity(
+                client,
+                entity,
+                out_dir,
+                since=since,
+                compress=compress,
+                per_page=per_page,
+            )
+    seconds = time.monotonic() - started
+    records = sum(r["records"] for r in results.values())
+    return {
+        "entities": results,
+        "records": records,
+        "seconds": round(seconds, 3),
+        "records_per_second": round(records / seconds, 1) if seconds > 0 else None,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="mealie-export", description="Export the Mealie catalog as JSON Lines."
+    )
+    parser.add_argument("out_dir", help="Directory for the <entity>.jsonl files")
+    parser.add_argument(
+        "--entities",
+        default=",".join(ENTITIES),
+        help=f"Comma-separated entity types (default: {','.join(ENTITIES)})",
+    )
+    parser.add_argument(
+        "--since",
+        type=parse_timestamp,
+        help="Only records updated at or after this ISO date/datetime",
+    )
+    parser.add_argument("--gzip", action="store_true", help="Write .jsonl.gz files")
+    parser.add_argument("--per-page", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    from mealie_mcp.auth import get_client
+
+    summary = export_catalog(
+        get_client(),
+        args.out_dir,
+        entities=[e.strip() for e in args.entities.split(",") if e.strip()],
+        since=args.since,
+        compress=args.gzip,
+        per_page=args.per_page,
+    )
+    for entity, result in summary["entities"].items():
+        print(
+            f"{entity}: {result['records']} records in {result['seconds']}s "
+            f"({result['records_per_second']} rec/s) -> {result['path']}",
+            file=sys.stderr,
+        )
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
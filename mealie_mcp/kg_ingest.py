@@ -286,3 +286,24 @@ def ingest_recipes(
         all_entities.extend(ents)
         all_relationships.extend(rels)
     return ingest_entities(all_entities, all_relationships, client=client, graph=graph)
+
+
+def merge_ingest_counts(
+    total: dict[str, Any] | None, counts: dict[str, Any] | None
+) -> dict[str, Any] | None:
+    """Add one batch's ingest counts into a running total (page-wise ingestion)."""
+    if counts is None:
+        return total
+    if total is None:
+        return dict(counts)
+    for key, value in counts.items():
+        current = total.get(key, 0)
+        if (
+            isinstance(value, int)
+            and isinstance(current, int)
+            and not isinstance(value, bool)
+        ):
+            total[key] = current + value
+        else:
+            total[key] = value
+    return total
@@ -16,7 +16,8 @@
 
 import logging
 from typing import Any
-from urllib.parse import urljoin
+
+from mealie_mcp.api.downloads import BinaryContent
 
 logger = logging.getLogger("mealie_mcp.kg.media")
 
@@ -53,32 +54,52 @@ def media_store() -> Any | None:
         return None
 
 
-def fetch_recipe_image_bytes(
+def _image_path(recipe_id: str, file_name: str) -> str:
+    return f"/api/media/recipes/{recipe_id}/images/{file_name}"
+
+
+def fetch_recipe_image(
     client: Any, recipe_id: str, file_name: str = "original.webp"
-) -> bytes | None:
-    """Fetch the raw image bytes for a recipe via the client's HTTP session.
+) -> BinaryContent | None:
+    """Fetch a recipe image (bytes + content type) through ``client.request_bytes``.
 
-    The typed ``client.request`` decodes JSON/text, so raw image bytes are pulled
-    straight from the underlying ``requests`` session. Returns ``None`` on any error.
+    Goes through the client's retry, timeout and circuit handling. Returns
+    ``None`` on any error.
     """
     try:
-        base_url = getattr(client, "base_url", "") or ""
-        session = getattr(client, "_session", None)
-        if session is None:
-            return None
-        url = urljoin(base_url, f"/api/media/recipes/{recipe_id}/images/{file_name}")
-        resp = session.get(url)
-        if resp.status_code >= 400:
-            logger.debug(
-                "Mealie KG media fetch failed: status_code=%s", resp.status_code
-            )
-            return None
-        return resp.content
+        return client.request_bytes("GET", _image_path(recipe_id, file_name))
     except Exception as e:  # noqa: BLE001 — network/attr error is non-fatal
         logger.debug("Mealie KG media fetch failed: error_type=%s", type(e).__name__)
         return None
 
 
+async def afetch_recipe_image(
+    client: Any, recipe_id: str, file_name: str = "original.webp"
+) -> BinaryContent | None:
+    """Async twin of :func:`fetch_recipe_image` for ``AsyncApi`` clients."""
+    try:
+        return await client.request_bytes("GET", _image_path(recipe_id, file_name))
+    except Exception as e:  # noqa: BLE001 — network/attr error is non-fatal
+        logger.debug("Mealie KG media fetch failed: error_type=%s", type(e).__name__)
+        return None
+
+
+def fetch_recipe_image_bytes(
+    client: Any, recipe_id: str, file_name: str = "original.webp"
+) -> bytes | None:
+    """Raw image bytes of :func:`fetch_recipe_image`, or ``None`` on any error."""
+    image = fetch_recipe_image(client, recipe_id, file_name)
+    return image.content if image is not None else None
+
+
+async def afetch_recipe_image_bytes(
+    client: Any, recipe_id: str, file_name: str = "original.webp"
+) -> bytes | None:
+    """Async twin of :func:`fetch_recipe_image_bytes` for ``AsyncApi`` clients."""
+    image = await afetch_recipe_image(client, recipe_id, file_name)
+    return image.content if image is not None else None
+
+
 def ingest_recipe_image(
     recipe: dict[str, Any],
     *,
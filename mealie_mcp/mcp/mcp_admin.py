@@ -4,12 +4,12 @@
 """
 
 from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import run_blocking
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
-from mealie_mcp.auth import get_client
+from mealie_mcp.auth import get_async_client
+from mealie_mcp.dispatch import prepare_call, run_action
 
 VALID_ADMIN_ACTIONS = (
     "get_app_info",
@@ -58,14 +58,14 @@ async def mealie_admin(
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie admin operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -74,6 +74,7 @@ async def mealie_admin(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_ADMIN_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -81,71 +82,71 @@ async def mealie_admin(
         action = resolved
 
         if action == "get_app_info":
-            return await run_blocking(client.get_app_info, **kwargs)
+            return await run_action(client.get_app_info, **kwargs)
         if action == "get_app_statistics":
-            return await run_blocking(client.get_app_statistics, **kwargs)
+            return await run_action(client.get_app_statistics, **kwargs)
         if action == "check_app_config":
-            return await run_blocking(client.check_app_config, **kwargs)
+            return await run_action(client.check_app_config, **kwargs)
         if action == "get_admin_users":
-            return await run_blocking(client.get_admin_users, **kwargs)
+            return await run_action(client.get_admin_users, **kwargs)
         if action == "post_admin_users":
-            return await run_blocking(client.post_admin_users, **kwargs)
+            return await run_action(client.post_admin_users, **kwargs)
         if action == "unlock_users":
-            return await run_blocking(client.unlock_users, **kwargs)
+            return await run_action(client.unlock_users, **kwargs)
         if action == "get_admin_users_item_id":
-            return await run_blocking(client.get_admin_users_item_id, **kwargs)
+            return await run_action(client.get_admin_users_item_id, **kwargs)
         if action == "put_admin_users_item_id":
-            return await run_blocking(client.put_admin_users_item_id, **kwargs)
+            return await run_action(client.put_admin_users_item_id, **kwargs)
         if action == "delete_admin_users_item_id":
-            return await run_blocking(client.delete_admin_users_item_id, **kwargs)
+            return await run_action(client.delete_admin_users_item_id, **kwargs)
         if action == "generate_token":
-            return await run_blocking(client.generate_token, **kwargs)
+            return await run_action(client.generate_token, **kwargs)
         if action == "get_admin_households":
-            return await run_blocking(client.get_admin_households, **kwargs)
+            return await run_action(client.get_admin_households, **kwargs)
         if action == "post_admin_households":
-            return await run_blocking(client.post_admin_households, **kwargs)
+            return await run_action(client.post_admin_households, **kwargs)
         if action == "get_admin_households_item_id":
-            return await run_blocking(client.get_admin_households_item_id, **kwargs)
+            return await run_action(client.get_admin_households_item_id, **kwargs)
         if action == "put_admin_households_item_id":
-            return await run_blocking(client.put_admin_households_item_id, **kwargs)
+            return await run_action(client.put_admin_households_item_id, **kwargs)
         if action == "delete_admin_households_item_id":
-            return await run_blocking(client.delete_admin_households_item_id, **kwargs)
+            return await run_action(client.delete_admin_households_item_id, **kwargs)
         if action == "get_admin_groups":
-            return await run_blocking(client.get_admin_groups, **kwargs)
+            return await run_action(client.get_admin_groups, **kwargs)
         if action == "post_admin_groups":
-            return await run_blocking(client.post_admin_groups, **kwargs)
+            return await run_action(client.post_admin_groups, **kwargs)
         if action == "get_admin_groups_item_id":
-            return await run_blocking(client.get_admin_groups_item_id, **kwargs)
+            return await run_action(client.get_admin_groups_item_id, **kwargs)
         if action == "put_admin_groups_item_id":
-            return await run_blocking(client.put_admin_groups_item_id, **kwargs)
+            return await run_action(client.put_admin_groups_item_id, **kwargs)
         if action == "delete_admin_groups_item_id":
-            return await run_blocking(client.delete_admin_groups_item_id, **kwargs)
+            return await run_action(client.delete_admin_groups_item_id, **kwargs)
         if action == "check_email_config":
-            return await run_blocking(client.check_email_config, **kwargs)
+            return await run_action(client.check_email_config, **kwargs)
         if action == "send_test_email":
-            return await run_blocking(client.send_test_email, **kwargs)
+            return await run_action(client.send_test_email, **kwargs)
         if action == "get_admin_backups":
-            return await run_blocking(client.get_admin_backups, **kwargs)
+            return await run_action(client.get_admin_backups, **kwargs)
         if action == "post_admin_backups":
-            return await run_blocking(client.post_admin_backups, **kwargs)
+            return await run_action(client.post_admin_backups, **kwargs)
         if action == "get_admin_backups_file_name":
-            return await run_blocking(client.get_admin_backups_file_name, **kwargs)
+            return await run_action(client.get_admin_backups_file_name, **kwargs)
         if action == "delete_admin_backups_file_name":
-            return await run_blocking(client.delete_admin_backups_file_name, **kwargs)
+            return await run_action(client.delete_admin_backups_file_name, **kwargs)
         if action == "upload_one":
-            return await run_blocking(client.upload_one, **kwargs)
+            return await run_action(client.upload_one, **kwargs)
         if action == "import_one":
-            return await run_blocking(client.import_one, **kwargs)
+            return await run_action(client.import_one, **kwargs)
         if action == "get_maintenance_summary":
-            return await run_blocking(client.get_maintenance_summary, **kwargs)
+            return await run_action(client.get_maintenance_summary, **kwargs)
         if action == "get_storage_details":
-            return await run_blocking(client.get_storage_details, **kwargs)
+            return await run_action(client.get_storage_details, **kwargs)
         if action == "clean_images":
-            return await run_blocking(client.clean_images, **kwargs)
+            return await run_action(client.clean_images, **kwargs)
         if action == "clean_temp":
-            return await run_blocking(client.clean_temp, **kwargs)
+            return await run_action(client.clean_temp, **kwargs)
         if action == "clean_recipe_folders":
-            return await run_blocking(client.clean_recipe_folders, **kwargs)
+            return await run_action(client.clean_recipe_folders, **kwargs)
         if action == "debug_openai":
-            return await run_blocking(client.debug_openai, **kwargs)
+            return await run_action(client.debug_openai, **kwargs)
         raise ValueError(f"Unknown action: {action}")
@@ -4,16 +4,19 @@
 """
 
 from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import run_blocking
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
-from mealie_mcp.auth import get_client
+from mealie_mcp.auth import get_async_client
+from mealie_mcp.continuation import result_budget
+from mealie_mcp.dispatch import prepare_call, projection_stats, run_action
+from mealie_mcp.mirror import current_mirror
 
 VALID_APP_ACTIONS = (
     "get_startup_info",
     "get_app_theme",
+    "get_client_stats",
 )
 
 
@@ -21,19 +24,19 @@ def register_app_tools(mcp: FastMCP):
     @mcp.tool(tags={"app"})
     async def mealie_app(
         action: str = Field(
-            description="Action to perform. Must be one of: 'get_startup_info', 'get_app_theme'"
+            description="Action to perform. Must be one of: 'get_startup_info', 'get_app_theme', 'get_client_stats'"
         ),
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie app operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -42,6 +45,7 @@ async def mealie_app(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_APP_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -49,7 +53,14 @@ async def mealie_app(
         action = resolved
 
         if action == "get_startup_info":
-            return await run_blocking(client.get_startup_info, **kwargs)
+            return await run_action(client.get_startup_info, **kwargs)
         if action == "get_app_theme":
-            return await run_blocking(client.get_app_theme, **kwargs)
+            return await run_action(client.get_app_theme, **kwargs)
+        if action == "get_client_stats":
+            return {
+                **client.client_stats(),
+                "projection": projection_stats(),
+                "cursors": result_budget().snapshot(),
+                "mirror": mirror.snapshot() if (mirror := current_mirror()) else None,
+            }
         raise ValueError(f"Unknown action: {action}")
@@ -4,12 +4,12 @@
 """
 
 from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import run_blocking
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
-from mealie_mcp.auth import get_client
+from mealie_mcp.auth import get_async_client
+from mealie_mcp.dispatch import prepare_call, run_action
 
 VALID_EXPLORE_ACTIONS = (
     "get_explore_groups_group_slug_foods",
@@ -39,14 +39,14 @@ async def mealie_explore(
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie explore operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -55,6 +55,7 @@ async def mealie_explore(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_EXPLORE_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -62,60 +63,60 @@ async def mealie_explore(
         action = resolved
 
         if action == "get_explore_groups_group_slug_foods":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_foods, **kwargs
             )
         if action == "get_explore_groups_group_slug_foods_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_foods_item_id, **kwargs
             )
         if action == "get_explore_groups_group_slug_households":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_households, **kwargs
             )
         if action == "get_household":
-            return await run_blocking(client.get_household, **kwargs)
+            return await run_action(client.get_household, **kwargs)
         if action == "get_explore_groups_group_slug_organizers_categories":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_organizers_categories, **kwargs
             )
         if action == "get_explore_groups_group_slug_organizers_categories_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_organizers_categories_item_id,
                 **kwargs,
             )
         if action == "get_explore_groups_group_slug_organizers_tags":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_organizers_tags, **kwargs
             )
         if action == "get_explore_groups_group_slug_organizers_tags_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_organizers_tags_item_id, **kwargs
             )
         if action == "get_explore_groups_group_slug_organizerss":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_organizerss, **kwargs
             )
         if action == "get_explore_groups_group_slug_organizerss_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_organizerss_item_id, **kwargs
             )
         if action == "get_explore_groups_group_slug_cookbooks":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_cookbooks, **kwargs
             )
         if action == "get_explore_groups_group_slug_cookbooks_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_cookbooks_item_id, **kwargs
             )
         if action == "get_explore_groups_group_slug_recipes":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_recipes, **kwargs
             )
         if action == "get_explore_groups_group_slug_recipes_suggestions":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_recipes_suggestions, **kwargs
             )
         if action == "get_recipe":
-            return await run_blocking(client.get_recipe, **kwargs)
+            return await run_action(client.get_recipe, **kwargs)
         raise ValueError(f"Unknown action: {action}")
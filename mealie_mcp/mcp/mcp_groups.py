@@ -4,12 +4,12 @@
 """
 
 from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import run_blocking
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
-from mealie_mcp.auth import get_client
+from mealie_mcp.auth import get_async_client
+from mealie_mcp.dispatch import prepare_call, run_action
 
 VALID_GROUPS_ACTIONS = (
     "get_all_households",
@@ -44,14 +44,14 @@ async def mealie_groups(
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie groups operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -60,6 +60,7 @@ async def mealie_groups(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_GROUPS_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -67,43 +68,43 @@ async def mealie_groups(
         action = resolved
 
         if action == "get_all_households":
-            return await run_blocking(client.get_all_households, **kwargs)
+            return await run_action(client.get_all_households, **kwargs)
         if action == "get_one_household":
-            return await run_blocking(client.get_one_household, **kwargs)
+            return await run_action(client.get_one_household, **kwargs)
         if action == "get_logged_in_user_group":
-            return await run_blocking(client.get_logged_in_user_group, **kwargs)
+            return await run_action(client.get_logged_in_user_group, **kwargs)
         if action == "get_group_members":
-            return await run_blocking(client.get_group_members, **kwargs)
+            return await run_action(client.get_group_members, **kwargs)
         if action == "get_group_member":
-            return await run_blocking(client.get_group_member, **kwargs)
+            return await run_action(client.get_group_member, **kwargs)
         if action == "get_group_preferences":
-            return await run_blocking(client.get_group_preferences, **kwargs)
+            return await run_action(client.get_group_preferences, **kwargs)
         if action == "update_group_preferences":
-            return await run_blocking(client.update_group_preferences, **kwargs)
+            return await run_action(client.update_group_preferences, **kwargs)
         if action == "get_storage":
-            return await run_blocking(client.get_storage, **kwargs)
+            return await run_action(client.get_storage, **kwargs)
         if action == "start_data_migration":
-            return await run_blocking(client.start_data_migration, **kwargs)
+            return await run_action(client.start_data_migration, **kwargs)
         if action == "get_groups_reports":
-            return await run_blocking(client.get_groups_reports, **kwargs)
+            return await run_action(client.get_groups_reports, **kwargs)
         if action == "get_groups_reports_item_id":
-            return await run_blocking(client.get_groups_reports_item_id, **kwargs)
+            return await run_action(client.get_groups_reports_item_id, **kwargs)
         if action == "delete_groups_reports_item_id":
-            return await run_blocking(client.delete_groups_reports_item_id, **kwargs)
+            return await run_action(client.delete_groups_reports_item_id, **kwargs)
         if action == "get_groups_labels":
-            return await run_blocking(client.get_groups_labels, **kwargs)
+            return await run_action(client.get_groups_labels, **kwargs)
         if action == "post_groups_labels":
-            return await run_blocking(client.post_groups_labels, **kwargs)
+            return await run_action(client.post_groups_labels, **kwargs)
         if action == "get_groups_labels_item_id":
-            return await run_blocking(client.get_groups_labels_item_id, **kwargs)
+            return await run_action(client.get_groups_labels_item_id, **kwargs)
         if action == "put_groups_labels_item_id":
-            return await run_blocking(client.put_groups_labels_item_id, **kwargs)
+            return await run_action(client.put_groups_labels_item_id, **kwargs)
         if action == "delete_groups_labels_item_id":
-            return await run_blocking(client.delete_groups_labels_item_id, **kwargs)
+            return await run_action(client.delete_groups_labels_item_id, **kwargs)
         if action == "seed_foods":
-            return await run_blocking(client.seed_foods, **kwargs)
+            return await run_action(client.seed_foods, **kwargs)
         if action == "seed_labels":
-            return await run_blocking(client.seed_labels, **kwargs)
+            return await run_action(client.seed_labels, **kwargs)
         if action == "seed_units":
-            return await run_blocking(client.seed_units, **kwargs)
+            return await run_action(client.seed_units, **kwargs)
         raise ValueError(f"Unknown action: {action}")
@@ -4,12 +4,12 @@
 """
 
 from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import run_blocking
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
-from mealie_mcp.auth import get_client
+from mealie_mcp.auth import get_async_client
+from mealie_mcp.dispatch import prepare_call, run_action
 
 VALID_ORGANIZER_ACTIONS = (
     "get_organizers_categories",
@@ -44,14 +44,14 @@ async def mealie_organizer(
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie organizer operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -60,6 +60,7 @@ async def mealie_organizer(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_ORGANIZER_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -67,53 +68,86 @@ async def mealie_organizer(
         action = resolved
 
         if action == "get_organizers_categories":
-            return await run_blocking(client.get_organizers_categories, **kwargs)
+            return await run_action(client.get_organizers_categories, **kwargs)
         if action == "post_organizers_categories":
-            return await run_blocking(client.post_organizers_categories, **kwargs)
+            return await run_action(client.post_organizers_categories, **kwargs)
         if action == "get_all_empty":
-            return await run_blocking(client.get_all_empty, **kwargs)
+            return await run_action(client.get_all_empty, **kwargs)
         if action == "get_organizers_categories_item_id":
-            return await run_blocking(
-                client.get_organizers_categories_item_id, **kwargs
-            )
+            return await run_action(client.get_organizers_categories_item_id, **kwargs)
         if action == "put_organizers_categories_item_id":
-            return await run_blocking(
-                client.put_organizers_categories_item_id, **kwargs
-            )
+            return await run_action(client.put_organizers_categories_item_id, **kwargs)
         if action == "delete_organizers_categories_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.delete_organizers_categories_item_id, **kwargs
             )
         if action == "get_organizers_categories_slug_category_slug":
-            return await run_blocking(
+            return await run_action(
                 client.get_organizers_categories_slug_category_slug, **kwargs
             )
         if action == "get_organizers_tags":
-            return await run_blocking(client.get_organizers_tags, **kwargs)
+            return await run_action(client.get_organizers_tags, **kwargs)
         if action == "post_organizers_tags":
-            return await run_blocking(client.post_organizers_tags, **kwargs)
+            return await run_action(client.post_organizers_tags, **kwargs)
         if action == "get_empty_tags":
-            return await run_blocking(client.get_empty_tags, **kwargs)
+            return await run_action(client.get_empty_tags, **kwargs)
         if action == "get_organizers_tags_item_id":
-            return await run_blocking(client.get_organizers_tags_item_id, **kwargs)
+            return await run_action(client.get_organizers_tags_item_id, **kwargs)
         if action == "put_organizers_tags_item_id":
-            return await run_blocking(client.put_organizers_tags_item_id, **kwargs)
+            return await run_action(client.put_organizers_tags_item_id, **kwargs)
         if action == "delete_recipe_tag":
-            return await run_blocking(client.delete_recipe_tag, **kwargs)
+            return await run_action(client.delete_recipe_tag, **kwargs)
         if action == "get_organizers_tags_slug_tag_slug":
-            return await run_blocking(
-                client.get_organizers_tags_slug_tag_slug, **kwargs
-            )
+            return await run_action(client.get_organizers_tags_slug_tag_slug, **kwargs)
         if action == "get_organizerss":
-            return await run_blocking(client.get_organizerss, **kwargs)
+            return await run_action(client.get_organizerss, **kwargs)
         if action == "post_organizerss":
-            return await run_blocking(client.post_organizerss, **kwargs)
+            return await run_action(client.post_organizerss, **kwargs)
         if action == "get_organizerss_item_id":
-            return await run_blocking(client.get_organizerss_item_id, **kwargs)
+            return await run_action(client.get_organizerss_item_id, **kwargs)
         if action == "put_organizerss_item_id":
-            return await run_blocking(client.put_organizerss_item_id, **kwargs)
+            return await run_action(client.put_organizerss_item_id, **kwargs)
         if action == "delete_organizerss_item_id":
-            return await run_blocking(client.delete_organizerss_item_id, **kwargs)
+            return await run_action(client.delete_organizerss_item_id, **kwargs)
         if action == "get_organizerss_slug_slug":
-            return await run_blocking(client.get_organizerss_slug_slug, **kwargs)
+            return await run_action(client.get_organizerss_slug_slug, **kwargs)
         raise ValueError(f"Unknown action: {action}")
+
+    @mcp.tool(tags={"organizer"})
+    async def mealie_catalog(
+        kind: str = Field(
+            description="Catalog to read: 'categories', 'tags', 'tools', 'foods', 'units' or 'labels'."
+        ),
+        key: str | None = Field(
+            default=None,
+            description="Id, slug or name to look up; omit to list the whole catalog.",
+        ),
+        params_json: str = Field(
+            default="{}",
+            description='JSON string of call options (e.g. {"fields": ["id", "name"]}).',
+        ),
+        client=Depends(get_async_client),
+        ctx: Context | None = Field(
+            default=None, description="MCP context for progress reporting"
+        ),
+    ) -> dict:
+        """Resolve organizers, foods, units and labels from the in-memory catalog cache.
+
+        The whole list is loaded once and refreshed on TTL or after any write to it.
+        """
+        import json
+
+        try:
+            kwargs = json.loads(params_json) if params_json else {}
+        except Exception:
+            return {"error": "Operation failed"}
+        kwargs = prepare_call(ctx, {k: v for k, v in kwargs.items() if v is not None})
+        if key is None:
+            result = await run_action(client.catalog, kind=kind, **kwargs)
+            return (
+                {"kind": kind, "items": result} if isinstance(result, list) else result
+            )
+        result = await run_action(client.catalog_lookup, kind=kind, key=key, **kwargs)
+        if result is None:
+            return {"error": "not_found", "kind": kind, "key": key}
+        return result
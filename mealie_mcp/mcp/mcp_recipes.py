@@ -4,12 +4,12 @@
 """
 
 from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import run_blocking
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
-from mealie_mcp.auth import get_client
+from mealie_mcp.auth import get_async_client
+from mealie_mcp.dispatch import prepare_call, run_action
 
 VALID_RECIPES_ACTIONS = (
     "get_recipe_formats_and_templates",
@@ -88,14 +88,14 @@ async def mealie_recipes(
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie recipes operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -104,6 +104,7 @@ async def mealie_recipes(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_RECIPES_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -111,137 +112,201 @@ async def mealie_recipes(
         action = resolved
 
         if action == "get_recipe_formats_and_templates":
-            return await run_blocking(client.get_recipe_formats_and_templates, **kwargs)
+            return await run_action(client.get_recipe_formats_and_templates, **kwargs)
         if action == "get_recipe_as_format":
-            return await run_blocking(client.get_recipe_as_format, **kwargs)
+            return await run_action(client.get_recipe_as_format, **kwargs)
         if action == "test_parse_recipe_url":
-            return await run_blocking(client.test_parse_recipe_url, **kwargs)
+            return await run_action(client.test_parse_recipe_url, **kwargs)
         if action == "create_recipe_from_html_or_json":
-            return await run_blocking(client.create_recipe_from_html_or_json, **kwargs)
+            return await run_action(client.create_recipe_from_html_or_json, **kwargs)
         if action == "parse_recipe_url":
-            return await run_blocking(client.parse_recipe_url, **kwargs)
+            return await run_action(client.parse_recipe_url, **kwargs)
         if action == "parse_recipe_url_bulk":
-            return await run_blocking(client.parse_recipe_url_bulk, **kwargs)
+            return await run_action(client.parse_recipe_url_bulk, **kwargs)
         if action == "create_recipe_from_zip":
-            return await run_blocking(client.create_recipe_from_zip, **kwargs)
+            return await run_action(client.create_recipe_from_zip, **kwargs)
         if action == "create_recipe_from_image":
-            return await run_blocking(client.create_recipe_from_image, **kwargs)
+            return await run_action(client.create_recipe_from_image, **kwargs)
         if action == "get_recipes":
-            return await run_blocking(client.get_recipes, **kwargs)
+            return await run_action(client.get_recipes, **kwargs)
         if action == "post_recipes":
-            return await run_blocking(client.post_recipes, **kwargs)
+            return await run_action(client.post_recipes, **kwargs)
         if action == "put_recipes":
-            return await run_blocking(client.put_recipes, **kwargs)
+            return await run_action(client.put_recipes, **kwargs)
         if action == "patch_many":
-            return await run_blocking(client.patch_many, **kwargs)
+            return await run_action(client.patch_many, **kwargs)
         if action == "get_recipes_suggestions":
-            return await run_blocking(client.get_recipes_suggestions, **kwargs)
+            return await run_action(client.get_recipes_suggestions, **kwargs)
         if action == "get_recipes_slug":
-            return await run_blocking(client.get_recipes_slug, **kwargs)
+            return await run_action(client.get_recipes_slug, **kwargs)
         if action == "put_recipes_slug":
-            return await run_blocking(client.put_recipes_slug, **kwargs)
+            return await run_action(client.put_recipes_slug, **kwargs)
         if action == "patch_one":
-            return await run_blocking(client.patch_one, **kwargs)
+            return await run_action(client.patch_one, **kwargs)
         if action == "delete_recipes_slug":
-            return await run_blocking(client.delete_recipes_slug, **kwargs)
+            return await run_action(client.delete_recipes_slug, **kwargs)
         if action == "duplicate_one":
-            return await run_blocking(client.duplicate_one, **kwargs)
+            return await run_action(client.duplicate_one, **kwargs)
         if action == "update_last_made":
-            return await run_blocking(client.update_last_made, **kwargs)
+            return await run_action(client.update_last_made, **kwargs)
         if action == "scrape_image_url":
-            return await run_blocking(client.scrape_image_url, **kwargs)
+            return await run_action(client.scrape_image_url, **kwargs)
         if action == "update_recipe_image":
-            return await run_blocking(client.update_recipe_image, **kwargs)
+            return await run_action(client.update_recipe_image, **kwargs)
         if action == "delete_recipe_image":
-            return await run_blocking(client.delete_recipe_image, **kwargs)
+            return await run_action(client.delete_recipe_image, **kwargs)
         if action == "upload_recipe_asset":
-            return await run_blocking(client.upload_recipe_asset, **kwargs)
+            return await run_action(client.upload_recipe_asset, **kwargs)
         if action == "get_recipe_comments":
-            return await run_blocking(client.get_recipe_comments, **kwargs)
+            return await run_action(client.get_recipe_comments, **kwargs)
         if action == "bulk_tag_recipes":
-            return await run_blocking(client.bulk_tag_recipes, **kwargs)
+            return await run_action(client.bulk_tag_recipes, **kwargs)
         if action == "bulk_settings_recipes":
-            return await run_blocking(client.bulk_settings_recipes, **kwargs)
+            return await run_action(client.bulk_settings_recipes, **kwargs)
         if action == "bulk_categorize_recipes":
-            return await run_blocking(client.bulk_categorize_recipes, **kwargs)
+            return await run_action(client.bulk_categorize_recipes, **kwargs)
         if action == "bulk_delete_recipes":
-            return await run_blocking(client.bulk_delete_recipes, **kwargs)
+            return await run_action(client.bulk_delete_recipes, **kwargs)
         if action == "bulk_export_recipes":
-            return await run_blocking(client.bulk_export_recipes, **kwargs)
+            return await run_action(client.bulk_export_recipes, **kwargs)
         if action == "get_exported_data":
-            return await run_blocking(client.get_exported_data, **kwargs)
+            return await run_action(client.get_exported_data, **kwargs)
         if action == "get_exported_data_token":
-            return await run_blocking(client.get_exported_data_token, **kwargs)
+            return await run_action(client.get_exported_data_token, **kwargs)
         if action == "purge_export_data":
-            return await run_blocking(client.purge_export_data, **kwargs)
+            return await run_action(client.purge_export_data, **kwargs)
         if action == "get_shared_recipe":
-            return await run_blocking(client.get_shared_recipe, **kwargs)
+            return await run_action(client.get_shared_recipe, **kwargs)
         if action == "get_shared_recipe_as_zip":
-            return await run_blocking(client.get_shared_recipe_as_zip, **kwargs)
+            return await run_action(client.get_shared_recipe_as_zip, **kwargs)
         if action == "get_recipes_timeline_events":
-            return await run_blocking(client.get_recipes_timeline_events, **kwargs)
+            return await run_action(client.get_recipes_timeline_events, **kwargs)
         if action == "post_recipes_timeline_events":
-            return await run_blocking(client.post_recipes_timeline_events, **kwargs)
+            return await run_action(client.post_recipes_timeline_events, **kwargs)
         if action == "get_recipes_timeline_events_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.get_recipes_timeline_events_item_id, **kwargs
             )
         if action == "put_recipes_timeline_events_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.put_recipes_timeline_events_item_id, **kwargs
             )
         if action == "delete_recipes_timeline_events_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.delete_recipes_timeline_events_item_id, **kwargs
             )
         if action == "update_event_image":
-            return await run_blocking(client.update_event_image, **kwargs)
+            return await run_action(client.update_event_image, **kwargs)
         if action == "get_comments":
-            return await run_blocking(client.get_comments, **kwargs)
+            return await run_action(client.get_comments, **kwargs)
         if action == "post_comments":
-            return await run_blocking(client.post_comments, **kwargs)
+            return await run_action(client.post_comments, **kwargs)
         if action == "get_comments_item_id":
-            return await run_blocking(client.get_comments_item_id, **kwargs)
+            return await run_action(client.get_comments_item_id, **kwargs)
         if action == "put_comments_item_id":
-            return await run_blocking(client.put_comments_item_id, **kwargs)
+            return await run_action(client.put_comments_item_id, **kwargs)
         if action == "post_parser_ingredient":
-            return await run_blocking(client.post_parser_ingredient, **kwargs)
+            return await run_action(client.post_parser_ingredient, **kwargs)
         if action == "parse_ingredient":
-            return await run_blocking(client.parse_ingredient, **kwargs)
+            return await run_action(client.parse_ingredient, **kwargs)
         if action == "parse_ingredients":
-            return await run_blocking(client.parse_ingredients, **kwargs)
+            return await run_action(client.parse_ingredients, **kwargs)
         if action == "get_foods":
-            return await run_blocking(client.get_foods, **kwargs)
+            return await run_action(client.get_foods, **kwargs)
         if action == "post_foods":
-            return await run_blocking(client.post_foods, **kwargs)
+            return await run_action(client.post_foods, **kwargs)
         if action == "put_foods_merge":
-            return await run_blocking(client.put_foods_merge, **kwargs)
+            return await run_action(client.put_foods_merge, **kwargs)
         if action == "get_foods_item_id":
-            return await run_blocking(client.get_foods_item_id, **kwargs)
+            return await run_action(client.get_foods_item_id, **kwargs)
         if action == "put_foods_item_id":
-            return await run_blocking(client.put_foods_item_id, **kwargs)
+            return await run_action(client.put_foods_item_id, **kwargs)
         if action == "delete_foods_item_id":
-            return await run_blocking(client.delete_foods_item_id, **kwargs)
+            return await run_action(client.delete_foods_item_id, **kwargs)
         if action == "get_units":
-            return await run_blocking(client.get_units, **kwargs)
+            return await run_action(client.get_units, **kwargs)
         if action == "post_units":
-            return await run_blocking(client.post_units, **kwargs)
+            return await run_action(client.post_units, **kwargs)
         if action == "put_units_merge":
-            return await run_blocking(client.put_units_merge, **kwargs)
+            return await run_action(client.put_units_merge, **kwargs)
         if action == "get_units_item_id":
-            return await run_blocking(client.get_units_item_id, **kwargs)
+            return await run_action(client.get_units_item_id, **kwargs)
         if action == "put_units_item_id":
-            return await run_blocking(client.put_units_item_id, **kwargs)
+            return await run_action(client.put_units_item_id, **kwargs)
         if action == "delete_units_item_id":
-            return await run_blocking(client.delete_units_item_id, **kwargs)
+            return await run_action(client.delete_units_item_id, **kwargs)
         if action == "get_recipe_img":
-            return await run_blocking(client.get_recipe_img, **kwargs)
+            return await run_action(client.get_recipe_img, **kwargs)
         if action == "get_recipe_timeline_event_img":
-            return await run_blocking(client.get_recipe_timeline_event_img, **kwargs)
+            return await run_action(client.get_recipe_timeline_event_img, **kwargs)
         if action == "get_recipe_asset":
-            return await run_blocking(client.get_recipe_asset, **kwargs)
+            return await run_action(client.get_recipe_asset, **kwargs)
         if action == "get_user_image":
-            return await run_blocking(client.get_user_image, **kwargs)
+            return await run_action(client.get_user_image, **kwargs)
         if action == "get_validation_text":
-            return await run_blocking(client.get_validation_text, **kwargs)
+            return await run_action(client.get_validation_text, **kwargs)
         raise ValueError(f"Unknown action: {action}")
+
+    @mcp.tool(tags={"recipes"})
+    async def mealie_recipes_batch(
+        slugs: list[str] = Field(
+            description="Recipe slugs or ids to fetch; duplicates are fetched once."
+        ),
+        concurrency: int = Field(
+            default=8, description="Maximum concurrent requests (1-32)."
+        ),
+        params_json: str = Field(
+            default="{}",
+            description='JSON string of call options (e.g. {"timeout": 30}).',
+        ),
+        client=Depends(get_async_client),
+        ctx: Context | None = Field(
+            default=None, description="MCP context for progress reporting"
+        ),
+    ) -> dict:
+        """Fetch full recipe bodies for many slugs in one call.
+
+        Returns ``{"recipes": {slug: recipe}, "slugs": {key: slug}, "errors":
+        {key: error}, "requested", "unique"}``: recipes are keyed by slug even when
+        requested by id; one failing key does not fail the batch.
+        """
+        if ctx:
+            await ctx.info("Fetching recipes...")
+        import json
+
+        try:
+            kwargs = json.loads(params_json) if params_json else {}
+        except Exception:
+            return {"error": "Operation failed"}
+        kwargs = prepare_call(ctx, {k: v for k, v in kwargs.items() if v is not None})
+        return await run_action(
+            client.get_recipes_batch, slugs=slugs, concurrency=concurrency, **kwargs
+        )
+
+    @mcp.tool(tags={"recipes"})
+    async def mealie_recipe_ids(
+        keys: list[str] = Field(
+            description="Recipe slugs and/or ids to translate into each other."
+        ),
+        params_json: str = Field(
+            default="{}",
+            description='JSON string of call options (e.g. {"timeout": 30}).',
+        ),
+        client=Depends(get_async_client),
+        ctx: Context | None = Field(
+            default=None, description="MCP context for progress reporting"
+        ),
+    ) -> dict:
+        """Resolve recipe slugs to ids and ids to slugs without fetching recipes.
+
+        Returns ``{"resolved": {key: {"id", "slug"}}, "missing": [key, ...]}`` from
+        the in-memory index; unknown keys are looked up in Mealie once.
+        """
+        import json
+
+        try:
+            kwargs = json.loads(params_json) if params_json else {}
+        except Exception:
+            return {"error": "Operation failed"}
+        kwargs = prepare_call(ctx, {k: v for k, v in kwargs.items() if v is not None})
+        return await run_action(client.resolve_recipes, keys=keys, **kwargs)
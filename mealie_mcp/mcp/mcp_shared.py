@@ -4,12 +4,12 @@
 """
 
 from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import run_blocking
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
-from mealie_mcp.auth import get_client
+from mealie_mcp.auth import get_async_client
+from mealie_mcp.dispatch import prepare_call, run_action
 
 VALID_SHARED_ACTIONS = (
     "get_shared_recipes",
@@ -28,14 +28,14 @@ async def mealie_shared(
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie shared operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -44,6 +44,7 @@ async def mealie_shared(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_SHARED_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -51,11 +52,11 @@ async def mealie_shared(
         action = resolved
 
         if action == "get_shared_recipes":
-            return await run_blocking(client.get_shared_recipes, **kwargs)
+            return await run_action(client.get_shared_recipes, **kwargs)
         if action == "post_shared_recipes":
-            return await run_blocking(client.post_shared_recipes, **kwargs)
+            return await run_action(client.post_shared_recipes, **kwargs)
         if action == "get_shared_recipes_item_id":
-            return await run_blocking(client.get_shared_recipes_item_id, **kwargs)
+            return await run_action(client.get_shared_recipes_item_id, **kwargs)
         if action == "delete_shared_recipes_item_id":
-            return await run_blocking(client.delete_shared_recipes_item_id, **kwargs)
+            return await run_action(client.delete_shared_recipes_item_id, **kwargs)
         raise ValueError(f"Unknown action: {action}")
@@ -4,12 +4,12 @@
 """
 
 from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import run_blocking
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
-from mealie_mcp.auth import get_client
+from mealie_mcp.auth import get_async_client
+from mealie_mcp.dispatch import prepare_call, run_action
 
 VALID_USERS_ACTIONS = (
     "get_token",
@@ -46,14 +46,14 @@ async def mealie_users(
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie users operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -62,6 +62,7 @@ async def mealie_users(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_USERS_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -69,49 +70,49 @@ async def mealie_users(
         action = resolved
 
         if action == "get_token":
-            return await run_blocking(client.get_token, **kwargs)
+            return await run_action(client.get_token, **kwargs)
         if action == "oauth_login":
-            return await run_blocking(client.oauth_login, **kwargs)
+            return await run_action(client.oauth_login, **kwargs)
         if action == "oauth_callback":
-            return await run_blocking(client.oauth_callback, **kwargs)
+            return await run_action(client.oauth_callback, **kwargs)
         if action == "refresh_token":
-            return await run_blocking(client.refresh_token, **kwargs)
+            return await run_action(client.refresh_token, **kwargs)
         if action == "logout":
-            return await run_blocking(client.logout, **kwargs)
+            return await run_action(client.logout, **kwargs)
         if action == "register_new_user":
-            return await run_blocking(client.register_new_user, **kwargs)
+            return await run_action(client.register_new_user, **kwargs)
         if action == "get_logged_in_user":
-            return await run_blocking(client.get_logged_in_user, **kwargs)
+            return await run_action(client.get_logged_in_user, **kwargs)
         if action == "get_logged_in_user_ratings":
-            return await run_blocking(client.get_logged_in_user_ratings, **kwargs)
+            return await run_action(client.get_logged_in_user_ratings, **kwargs)
         if action == "get_logged_in_user_rating_for_recipe":
-            return await run_blocking(
+            return await run_action(
                 client.get_logged_in_user_rating_for_recipe, **kwargs
             )
         if action == "get_logged_in_user_favorites":
-            return await run_blocking(client.get_logged_in_user_favorites, **kwargs)
+            return await run_action(client.get_logged_in_user_favorites, **kwargs)
         if action == "update_password":
-            return await run_blocking(client.update_password, **kwargs)
+            return await run_action(client.update_password, **kwargs)
         if action == "update_user":
-            return await run_blocking(client.update_user, **kwargs)
+            return await run_action(client.update_user, **kwargs)
         if action == "forgot_password":
-            return await run_blocking(client.forgot_password, **kwargs)
+            return await run_action(client.forgot_password, **kwargs)
         if action == "reset_password":
-            return await run_blocking(client.reset_password, **kwargs)
+            return await run_action(client.reset_password, **kwargs)
         if action == "update_user_image":
-            return await run_blocking(client.update_user_image, **kwargs)
+            return await run_action(client.update_user_image, **kwargs)
         if action == "create":
-            return await run_blocking(client.create, **kwargs)
+            return await run_action(client.create, **kwargs)
         if action == "delete":
-            return await run_blocking(client.delete, **kwargs)
+            return await run_action(client.delete, **kwargs)
         if action == "get_ratings":
-            return await run_blocking(client.get_ratings, **kwargs)
+            return await run_action(client.get_ratings, **kwargs)
         if action == "get_favorites":
-            return await run_blocking(client.get_favorites, **kwargs)
+            return await run_action(client.get_favorites, **kwargs)
         if action == "set_rating":
-            return await run_blocking(client.set_rating, **kwargs)
+            return await run_action(client.set_rating, **kwargs)
         if action == "add_favorite":
-            return await run_blocking(client.add_favorite, **kwargs)
+            return await run_action(client.add_favorite, **kwargs)
         if action == "remove_favorite":
-            return await run_blocking(client.remove_favorite, **kwargs)
+            return await run_action(client.remove_favorite, **kwargs)
         raise ValueError(f"Unknown action: {action}")
@@ -4,12 +4,12 @@
 """
 
 from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import run_blocking
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from pydantic import Field
 
-from mealie_mcp.auth import get_client
+from mealie_mcp.auth import get_async_client
+from mealie_mcp.dispatch import prepare_call, run_action
 
 VALID_UTILS_ACTIONS = ("download_file",)
 
@@ -23,14 +23,14 @@ async def mealie_utils(
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie utils operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -39,6 +39,7 @@ async def mealie_utils(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_UTILS_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -46,5 +47,5 @@ async def mealie_utils(
         action = resolved
 
         if action == "download_file":
-            return await run_blocking(client.download_file, **kwargs)
+            return await run_action(client.download_file, **kwargs)
         raise ValueError(f"Unknown action: {action}")
@@ -3,7 +3,6 @@
 
 from agent_utilities.core.config import load_config
 from agent_utilities.mcp.action_dispatch import resolve_action
-from agent_utilities.mcp.concurrency import run_blocking
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import Depends
 from fastmcp.utilities.logging import get_logger
@@ -22,6 +21,7 @@
 warnings.filterwarnings("ignore", message=".*urllib3.*or chardet.*")
 warnings.filterwarnings("ignore", message=".*urllib3.*or charset_normalizer.*")
 
+import contextlib
 import logging
 import sys
 from typing import Any
@@ -31,8 +31,19 @@
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
+from mealie_mcp.api.errors import CircuitOpenError, DeadlineExceeded
+from mealie_mcp.api.limiter import BULK
+from mealie_mcp.api.pagination import page_items
 from mealie_mcp.api_client import Api
-from mealie_mcp.auth import get_client
+from mealie_mcp.auth import get_async_client, get_client
+from mealie_mcp.continuation import result_budget
+from mealie_mcp.dispatch import (
+    prepare_call,
+    projection_stats,
+    report_progress,
+    run_action,
+)
+from mealie_mcp.mirror import current_mirror, start_mirror
 
 __version__ = "2.0.0"
 
@@ -43,6 +54,7 @@
 VALID_APP_ACTIONS = (
     "get_startup_info",
     "get_app_theme",
+    "get_client_stats",
 )
 
 
@@ -50,19 +62,19 @@ def register_app_tools(mcp: FastMCP):
     @mcp.tool(tags={"app"})
     async def mealie_app(
         action: str = Field(
-            description="Action to perform. Must be one of: 'get_startup_info', 'get_app_theme'"
+            description="Action to perform. Must be one of: 'get_startup_info', 'get_app_theme', 'get_client_stats'"
         ),
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie app operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -71,6 +83,7 @@ async def mealie_app(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_APP_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -78,9 +91,16 @@ async def mealie_app(
         action = resolved
 
         if action == "get_startup_info":
-            return await run_blocking(client.get_startup_info, **kwargs)
+            return await run_action(client.get_startup_info, **kwargs)
         if action == "get_app_theme":
-            return await run_blocking(client.get_app_theme, **kwargs)
+            return await run_action(client.get_app_theme, **kwargs)
+        if action == "get_client_stats":
+            return {
+                **client.client_stats(),
+                "projection": projection_stats(),
+                "cursors": result_budget().snapshot(),
+                "mirror": mirror.snapshot() if (mirror := current_mirror()) else None,
+            }
         raise ValueError(f"Unknown action: {action}")
 
 
@@ -119,14 +139,14 @@ async def mealie_users(
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie users operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -135,6 +155,7 @@ async def mealie_users(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_USERS_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -142,51 +163,51 @@ async def mealie_users(
         action = resolved
 
         if action == "get_token":
-            return await run_blocking(client.get_token, **kwargs)
+            return await run_action(client.get_token, **kwargs)
         if action == "oauth_login":
-            return await run_blocking(client.oauth_login, **kwargs)
+            return await run_action(client.oauth_login, **kwargs)
         if action == "oauth_callback":
-            return await run_blocking(client.oauth_callback, **kwargs)
+            return await run_action(client.oauth_callback, **kwargs)
         if action == "refresh_token":
-            return await run_blocking(client.refresh_token, **kwargs)
+            return await run_action(client.refresh_token, **kwargs)
         if action == "logout":
-            return await run_blocking(client.logout, **kwargs)
+            return await run_action(client.logout, **kwargs)
         if action == "register_new_user":
-            return await run_blocking(client.register_new_user, **kwargs)
+            return await run_action(client.register_new_user, **kwargs)
         if action == "get_logged_in_user":
-            return await run_blocking(client.get_logged_in_user, **kwargs)
+            return await run_action(client.get_logged_in_user, **kwargs)
         if action == "get_logged_in_user_ratings":
-            return await run_blocking(client.get_logged_in_user_ratings, **kwargs)
+            return await run_action(client.get_logged_in_user_ratings, **kwargs)
         if action == "get_logged_in_user_rating_for_recipe":
-            return await run_blocking(
+            return await run_action(
                 client.get_logged_in_user_rating_for_recipe, **kwargs
             )
         if action == "get_logged_in_user_favorites":
-            return await run_blocking(client.get_logged_in_user_favorites, **kwargs)
+            return await run_action(client.get_logged_in_user_favorites, **kwargs)
         if action == "update_password":
-            return await run_blocking(client.update_password, **kwargs)
+            return await run_action(client.update_password, **kwargs)
         if action == "update_user":
-            return await run_blocking(client.update_user, **kwargs)
+            return await run_action(client.update_user, **kwargs)
         if action == "forgot_password":
-            return await run_blocking(client.forgot_password, **kwargs)
+            return await run_action(client.forgot_password, **kwargs)
         if action == "reset_password":
-            return await run_blocking(client.reset_password, **kwargs)
+            return await run_action(client.reset_password, **kwargs)
         if action == "update_user_image":
-            return await run_blocking(client.update_user_image, **kwargs)
+            return await run_action(client.update_user_image, **kwargs)
         if action == "create":
-            return await run_blocking(client.create, **kwargs)
+            return await run_action(client.create, **kwargs)
         if action == "delete":
-            return await run_blocking(client.delete, **kwargs)
+            return await run_action(client.delete, **kwargs)
         if action == "get_ratings":
-            return await run_blocking(client.get_ratings, **kwargs)
+            return await run_action(client.get_ratings, **kwargs)
         if action == "get_favorites":
-            return await run_blocking(client.get_favorites, **kwargs)
+            return await run_action(client.get_favorites, **kwargs)
         if action == "set_rating":
-            return await run_blocking(client.set_rating, **kwargs)
+            return await run_action(client.set_rating, **kwargs)
         if action == "add_favorite":
-            return await run_blocking(client.add_favorite, **kwargs)
+            return await run_action(client.add_favorite, **kwargs)
         if action == "remove_favorite":
-            return await run_blocking(client.remove_favorite, **kwargs)
+            return await run_action(client.remove_favorite, **kwargs)
         raise ValueError(f"Unknown action: {action}")
 
 
@@ -267,14 +288,14 @@ async def mealie_households(
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie households operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -283,6 +304,7 @@ async def mealie_households(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(
             action, VALID_HOUSEHOLDS_ACTIONS, service="mealie-mcp"
@@ -292,177 +314,175 @@ async def mealie_households(
         action = resolved
 
         if action == "get_households_cookbooks":
-            return await run_blocking(client.get_households_cookbooks, **kwargs)
+            return await run_action(client.get_households_cookbooks, **kwargs)
         if action == "post_households_cookbooks":
-            return await run_blocking(client.post_households_cookbooks, **kwargs)
+            return await run_action(client.post_households_cookbooks, **kwargs)
         if action == "put_households_cookbooks":
-            return await run_blocking(client.put_households_cookbooks, **kwargs)
+            return await run_action(client.put_households_cookbooks, **kwargs)
         if action == "get_households_cookbooks_item_id":
-            return await run_blocking(client.get_households_cookbooks_item_id, **kwargs)
+            return await run_action(client.get_households_cookbooks_item_id, **kwargs)
         if action == "put_households_cookbooks_item_id":
-            return await run_blocking(client.put_households_cookbooks_item_id, **kwargs)
+            return await run_action(client.put_households_cookbooks_item_id, **kwargs)
         if action == "delete_households_cookbooks_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.delete_households_cookbooks_item_id, **kwargs
             )
         if action == "get_households_events_notifications":
-            return await run_blocking(
+            return await run_action(
                 client.get_households_events_notifications, **kwargs
             )
         if action == "post_households_events_notifications":
-            return await run_blocking(
+            return await run_action(
                 client.post_households_events_notifications, **kwargs
             )
         if action == "get_households_events_notifications_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.get_households_events_notifications_item_id, **kwargs
             )
         if action == "put_households_events_notifications_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.put_households_events_notifications_item_id, **kwargs
             )
         if action == "delete_households_events_notifications_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.delete_households_events_notifications_item_id, **kwargs
             )
         if action == "test_notification":
-            return await run_blocking(client.test_notification, **kwargs)
+            return await run_action(client.test_notification, **kwargs)
         if action == "get_households_recipe_actions":
-            return await run_blocking(client.get_households_recipe_actions, **kwargs)
+            return await run_action(client.get_households_recipe_actions, **kwargs)
         if action == "post_households_recipe_actions":
-            return await run_blocking(client.post_households_recipe_actions, **kwargs)
+            return await run_action(client.post_households_recipe_actions, **kwargs)
         if action == "get_households_recipe_actions_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.get_households_recipe_actions_item_id, **kwargs
             )
         if action == "put_households_recipe_actions_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.put_households_recipe_actions_item_id, **kwargs
             )
         if action == "delete_households_recipe_actions_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.delete_households_recipe_actions_item_id, **kwargs
             )
         if action == "trigger_action":
-            return await run_blocking(client.trigger_action, **kwargs)
+            return await run_action(client.trigger_action, **kwargs)
         if action == "get_logged_in_user_household":
-            return await run_blocking(client.get_logged_in_user_household, **kwargs)
+            return await run_action(client.get_logged_in_user_household, **kwargs)
         if action == "get_household_recipe":
-            return await run_blocking(client.get_household_recipe, **kwargs)
+            return await run_action(client.get_household_recipe, **kwargs)
         if action == "get_household_members":
-            return await run_blocking(client.get_household_members, **kwargs)
+            return await run_action(client.get_household_members, **kwargs)
         if action == "get_household_preferences":
-            return await run_blocking(client.get_household_preferences, **kwargs)
+            return await run_action(client.get_household_preferences, **kwargs)
         if action == "update_household_preferences":
-            return await run_blocking(client.update_household_preferences, **kwargs)
+            return await run_action(client.update_household_preferences, **kwargs)
         if action == "set_member_permissions":
-            return await run_blocking(client.set_member_permissions, **kwargs)
+            return await run_action(client.set_member_permissions, **kwargs)
         if action == "get_statistics":
-            return await run_blocking(client.get_statistics, **kwargs)
+            return await run_action(client.get_statistics, **kwargs)
         if action == "get_invite_tokens":
-            return await run_blocking(client.get_invite_tokens, **kwargs)
+            return await run_action(client.get_invite_tokens, **kwargs)
         if action == "create_invite_token":
-            return await run_blocking(client.create_invite_token, **kwargs)
+            return await run_action(client.create_invite_token, **kwargs)
         if action == "email_invitation":
-            return await run_blocking(client.email_invitation, **kwargs)
+            return await run_action(client.email_invitation, **kwargs)
         if action == "get_households_shopping_lists":
-            return await run_blocking(client.get_households_shopping_lists, **kwargs)
+            return await run_action(client.get_households_shopping_lists, **kwargs)
         if action == "post_households_shopping_lists":
-            return await run_blocking(client.post_households_shopping_lists, **kwargs)
+            return await run_action(client.post_households_shopping_lists, **kwargs)
         if action == "get_households_shopping_lists_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.get_households_shopping_lists_item_id, **kwargs
             )
         if action == "put_households_shopping_lists_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.put_households_shopping_lists_item_id, **kwargs
             )
         if action == "delete_households_shopping_lists_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.delete_households_shopping_lists_item_id, **kwargs
             )
         if action == "update_label_settings":
-            return await run_blocking(client.update_label_settings, **kwargs)
+            return await run_action(client.update_label_settings, **kwargs)
         if action == "add_recipe_ingredients_to_list":
-            return await run_blocking(client.add_recipe_ingredients_to_list, **kwargs)
+            return await run_action(client.add_recipe_ingredients_to_list, **kwargs)
         if action == "add_single_recipe_ingredients_to_list":
-            return await run_blocking(
+            return await run_action(
                 client.add_single_recipe_ingredients_to_list, **kwargs
             )
         if action == "remove_recipe_ingredients_from_list":
-            return await run_blocking(
+            return await run_action(
                 client.remove_recipe_ingredients_from_list, **kwargs
             )
         if action == "get_households_shopping_items":
-            return await run_blocking(client.get_households_shopping_items, **kwargs)
+            return await run_action(client.get_households_shopping_items, **kwargs)
         if action == "post_households_shopping_items":
-            return await run_blocking(client.post_households_shopping_items, **kwargs)
+            return await run_action(client.post_households_shopping_items, **kwargs)
         if action == "put_households_shopping_items":
-            return await run_blocking(client.put_households_shopping_items, **kwargs)
+            return await run_action(client.put_households_shopping_items, **kwargs)
         if action == "delete_households_shopping_items":
-            return await run_blocking(client.delete_households_shopping_items, **kwargs)
+            return await run_action(client.delete_households_shopping_items, **kwargs)
         if action == "post_households_shopping_items_create_bulk":
-            return await run_blocking(
+            return await run_action(
                 client.post_households_shopping_items_create_bulk, **kwargs
             )
         if action == "get_households_shopping_items_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.get_households_shopping_items_item_id, **kwargs
             )
         if action == "put_households_shopping_items_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.put_households_shopping_items_item_id, **kwargs
             )
         if action == "delete_households_shopping_items_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.delete_households_shopping_items_item_id, **kwargs
             )
         if action == "get_households_webhooks":
-            return await run_blocking(client.get_households_webhooks, **kwargs)
+            return await run_action(client.get_households_webhooks, **kwargs)
         if action == "post_households_webhooks":
-            return await run_blocking(client.post_households_webhooks, **kwargs)
+            return await run_action(client.post_households_webhooks, **kwargs)
         if action == "rerun_webhooks":
-            return await run_blocking(client.rerun_webhooks, **kwargs)
+            return await run_action(client.rerun_webhooks, **kwargs)
         if action == "get_households_webhooks_item_id":
-            return await run_blocking(client.get_households_webhooks_item_id, **kwargs)
+            return await run_action(client.get_households_webhooks_item_id, **kwargs)
         if action == "put_households_webhooks_item_id":
-            return await run_blocking(client.put_households_webhooks_item_id, **kwargs)
+            return await run_action(client.put_households_webhooks_item_id, **kwargs)
         if action == "delete_households_webhooks_item_id":
-            return await run_blocking(
-                client.delete_households_webhooks_item_id, **kwargs
-            )
+            return await run_action(client.delete_households_webhooks_item_id, **kwargs)
         if action == "test_one":
-            return await run_blocking(client.test_one, **kwargs)
+            return await run_action(client.test_one, **kwargs)
         if action == "get_households_mealplans_rules":
-            return await run_blocking(client.get_households_mealplans_rules, **kwargs)
+            return await run_action(client.get_households_mealplans_rules, **kwargs)
         if action == "post_households_mealplans_rules":
-            return await run_blocking(client.post_households_mealplans_rules, **kwargs)
+            return await run_action(client.post_households_mealplans_rules, **kwargs)
         if action == "get_households_mealplans_rules_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.get_households_mealplans_rules_item_id, **kwargs
             )
         if action == "put_households_mealplans_rules_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.put_households_mealplans_rules_item_id, **kwargs
             )
         if action == "delete_households_mealplans_rules_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.delete_households_mealplans_rules_item_id, **kwargs
             )
         if action == "get_households_mealplans":
-            return await run_blocking(client.get_households_mealplans, **kwargs)
+            return await run_action(client.get_households_mealplans, **kwargs)
         if action == "post_households_mealplans":
-            return await run_blocking(client.post_households_mealplans, **kwargs)
+            return await run_action(client.post_households_mealplans, **kwargs)
         if action == "get_todays_meals":
-            return await run_blocking(client.get_todays_meals, **kwargs)
+            return await run_action(client.get_todays_meals, **kwargs)
         if action == "create_random_meal":
-            return await run_blocking(client.create_random_meal, **kwargs)
+            return await run_action(client.create_random_meal, **kwargs)
         if action == "get_households_mealplans_item_id":
-            return await run_blocking(client.get_households_mealplans_item_id, **kwargs)
+            return await run_action(client.get_households_mealplans_item_id, **kwargs)
         if action == "put_households_mealplans_item_id":
-            return await run_blocking(client.put_households_mealplans_item_id, **kwargs)
+            return await run_action(client.put_households_mealplans_item_id, **kwargs)
         if action == "delete_households_mealplans_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.delete_households_mealplans_item_id, **kwargs
             )
         raise ValueError(f"Unknown action: {action}")
@@ -501,14 +521,14 @@ async def mealie_groups(
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie groups operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -517,6 +537,7 @@ async def mealie_groups(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_GROUPS_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -524,45 +545,45 @@ async def mealie_groups(
         action = resolved
 
         if action == "get_all_households":
-            return await run_blocking(client.get_all_households, **kwargs)
+            return await run_action(client.get_all_households, **kwargs)
         if action == "get_one_household":
-            return await run_blocking(client.get_one_household, **kwargs)
+            return await run_action(client.get_one_household, **kwargs)
         if action == "get_logged_in_user_group":
-            return await run_blocking(client.get_logged_in_user_group, **kwargs)
+            return await run_action(client.get_logged_in_user_group, **kwargs)
         if action == "get_group_members":
-            return await run_blocking(client.get_group_members, **kwargs)
+            return await run_action(client.get_group_members, **kwargs)
         if action == "get_group_member":
-            return await run_blocking(client.get_group_member, **kwargs)
+            return await run_action(client.get_group_member, **kwargs)
         if action == "get_group_preferences":
-            return await run_blocking(client.get_group_preferences, **kwargs)
+            return await run_action(client.get_group_preferences, **kwargs)
         if action == "update_group_preferences":
-            return await run_blocking(client.update_group_preferences, **kwargs)
+            return await run_action(client.update_group_preferences, **kwargs)
         if action == "get_storage":
-            return await run_blocking(client.get_storage, **kwargs)
+            return await run_action(client.get_storage, **kwargs)
         if action == "start_data_migration":
-            return await run_blocking(client.start_data_migration, **kwargs)
+            return await run_action(client.start_data_migration, **kwargs)
         if action == "get_groups_reports":
-            return await run_blocking(client.get_groups_reports, **kwargs)
+            return await run_action(client.get_groups_reports, **kwargs)
         if action == "get_groups_reports_item_id":
-            return await run_blocking(client.get_groups_reports_item_id, **kwargs)
+            return await run_action(client.get_groups_reports_item_id, **kwargs)
         if action == "delete_groups_reports_item_id":
-            return await run_blocking(client.delete_groups_reports_item_id, **kwargs)
+            return await run_action(client.delete_groups_reports_item_id, **kwargs)
         if action == "get_groups_labels":
-            return await run_blocking(client.get_groups_labels, **kwargs)
+            return await run_action(client.get_groups_labels, **kwargs)
         if action == "post_groups_labels":
-            return await run_blocking(client.post_groups_labels, **kwargs)
+            return await run_action(client.post_groups_labels, **kwargs)
         if action == "get_groups_labels_item_id":
-            return await run_blocking(client.get_groups_labels_item_id, **kwargs)
+            return await run_action(client.get_groups_labels_item_id, **kwargs)
         if action == "put_groups_labels_item_id":
-            return await run_blocking(client.put_groups_labels_item_id, **kwargs)
+            return await run_action(client.put_groups_labels_item_id, **kwargs)
         if action == "delete_groups_labels_item_id":
-            return await run_blocking(client.delete_groups_labels_item_id, **kwargs)
+            return await run_action(client.delete_groups_labels_item_id, **kwargs)
         if action == "seed_foods":
-            return await run_blocking(client.seed_foods, **kwargs)
+            return await run_action(client.seed_foods, **kwargs)
         if action == "seed_labels":
-            return await run_blocking(client.seed_labels, **kwargs)
+            return await run_action(client.seed_labels, **kwargs)
         if action == "seed_units":
-            return await run_blocking(client.seed_units, **kwargs)
+            return await run_action(client.seed_units, **kwargs)
         raise ValueError(f"Unknown action: {action}")
 
 
@@ -643,14 +664,14 @@ async def mealie_recipes(
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie recipes operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -659,6 +680,7 @@ async def mealie_recipes(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_RECIPES_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -666,141 +688,205 @@ async def mealie_recipes(
         action = resolved
 
         if action == "get_recipe_formats_and_templates":
-            return await run_blocking(client.get_recipe_formats_and_templates, **kwargs)
+            return await run_action(client.get_recipe_formats_and_templates, **kwargs)
         if action == "get_recipe_as_format":
-            return await run_blocking(client.get_recipe_as_format, **kwargs)
+            return await run_action(client.get_recipe_as_format, **kwargs)
         if action == "test_parse_recipe_url":
-            return await run_blocking(client.test_parse_recipe_url, **kwargs)
+            return await run_action(client.test_parse_recipe_url, **kwargs)
         if action == "create_recipe_from_html_or_json":
-            return await run_blocking(client.create_recipe_from_html_or_json, **kwargs)
+            return await run_action(client.create_recipe_from_html_or_json, **kwargs)
         if action == "parse_recipe_url":
-            return await run_blocking(client.parse_recipe_url, **kwargs)
+            return await run_action(client.parse_recipe_url, **kwargs)
         if action == "parse_recipe_url_bulk":
-            return await run_blocking(client.parse_recipe_url_bulk, **kwargs)
+            return await run_action(client.parse_recipe_url_bulk, **kwargs)
         if action == "create_recipe_from_zip":
-            return await run_blocking(client.create_recipe_from_zip, **kwargs)
+            return await run_action(client.create_recipe_from_zip, **kwargs)
         if action == "create_recipe_from_image":
-            return await run_blocking(client.create_recipe_from_image, **kwargs)
+            return await run_action(client.create_recipe_from_image, **kwargs)
         if action == "get_recipes":
-            return await run_blocking(client.get_recipes, **kwargs)
+            return await run_action(client.get_recipes, **kwargs)
         if action == "post_recipes":
-            return await run_blocking(client.post_recipes, **kwargs)
+            return await run_action(client.post_recipes, **kwargs)
         if action == "put_recipes":
-            return await run_blocking(client.put_recipes, **kwargs)
+            return await run_action(client.put_recipes, **kwargs)
         if action == "patch_many":
-            return await run_blocking(client.patch_many, **kwargs)
+            return await run_action(client.patch_many, **kwargs)
         if action == "get_recipes_suggestions":
-            return await run_blocking(client.get_recipes_suggestions, **kwargs)
+            return await run_action(client.get_recipes_suggestions, **kwargs)
         if action == "get_recipes_slug":
-            return await run_blocking(client.get_recipes_slug, **kwargs)
+            return await run_action(client.get_recipes_slug, **kwargs)
         if action == "put_recipes_slug":
-            return await run_blocking(client.put_recipes_slug, **kwargs)
+            return await run_action(client.put_recipes_slug, **kwargs)
         if action == "patch_one":
-            return await run_blocking(client.patch_one, **kwargs)
+            return await run_action(client.patch_one, **kwargs)
         if action == "delete_recipes_slug":
-            return await run_blocking(client.delete_recipes_slug, **kwargs)
+            return await run_action(client.delete_recipes_slug, **kwargs)
         if action == "duplicate_one":
-            return await run_blocking(client.duplicate_one, **kwargs)
+            return await run_action(client.duplicate_one, **kwargs)
         if action == "update_last_made":
-            return await run_blocking(client.update_last_made, **kwargs)
+            return await run_action(client.update_last_made, **kwargs)
         if action == "scrape_image_url":
-            return await run_blocking(client.scrape_image_url, **kwargs)
+            return await run_action(client.scrape_image_url, **kwargs)
         if action == "update_recipe_image":
-            return await run_blocking(client.update_recipe_image, **kwargs)
+            return await run_action(client.update_recipe_image, **kwargs)
         if action == "delete_recipe_image":
-            return await run_blocking(client.delete_recipe_image, **kwargs)
+            return await run_action(client.delete_recipe_image, **kwargs)
         if action == "upload_recipe_asset":
-            return await run_blocking(client.upload_recipe_asset, **kwargs)
+            return await run_action(client.upload_recipe_asset, **kwargs)
         if action == "get_recipe_comments":
-            return await run_blocking(client.get_recipe_comments, **kwargs)
+            return await run_action(client.get_recipe_comments, **kwargs)
         if action == "bulk_tag_recipes":
-            return await run_blocking(client.bulk_tag_recipes, **kwargs)
+            return await run_action(client.bulk_tag_recipes, **kwargs)
         if action == "bulk_settings_recipes":
-            return await run_blocking(client.bulk_settings_recipes, **kwargs)
+            return await run_action(client.bulk_settings_recipes, **kwargs)
         if action == "bulk_categorize_recipes":
-            return await run_blocking(client.bulk_categorize_recipes, **kwargs)
+            return await run_action(client.bulk_categorize_recipes, **kwargs)
         if action == "bulk_delete_recipes":
-            return await run_blocking(client.bulk_delete_recipes, **kwargs)
+            return await run_action(client.bulk_delete_recipes, **kwargs)
         if action == "bulk_export_recipes":
-            return await run_blocking(client.bulk_export_recipes, **kwargs)
+            return await run_action(client.bulk_export_recipes, **kwargs)
         if action == "get_exported_data":
-            return await run_blocking(client.get_exported_data, **kwargs)
+            return await run_action(client.get_exported_data, **kwargs)
         if action == "get_exported_data_token":
-            return await run_blocking(client.get_exported_data_token, **kwargs)
+            return await run_action(client.get_exported_data_token, **kwargs)
         if action == "purge_export_data":
-            return await run_blocking(client.purge_export_data, **kwargs)
+            return await run_action(client.purge_export_data, **kwargs)
         if action == "get_shared_recipe":
-            return await run_blocking(client.get_shared_recipe, **kwargs)
+            return await run_action(client.get_shared_recipe, **kwargs)
         if action == "get_shared_recipe_as_zip":
-            return await run_blocking(client.get_shared_recipe_as_zip, **kwargs)
+            return await run_action(client.get_shared_recipe_as_zip, **kwargs)
         if action == "get_recipes_timeline_events":
-            return await run_blocking(client.get_recipes_timeline_events, **kwargs)
+            return await run_action(client.get_recipes_timeline_events, **kwargs)
         if action == "post_recipes_timeline_events":
-            return await run_blocking(client.post_recipes_timeline_events, **kwargs)
+            return await run_action(client.post_recipes_timeline_events, **kwargs)
         if action == "get_recipes_timeline_events_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.get_recipes_timeline_events_item_id, **kwargs
             )
         if action == "put_recipes_timeline_events_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.put_recipes_timeline_events_item_id, **kwargs
             )
         if action == "delete_recipes_timeline_events_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.delete_recipes_timeline_events_item_id, **kwargs
             )
         if action == "update_event_image":
-            return await run_blocking(client.update_event_image, **kwargs)
+            return await run_action(client.update_event_image, **kwargs)
         if action == "get_comments":
-            return await run_blocking(client.get_comments, **kwargs)
+            return await run_action(client.get_comments, **kwargs)
         if action == "post_comments":
-            return await run_blocking(client.post_comments, **kwargs)
+            return await run_action(client.post_comments, **kwargs)
         if action == "get_comments_item_id":
-            return await run_blocking(client.get_comments_item_id, **kwargs)
+            return await run_action(client.get_comments_item_id, **kwargs)
         if action == "put_comments_item_id":
-            return await run_blocking(client.put_comments_item_id, **kwargs)
+            return await run_action(client.put_comments_item_id, **kwargs)
         if action == "post_parser_ingredient":
-            return await run_blocking(client.post_parser_ingredient, **kwargs)
+            return await run_action(client.post_parser_ingredient, **kwargs)
         if action == "parse_ingredient":
-            return await run_blocking(client.parse_ingredient, **kwargs)
+            return await run_action(client.parse_ingredient, **kwargs)
         if action == "parse_ingredients":
-            return await run_blocking(client.parse_ingredients, **kwargs)
+            return await run_action(client.parse_ingredients, **kwargs)
         if action == "get_foods":
-            return await run_blocking(client.get_foods, **kwargs)
+            return await run_action(client.get_foods, **kwargs)
         if action == "post_foods":
-            return await run_blocking(client.post_foods, **kwargs)
+            return await run_action(client.post_foods, **kwargs)
         if action == "put_foods_merge":
-            return await run_blocking(client.put_foods_merge, **kwargs)
+            return await run_action(client.put_foods_merge, **kwargs)
         if action == "get_foods_item_id":
-            return await run_blocking(client.get_foods_item_id, **kwargs)
+            return await run_action(client.get_foods_item_id, **kwargs)
         if action == "put_foods_item_id":
-            return await run_blocking(client.put_foods_item_id, **kwargs)
+            return await run_action(client.put_foods_item_id, **kwargs)
         if action == "delete_foods_item_id":
-            return await run_blocking(client.delete_foods_item_id, **kwargs)
+            return await run_action(client.delete_foods_item_id, **kwargs)
         if action == "get_units":
-            return await run_blocking(client.get_units, **kwargs)
+            return await run_action(client.get_units, **kwargs)
         if action == "post_units":
-            return await run_blocking(client.post_units, **kwargs)
+            return await run_action(client.post_units, **kwargs)
         if action == "put_units_merge":
-            return await run_blocking(client.put_units_merge, **kwargs)
+            return await run_action(client.put_units_merge, **kwargs)
         if action == "get_units_item_id":
-            return await run_blocking(client.get_units_item_id, **kwargs)
+            return await run_action(client.get_units_item_id, **kwargs)
         if action == "put_units_item_id":
-            return await run_blocking(client.put_units_item_id, **kwargs)
+            return await run_action(client.put_units_item_id, **kwargs)
         if action == "delete_units_item_id":
-            return await run_blocking(client.delete_units_item_id, **kwargs)
+            return await run_action(client.delete_units_item_id, **kwargs)
         if action == "get_recipe_img":
-            return await run_blocking(client.get_recipe_img, **kwargs)
+            return await run_action(client.get_recipe_img, **kwargs)
         if action == "get_recipe_timeline_event_img":
-            return await run_blocking(client.get_recipe_timeline_event_img, **kwargs)
+            return await run_action(client.get_recipe_timeline_event_img, **kwargs)
         if action == "get_recipe_asset":
-            return await run_blocking(client.get_recipe_asset, **kwargs)
+            return await run_action(client.get_recipe_asset, **kwargs)
         if action == "get_user_image":
-            return await run_blocking(client.get_user_image, **kwargs)
+            return await run_action(client.get_user_image, **kwargs)
         if action == "get_validation_text":
-            return await run_blocking(client.get_validation_text, **kwargs)
+            return await run_action(client.get_validation_text, **kwargs)
         raise ValueError(f"Unknown action: {action}")
 
+    @mcp.tool(tags={"recipes"})
+    async def mealie_recipes_batch(
+        slugs: list[str] = Field(
+            description="Recipe slugs or ids to fetch; duplicates are fetched once."
+        ),
+        concurrency: int = Field(
+            default=8, description="Maximum concurrent requests (1-32)."
+        ),
+        params_json: str = Field(
+            default="{}",
+            description='JSON string of call options (e.g. {"timeout": 30}).',
+        ),
+        client=Depends(get_async_client),
+        ctx: Context | None = Field(
+            default=None, description="MCP context for progress reporting"
+        ),
+    ) -> dict:
+        """Fetch full recipe bodies for many slugs in one call.
+
+        Returns ``{"recipes": {slug: recipe}, "slugs": {key: slug}, "errors":
+        {key: error}, "requested", "unique"}``: recipes are keyed by slug even when
+        requested by id; one failing key does not fail the batch.
+        """
+        if ctx:
+            await ctx.info("Fetching recipes...")
+        import json
+
+        try:
+            kwargs = json.loads(params_json) if params_json else {}
+        except Exception:
+            return {"error": "Operation failed"}
+        kwargs = prepare_call(ctx, {k: v for k, v in kwargs.items() if v is not None})
+        return await run_action(
+            client.get_recipes_batch, slugs=slugs, concurrency=concurrency, **kwargs
+        )
+
+    @mcp.tool(tags={"recipes"})
+    async def mealie_recipe_ids(
+        keys: list[str] = Field(
+            description="Recipe slugs and/or ids to translate into each other."
+        ),
+        params_json: str = Field(
+            default="{}",
+            description='JSON string of call options (e.g. {"timeout": 30}).',
+        ),
+        client=Depends(get_async_client),
+        ctx: Context | None = Field(
+            default=None, description="MCP context for progress reporting"
+        ),
+    ) -> dict:
+        """Resolve recipe slugs to ids and ids to slugs without fetching recipes.
+
+        Returns ``{"resolved": {key: {"id", "slug"}}, "missing": [key, ...]}`` from
+        the in-memory index; unknown keys are looked up in Mealie once.
+        """
+        import json
+
+        try:
+            kwargs = json.loads(params_json) if params_json else {}
+        except Exception:
+            return {"error": "Operation failed"}
+        kwargs = prepare_call(ctx, {k: v for k, v in kwargs.items() if v is not None})
+        return await run_action(client.resolve_recipes, keys=keys, **kwargs)
+
 
 VALID_ORGANIZER_ACTIONS = (
     "get_organizers_categories",
@@ -835,14 +921,14 @@ async def mealie_organizer(
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie organizer operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -851,6 +937,7 @@ async def mealie_organizer(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_ORGANIZER_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -858,57 +945,90 @@ async def mealie_organizer(
         action = resolved
 
         if action == "get_organizers_categories":
-            return await run_blocking(client.get_organizers_categories, **kwargs)
+            return await run_action(client.get_organizers_categories, **kwargs)
         if action == "post_organizers_categories":
-            return await run_blocking(client.post_organizers_categories, **kwargs)
+            return await run_action(client.post_organizers_categories, **kwargs)
         if action == "get_all_empty":
-            return await run_blocking(client.get_all_empty, **kwargs)
+            return await run_action(client.get_all_empty, **kwargs)
         if action == "get_organizers_categories_item_id":
-            return await run_blocking(
-                client.get_organizers_categories_item_id, **kwargs
-            )
+            return await run_action(client.get_organizers_categories_item_id, **kwargs)
         if action == "put_organizers_categories_item_id":
-            return await run_blocking(
-                client.put_organizers_categories_item_id, **kwargs
-            )
+            return await run_action(client.put_organizers_categories_item_id, **kwargs)
         if action == "delete_organizers_categories_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.delete_organizers_categories_item_id, **kwargs
             )
         if action == "get_organizers_categories_slug_category_slug":
-            return await run_blocking(
+            return await run_action(
                 client.get_organizers_categories_slug_category_slug, **kwargs
             )
         if action == "get_organizers_tags":
-            return await run_blocking(client.get_organizers_tags, **kwargs)
+            return await run_action(client.get_organizers_tags, **kwargs)
         if action == "post_organizers_tags":
-            return await run_blocking(client.post_organizers_tags, **kwargs)
+            return await run_action(client.post_organizers_tags, **kwargs)
         if action == "get_empty_tags":
-            return await run_blocking(client.get_empty_tags, **kwargs)
+            return await run_action(client.get_empty_tags, **kwargs)
         if action == "get_organizers_tags_item_id":
-            return await run_blocking(client.get_organizers_tags_item_id, **kwargs)
+            return await run_action(client.get_organizers_tags_item_id, **kwargs)
         if action == "put_organizers_tags_item_id":
-            return await run_blocking(client.put_organizers_tags_item_id, **kwargs)
+            return await run_action(client.put_organizers_tags_item_id, **kwargs)
         if action == "delete_recipe_tag":
-            return await run_blocking(client.delete_recipe_tag, **kwargs)
+            return await run_action(client.delete_recipe_tag, **kwargs)
         if action == "get_organizers_tags_slug_tag_slug":
-            return await run_blocking(
-                client.get_organizers_tags_slug_tag_slug, **kwargs
-            )
+            return await run_action(client.get_organizers_tags_slug_tag_slug, **kwargs)
         if action == "get_organizerss":
-            return await run_blocking(client.get_organizerss, **kwargs)
+            return await run_action(client.get_organizerss, **kwargs)
         if action == "post_organizerss":
-            return await run_blocking(client.post_organizerss, **kwargs)
+            return await run_action(client.post_organizerss, **kwargs)
         if action == "get_organizerss_item_id":
-            return await run_blocking(client.get_organizerss_item_id, **kwargs)
+            return await run_action(client.get_organizerss_item_id, **kwargs)
         if action == "put_organizerss_item_id":
-            return await run_blocking(client.put_organizerss_item_id, **kwargs)
+            return await run_action(client.put_organizerss_item_id, **kwargs)
         if action == "delete_organizerss_item_id":
-            return await run_blocking(client.delete_organizerss_item_id, **kwargs)
+            return await run_action(client.delete_organizerss_item_id, **kwargs)
         if action == "get_organizerss_slug_slug":
-            return await run_blocking(client.get_organizerss_slug_slug, **kwargs)
+            return await run_action(client.get_organizerss_slug_slug, **kwargs)
         raise ValueError(f"Unknown action: {action}")
 
+    @mcp.tool(tags={"organizer"})
+    async def mealie_catalog(
+        kind: str = Field(
+            description="Catalog to read: 'categories', 'tags', 'tools', 'foods', 'units' or 'labels'."
+        ),
+        key: str | None = Field(
+            default=None,
+            description="Id, slug or name to look up; omit to list the whole catalog.",
+        ),
+        params_json: str = Field(
+            default="{}",
+            description='JSON string of call options (e.g. {"fields": ["id", "name"]}).',
+        ),
+        client=Depends(get_async_client),
+        ctx: Context | None = Field(
+            default=None, description="MCP context for progress reporting"
+        ),
+    ) -> dict:
+        """Resolve organizers, foods, units and labels from the in-memory catalog cache.
+
+        The whole list is loaded once and refreshed on TTL or after any write to it.
+        """
+        import json
+
+        try:
+            kwargs = json.loads(params_json) if params_json else {}
+        except Exception:
+            return {"error": "Operation failed"}
+        kwargs = prepare_call(ctx, {k: v for k, v in kwargs.items() if v is not None})
+        if key is None:
+            result = await run_action(client.catalog, kind=kind, **kwargs)
+            return (
+                {"kind": kind, "items": result} if isinstance(result, list) else result
+            )
+        result = await run_action(client.catalog_lookup, kind=kind, key=key, **kwargs)
+        if result is None:
+            return {"error": "not_found", "kind": kind, "key": key}
+        return result
+
 
 VALID_SHARED_ACTIONS = (
     "get_shared_recipes",
@@ -927,14 +1047,14 @@ async def mealie_shared(
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie shared operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -943,6 +1063,7 @@ async def mealie_shared(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_SHARED_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -950,13 +1071,13 @@ async def mealie_shared(
         action = resolved
 
         if action == "get_shared_recipes":
-            return await run_blocking(client.get_shared_recipes, **kwargs)
+            return await run_action(client.get_shared_recipes, **kwargs)
         if action == "post_shared_recipes":
-            return await run_blocking(client.post_shared_recipes, **kwargs)
+            return await run_action(client.post_shared_recipes, **kwargs)
         if action == "get_shared_recipes_item_id":
-            return await run_blocking(client.get_shared_recipes_item_id, **kwargs)
+            return await run_action(client.get_shared_recipes_item_id, **kwargs)
         if action == "delete_shared_recipes_item_id":
-            return await run_blocking(client.delete_shared_recipes_item_id, **kwargs)
+            return await run_action(client.delete_shared_recipes_item_id, **kwargs)
         raise ValueError(f"Unknown action: {action}")
 
 
@@ -1007,14 +1128,14 @@ async def mealie_admin(
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie admin operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -1023,6 +1144,7 @@ async def mealie_admin(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_ADMIN_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -1030,73 +1152,73 @@ async def mealie_admin(
         action = resolved
 
         if action == "get_app_info":
-            return await run_blocking(client.get_app_info, **kwargs)
+            return await run_action(client.get_app_info, **kwargs)
         if action == "get_app_statistics":
-            return await run_blocking(client.get_app_statistics, **kwargs)
+            return await run_action(client.get_app_statistics, **kwargs)
         if action == "check_app_config":
-            return await run_blocking(client.check_app_config, **kwargs)
+            return await run_action(client.check_app_config, **kwargs)
         if action == "get_admin_users":
-            return await run_blocking(client.get_admin_users, **kwargs)
+            return await run_action(client.get_admin_users, **kwargs)
         if action == "post_admin_users":
-            return await run_blocking(client.post_admin_users, **kwargs)
+            return await run_action(client.post_admin_users, **kwargs)
         if action == "unlock_users":
-            return await run_blocking(client.unlock_users, **kwargs)
+            return await run_action(client.unlock_users, **kwargs)
         if action == "get_admin_users_item_id":
-            return await run_blocking(client.get_admin_users_item_id, **kwargs)
+            return await run_action(client.get_admin_users_item_id, **kwargs)
         if action == "put_admin_users_item_id":
-            return await run_blocking(client.put_admin_users_item_id, **kwargs)
+            return await run_action(client.put_admin_users_item_id, **kwargs)
         if action == "delete_admin_users_item_id":
-            return await run_blocking(client.delete_admin_users_item_id, **kwargs)
+            return await run_action(client.delete_admin_users_item_id, **kwargs)
         if action == "generate_token":
-            return await run_blocking(client.generate_token, **kwargs)
+            return await run_action(client.generate_token, **kwargs)
         if action == "get_admin_households":
-            return await run_blocking(client.get_admin_households, **kwargs)
+            return await run_action(client.get_admin_households, **kwargs)
         if action == "post_admin_households":
-            return await run_blocking(client.post_admin_households, **kwargs)
+            return await run_action(client.post_admin_households, **kwargs)
         if action == "get_admin_households_item_id":
-            return await run_blocking(client.get_admin_households_item_id, **kwargs)
+            return await run_action(client.get_admin_households_item_id, **kwargs)
         if action == "put_admin_households_item_id":
-            return await run_blocking(client.put_admin_households_item_id, **kwargs)
+            return await run_action(client.put_admin_households_item_id, **kwargs)
         if action == "delete_admin_households_item_id":
-            return await run_blocking(client.delete_admin_households_item_id, **kwargs)
+            return await run_action(client.delete_admin_households_item_id, **kwargs)
         if action == "get_admin_groups":
-            return await run_blocking(client.get_admin_groups, **kwargs)
+            return await run_action(client.get_admin_groups, **kwargs)
         if action == "post_admin_groups":
-            return await run_blocking(client.post_admin_groups, **kwargs)
+            return await run_action(client.post_admin_groups, **kwargs)
         if action == "get_admin_groups_item_id":
-            return await run_blocking(client.get_admin_groups_item_id, **kwargs)
+            return await run_action(client.get_admin_groups_item_id, **kwargs)
         if action == "put_admin_groups_item_id":
-            return await run_blocking(client.put_admin_groups_item_id, **kwargs)
+            return await run_action(client.put_admin_groups_item_id, **kwargs)
         if action == "delete_admin_groups_item_id":
-            return await run_blocking(client.delete_admin_groups_item_id, **kwargs)
+            return await run_action(client.delete_admin_groups_item_id, **kwargs)
         if action == "check_email_config":
-            return await run_blocking(client.check_email_config, **kwargs)
+            return await run_action(client.check_email_config, **kwargs)
         if action == "send_test_email":
-            return await run_blocking(client.send_test_email, **kwargs)
+            return await run_action(client.send_test_email, **kwargs)
         if action == "get_admin_backups":
-            return await run_blocking(client.get_admin_backups, **kwargs)
+            return await run_action(client.get_admin_backups, **kwargs)
         if action == "post_admin_backups":
-            return await run_blocking(client.post_admin_backups, **kwargs)
+            return await run_action(client.post_admin_backups, **kwargs)
         if action == "get_admin_backups_file_name":
-            return await run_blocking(client.get_admin_backups_file_name, **kwargs)
+            return await run_action(client.get_admin_backups_file_name, **kwargs)
         if action == "delete_admin_backups_file_name":
-            return await run_blocking(client.delete_admin_backups_file_name, **kwargs)
+            return await run_action(client.delete_admin_backups_file_name, **kwargs)
         if action == "upload_one":
-            return await run_blocking(client.upload_one, **kwargs)
+            return await run_action(client.upload_one, **kwargs)
         if action == "import_one":
-            return await run_blocking(client.import_one, **kwargs)
+            return await run_action(client.import_one, **kwargs)
         if action == "get_maintenance_summary":
-            return await run_blocking(client.get_maintenance_summary, **kwargs)
+            return await run_action(client.get_maintenance_summary, **kwargs)
         if action == "get_storage_details":
-            return await run_blocking(client.get_storage_details, **kwargs)
+            return await run_action(client.get_storage_details, **kwargs)
         if action == "clean_images":
-            return await run_blocking(client.clean_images, **kwargs)
+            return await run_action(client.clean_images, **kwargs)
         if action == "clean_temp":
-            return await run_blocking(client.clean_temp, **kwargs)
+            return await run_action(client.clean_temp, **kwargs)
         if action == "clean_recipe_folders":
-            return await run_blocking(client.clean_recipe_folders, **kwargs)
+            return await run_action(client.clean_recipe_folders, **kwargs)
         if action == "debug_openai":
-            return await run_blocking(client.debug_openai, **kwargs)
+            return await run_action(client.debug_openai, **kwargs)
         raise ValueError(f"Unknown action: {action}")
 
 
@@ -1128,14 +1250,14 @@ async def mealie_explore(
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie explore operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -1144,6 +1266,7 @@ async def mealie_explore(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_EXPLORE_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -1151,62 +1274,62 @@ async def mealie_explore(
         action = resolved
 
         if action == "get_explore_groups_group_slug_foods":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_foods, **kwargs
             )
         if action == "get_explore_groups_group_slug_foods_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_foods_item_id, **kwargs
             )
         if action == "get_explore_groups_group_slug_households":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_households, **kwargs
             )
         if action == "get_household":
-            return await run_blocking(client.get_household, **kwargs)
+            return await run_action(client.get_household, **kwargs)
         if action == "get_explore_groups_group_slug_organizers_categories":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_organizers_categories, **kwargs
             )
         if action == "get_explore_groups_group_slug_organizers_categories_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_organizers_categories_item_id,
                 **kwargs,
             )
         if action == "get_explore_groups_group_slug_organizers_tags":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_organizers_tags, **kwargs
             )
         if action == "get_explore_groups_group_slug_organizers_tags_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_organizers_tags_item_id, **kwargs
             )
         if action == "get_explore_groups_group_slug_organizerss":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_organizerss, **kwargs
             )
         if action == "get_explore_groups_group_slug_organizerss_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_organizerss_item_id, **kwargs
             )
         if action == "get_explore_groups_group_slug_cookbooks":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_cookbooks, **kwargs
             )
         if action == "get_explore_groups_group_slug_cookbooks_item_id":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_cookbooks_item_id, **kwargs
             )
         if action == "get_explore_groups_group_slug_recipes":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_recipes, **kwargs
             )
         if action == "get_explore_groups_group_slug_recipes_suggestions":
-            return await run_blocking(
+            return await run_action(
                 client.get_explore_groups_group_slug_recipes_suggestions, **kwargs
             )
         if action == "get_recipe":
-            return await run_blocking(client.get_recipe, **kwargs)
+            return await run_action(client.get_recipe, **kwargs)
         raise ValueError(f"Unknown action: {action}")
 
 
@@ -1222,14 +1345,14 @@ async def mealie_utils(
         params_json: str = Field(
             default="{}", description="JSON string of parameters to pass to the action."
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Manage mealie utils operations."""
         if ctx:
-            ctx.info("Executing tool...")
+            await ctx.info("Executing tool...")
         import json
 
         try:
@@ -1238,6 +1361,7 @@ async def mealie_utils(
             return {"error": "Operation failed"}
 
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        kwargs = prepare_call(ctx, kwargs)
 
         resolved = resolve_action(action, VALID_UTILS_ACTIONS, service="mealie-mcp")
         if isinstance(resolved, dict):
@@ -1245,7 +1369,7 @@ async def mealie_utils(
         action = resolved
 
         if action == "download_file":
-            return await run_blocking(client.download_file, **kwargs)
+            return await run_action(client.download_file, **kwargs)
         raise ValueError(f"Unknown action: {action}")
 
 
@@ -1260,14 +1384,15 @@ async def mealie_ingest_recipes(
             default=False,
             description="Also fetch each recipe image and store it as a :AssetOccurrence blob.",
         ),
-        client=Depends(get_client),
+        client=Depends(get_async_client),
         ctx: Context | None = Field(
             default=None, description="MCP context for progress reporting"
         ),
     ) -> dict:
         """Natively ingest Mealie recipes into epistemic-graph as typed :Recipe nodes.
 
-        Lists recipes via the Mealie API and pushes them (with their :Ingredient,
+        Lists every recipe page by page (only ``page`` when params_json sets one)
+        via the Mealie API and pushes them (with their :Ingredient,
         :Food, :Unit, :RecipeCategory, :Tag and :RecipeTool nodes + links) into the
         knowledge graph via the fast engine client. With ``ingest_images`` the raw
         image bytes are stored as content-addressed :AssetOccurrence blobs. Best-effort:
@@ -1276,36 +1401,70 @@ async def mealie_ingest_recipes(
         """
         import json as _json
 
-        from mealie_mcp.kg_ingest import ingest_recipes
-        from mealie_mcp.kg_media import fetch_recipe_image_bytes, ingest_recipe_image
+        from mealie_mcp.kg_ingest import ingest_recipes, merge_ingest_counts
+        from mealie_mcp.kg_media import afetch_recipe_image, ingest_recipe_image
 
         if ctx:
-            ctx.info("Listing recipes for KG ingestion...")
+            await ctx.info("Listing recipes for KG ingestion...")
         try:
             kwargs = _json.loads(params_json) if params_json else {}
         except Exception:  # noqa: BLE001
             return {"error": "Operation failed"}
         kwargs = {k: v for k, v in kwargs.items() if v is not None}
-
-        resp = await run_blocking(client.get_recipes, **kwargs)
-        data = resp.get("items", resp) if isinstance(resp, dict) else resp
-        records = data if isinstance(data, list) else [data]
-        recipes = [r for r in records if isinstance(r, dict) and r.get("id")]
-
-        result = ingest_recipes(recipes)
-
-        images = 0
-        if ingest_images:
-            for recipe in recipes:
-                image_bytes = await run_blocking(
-                    fetch_recipe_image_bytes, client, str(recipe["id"])
-                )
-                if not image_bytes:
-                    continue
-                if ingest_recipe_image(recipe, image_bytes=image_bytes) is not None:
-                    images += 1
-
-        return {"listed": len(recipes), "ingested": result, "images_ingested": images}
+        kwargs.setdefault("priority", BULK)
+        kwargs = prepare_call(ctx, kwargs)
+
+        # Walk every page (one page in memory at a time) unless the caller
+        # asked for a specific one.
+        single_page = "page" in kwargs
+        pages = client.iter_pages(
+            "get_recipes", start_page=kwargs.pop("page", 1), **kwargs
+        )
+        listed = images = 0
+        total = None
+        result = None
+        summary: dict[str, Any] = {}
+        try:
+            async with contextlib.aclosing(pages):
+                async for resp in pages:
+                    if isinstance(resp, dict) and total is None:
+                        total = resp.get("total")
+                    recipes = [
+                        r
+                        for r in page_items(resp)
+                        if isinstance(r, dict) and r.get("id")
+                    ]
+                    listed += len(recipes)
+                    result = merge_ingest_counts(result, ingest_recipes(recipes))
+                    if ingest_images:
+                        for recipe in recipes:
+                            image = await afetch_recipe_image(client, str(recipe["id"]))
+                            if image is None or not image.content:
+                                continue
+                            if (
+                                ingest_recipe_image(
+                                    recipe,
+                                    image_bytes=image.content,
+                                    mime_type=image.content_type or "image/webp",
+                                )
+                                is not None
+                            ):
+                                images += 1
+                    await report_progress(listed, total, f"Ingested {listed} recipes")
+                    if single_page:
+                        break
+        except CircuitOpenError as e:
+            return e.to_dict()
+        except DeadlineExceeded:
+            # Out of time: acknowledge what was ingested instead of failing.
+            summary["truncated"] = True
+
+        return {
+            "listed": listed,
+            "ingested": result,
+            "images_ingested": images,
+            **summary,
+        }
 
     return None
 
@@ -1331,6 +1490,8 @@ async def health_check(request: Request) -> JSONResponse:
         tools_module=sys.modules[__name__],
     )
 
+    start_mirror()
+
     for mw in middlewares:
         mcp.add_middleware(mw)
     return mcp, args, middlewares
@@ -0,0 +1,483 @@
+"""Local SQLite mirror of the Mealie catalog with delta sync.
+
+With ``MEALIE_MIRROR_PATH`` set, the MCP server keeps a SQLite copy of every
+recipe (full body), food, unit, category, tag, tool and meal plan, refreshed
+by a background thread every ``MEALIE_MIRROR_INTERVAL`` seconds:
+
+- Recipes are listed newest-first by ``dateUpdated`` and the walk stops at the
+  last synced timestamp; only recipes whose timestamp differs from the stored
+  one have their full body fetched (via ``get_recipes_batch``).
+- Every ``MEALIE_MIRROR_RECONCILE`` seconds the recipe walk runs to the end
+  and drops recipes that no longer exist, which a delta walk cannot see.
+- The other catalogs are small and are reloaded whole each time.
+
+Read actions can then be answered locally ("local-first") through the
+``local_first`` call option or ``MEALIE_LOCAL_FIRST``: ``get_recipes``,
+``get_recipes_slug``, ``get_foods``, ``get_units``, the organizer lists and
+``get_households_mealplans`` are served from the mirror when it is younger
+than the freshness bound (``max_age`` call option, default
+``MEALIE_MIRROR_MAX_AGE``) and the call uses no filters the mirror cannot
+honour. Anything else goes to Mealie as usual.
+
+Writes made through this server's clients keep local answers honest: every
+kind whose list the write may change (per
+:mod:`mealie_mcp.api.dependencies`) stops answering locally until its next
+sync, a deleted record is dropped at once, and deletes the mirror cannot pin
+to one record (bulk deletes, backup restores) make the next recipe sync a full
+walk.
+"""
+
+import atexit
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from mealie_mcp.api.dependencies import invalidated_reads, is_stale
+from mealie_mcp.api.limiter import BULK, priority
+from mealie_mcp.api.pagination import page_items, updated_at
+
+logger = logging.getLogger("mealie_mcp.mirror")
+
+# Mirrored kinds other than recipes -> list operation (reloaded whole).
+LISTS = {
+    "foods": "get_foods",
+    "units": "get_units",
+    "categories": "get_organizers_categories",
+    "tags": "get_organizers_tags",
+    "tools": "get_organizers_tools",
+    "mealplans": "get_households_mealplans",
+}
+
+# Mirrored kind -> its list endpoint, checked against a write's stale reads.
+ENDPOINTS = {
+    "recipes": "/api/recipes",
+    "foods": "/api/foods",
+    "units": "/api/units",
+    "categories": "/api/organizers/categories",
+    "tags": "/api/organizers/tags",
+    "tools": "/api/organizers/tools",
+    "mealplans": "/api/households/mealplans",
+}
+
+# Read actions the mirror can answer -> (kind, shape).
+LOCAL_READS = {
+    "get_recipes": ("recipes", "page"),
+    "get_recipes_slug": ("recipes", "one"),
+    **{operation: (kind, "page") for kind, operation in LISTS.items()},
+}
+
+# Arguments a local answer can honour; any other argument goes to Mealie.
+_LOCAL_ARGS = {"page", "per_page", "slug", "accept_language"}
+
+SYNC_PER_PAGE = 100
+DETAIL_BATCH = 50
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    slug TEXT,
+    name TEXT,
+    updated TEXT,
+    summary TEXT NOT NULL,
+    body TEXT,
+    PRIMARY KEY (kind, id)
+);
+CREATE INDEX IF NOT EXISTS records_slug ON records (kind, slug);
+CREATE TABLE IF NOT EXISTS sync_state (
+    kind TEXT PRIMARY KEY,
+    cursor TEXT,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
+def _segments(endpoint: str) -> list[str]:
+    return [s for s in endpoint.split("?", 1)[0].split("/") if s]
+
+
+def _unpinned_delete(path: list[str]) -> bool:
+    """Whether a write removes recipes it does not name in its path."""
+    return path[:4] == ["api", "recipes", "bulk-actions", "delete"] or (
+        path[:3] == ["api", "admin", "backups"] and path[-1:] == ["restore"]
+    )
+
+
+def _stamp(item: Any) -> str | None:
+    stamp = updated_at(item)
+    return stamp.isoformat() if stamp else None
+
+
+class Mirror:
+    """SQLite store of mirrored records; safe to share between threads."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    # -- state -----------------------------------------------------------
+
+    def age(self, kind: str) -> float | None:
+        """Seconds since ``kind`` was last synced, ``None`` if never."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT synced_at FROM sync_state WHERE kind = ?", (kind,)
+            ).fetchone()
+        return time.time() - row[0] if row else None
+
+    def cursor(self, kind: str) -> str | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT cursor FROM sync_state WHERE kind = ?", (kind,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def mark_synced(self, kind: str, cursor: str | None = None) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT INTO sync_state (kind, cursor, synced_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(kind) DO UPDATE SET "
+                "cursor = COALESCE(excluded.cursor, cursor), synced_at = excluded.synced_at",
+                (kind, cursor, time.time()),
+            )
+
+    # -- writes ----------------------------------------------------------
+
+    def stored_stamps(self, kind: str, ids: list[str]) -> dict[str, str | None]:
+        if not ids:
+            return {}
+        marks = ",".join("?" * len(ids))
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT id, updated FROM records WHERE kind = ? AND id IN ({marks})",
+                (kind, *ids),
+            ).fetchall()
+        return dict(rows)
+
+    def upsert(self, kind: str, summary: dict, body: Any = None) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO records "
+                "(kind, id, slug, name, updated, summary, body) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    kind,
+                    str(summary["id"]),
+                    summary.get("slug"),
+                    summary.get("name"),
+                    _stamp(summary),
+                    _dumps(summary),
+                    _dumps(body) if body is not None else None,
+                ),
+            )
+
+    def replace(self, kind: str, items: list) -> None:
+        """Make ``items`` the whole content of ``kind``."""
+        rows = [
+            (
+                kind,
+                str(item["id"]),
+                item.get("slug"),
+                item.get("name"),
+                _stamp(item),
+                _dumps(item),
+            )
+            for item in items
+            if isinstance(item, dict) and item.get("id") is not None
+        ]
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM records WHERE kind = ?", (kind,))
+            self._db.executemany(
+                "INSERT OR REPLACE INTO records "
+                "(kind, id, slug, name, updated, summary) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def retain(self, kind: str, ids: set[str]) -> int:
+        """Delete records of ``kind`` not in ``ids``; returns how many."""
+        with self._lock, self._db:
+            stored = {
+                row[0]
+                for row in self._db.execute(
+                    "SELECT id FROM records WHERE kind = ?", (kind,)
+                )
+            }
+            gone = stored - ids
+            self._db.executemany(
+                "DELETE FROM records WHERE kind = ? AND id = ?",
+                [(kind, i) for i in gone],
+            )
+        return len(gone)
+
+    def invalidate_for(self, method: str, endpoint: str) -> None:
+        """Stop serving what a ``method`` request to ``endpoint`` may have changed."""
+        patterns = invalidated_reads(method, endpoint)
+        stale = [k for k, e in ENDPOINTS.items() if is_stale(patterns, e)]
+        if not stale:
+            return
+        path = _segments(endpoint)
+        parent = "/" + "/".join(path[:-1])
+        with self._lock, self._db:
+            self._db.executemany(
+                "UPDATE sync_state SET synced_at = 0 WHERE kind = ?",
+                [(kind,) for kind in stale],
+            )
+            if method.upper() == "DELETE":
+                for kind, list_endpoint in ENDPOINTS.items():
+                    if parent == list_endpoint:
+                        self._db.execute(
+                            "DELETE FROM records "
+                            "WHERE kind = ? AND (id = ? OR slug = ?)",
+                            (kind, path[-1], path[-1]),
+                        )
+            if _unpinned_delete(path):
+                self._db.execute(
+                    "UPDATE sync_state SET cursor = NULL WHERE kind = 'recipes'"
+                )
+
+    # -- reads -----------------------------------------------------------
+
+    def get(self, kind: str, key: str) -> Any | None:
+        """Full body (or listed summary) of the record with id or slug ``key``."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, summary FROM records "
+                "WHERE kind = ? AND (id = ? OR slug = ?) LIMIT 1",
+                (kind, key, key),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0] or row[1])
+
+    def page(self, kind: str, page: int = 1, per_page: int = 50) -> dict[str, Any]:
+        """A Mealie-shaped page of ``kind`` summaries, ordered by name."""
+        with self._lock:
+            total = self._db.execute(
+                "SELECT COUNT(*) FROM records WHERE kind = ?", (kind,)
+            ).fetchone()[0]
+            if per_page < 0:
+                per_page, page = max(total, 1), 1
+            rows = self._db.execute(
+                "SELECT summary FROM records WHERE kind = ? "
+                "ORDER BY name COLLATE NOCASE, id LIMIT ? OFFSET ?",
+                (kind, per_page, (page - 1) * per_page),
+            ).fetchall()
+        return {
+            "page": page,
+            "per_page": per_page,
+            "total": total,
+            "total_pages": -(-total // per_page) if per_page else 0,
+            "items": [json.loads(row[0]) for row in rows],
+            "next": None,
+            "previous": None,
+        }
+
+    def answer(self, action: str, kwargs: dict[str, Any], max_age: float) -> Any | None:
+        """Local result of ``action``, or ``None`` when Mealie must answer it."""
+        kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        if action not in LOCAL_READS or set(kwargs) - _LOCAL_ARGS:
+            return None
+        kind, shape = LOCAL_READS[action]
+        age = self.age(kind)
+        if age is None or age > max_age:
+            return None
+        if shape == "one":
+            return self.get(kind, str(kwargs.get("slug", "")))
+        return self.page(
+            kind, int(kwargs.get("page") or 1), int(kwargs.get("per_page") or 50)
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            counts = dict(
+                self._db.execute(
+                    "SELECT kind, COUNT(*) FROM records GROUP BY kind"
+                ).fetchall()
+            )
+            synced = dict(
+                self._db.execute("SELECT kind, synced_at FROM sync_state").fetchall()
+            )
+        now = time.time()
+        return {
+            kind: {
+                "records": counts.get(kind, 0),
+                "age": round(now - at, 1) if at else None,
+            }
+            for kind, at in synced.items()
+        }
+
+
+def sync_recipes(mirror: Mirror, client: Any, *, full: bool = False) -> dict[str, int]:
+    """Delta-sync recipes; ``full`` walks everything and drops deleted ones.
+
+    Without a cursor (first sync, or after a bulk delete) the walk is full too.
+    """
+    cursor = None if full else mirror.cursor("recipes")
+    full = full or cursor is None
+    newest: str | None = None
+    seen: set[str] = set()
+    pending: list[dict] = []
+    fetched = 0
+
+    def flush() -> None:
+        nonlocal fetched
+        if not pending:
+            return
+        batch = client.get_recipes_batch([s["slug"] or s["id"] for s in pending])
+        for summary in pending:
+            key = summary["slug"] or summary["id"]
+            body = batch["recipes"].get(batch["slugs"].get(key, key))
+            if body is not None:
+                mirror.upsert("recipes", summary, body)
+                fetched += 1
+        pending.clear()
+
+    pages = client.iter_pages(
+        "get_recipes",
+        per_page=SYNC_PER_PAGE,
+        order_by="dateUpdated",
+        order_direction="desc",
+    )
+    for page in pages:
+        summaries = [s for s in page_items(page) if isinstance(s, dict) and s.get("id")]
+        stored = mirror.stored_stamps("recipes", [str(s["id"]) for s in summaries])
+        reached_cursor = False
+        for summary in summaries:
+            summary_id, stamp = str(summary["id"]), _stamp(summary)
+            seen.add(summary_id)
+            if stamp and (newest is None or stamp > newest):
+                newest = stamp
+            if cursor and stamp and stamp < cursor:
+                reached_cursor = True
+                continue
+            if summary_id not in stored or stored[summary_id] != stamp:
+                pending.append(summary)
+        if len(pending) >= DETAIL_BATCH:
+            flush()
+        if reached_cursor:
+            break
+    flush()
+    removed = mirror.retain("recipes", seen) if full else 0
+    mirror.mark_synced("recipes", newest or cursor)
+    return {"listed": len(seen), "fetched": fetched, "removed": removed}
+
+
+def sync_lists(mirror: Mirror, client: Any) -> dict[str, int]:
+    """Reload each of :data:`LISTS` whole."""
+    counts = {}
+    for kind, operation in LISTS.items():
+        items = list(client.iter_items(operation, per_page=SYNC_PER_PAGE))
+        mirror.replace(kind, items)
+        mirror.mark_synced(kind)
+        counts[kind] = len(items)
+    return counts
+
+
+def sync(mirror: Mirror, client: Any, *, full: bool = False) -> dict[str, Any]:
+    """One sync pass over every mirrored kind, at bulk priority."""
+    started = time.monotonic()
+    with priority(BULK):
+        result: dict[str, Any] = {
+            "recipes": sync_recipes(mirror, client, full=full),
+            **sync_lists(mirror, client),
+        }
+    result["seconds"] = round(time.monotonic() - started, 3)
+    return result
+
+
+class MirrorSync(threading.Thread):
+    """Background thread running :func:`sync` every ``interval`` seconds."""
+
+    def __init__(
+        self,
+        mirror: Mirror,
+        get_client: Callable[[], Any],
+        interval: float = 300.0,
+        reconcile: float = 3600.0,
+    ):
+        super().__init__(name="mealie-mirror", daemon=True)
+        self.mirror = mirror
+        self._get_client = get_client
+        self.interval = interval
+        self.reconcile = reconcile
+        self._stopped = threading.Event()
+        self._last_full = 0.0
+
+    def run(self) -> None:
+        while not self._stopped.is_set():
+            full = time.monotonic() - self._last_full >= self.reconcile
+            try:
+                result = sync(self.mirror, self._get_client(), full=full)
+                if full:
+                    self._last_full = time.monotonic()
+                logger.info("Mirror sync (full=%s): %s", full, result)
+            except Exception as e:  # noqa: BLE001 - retried next interval
+                logger.warning("Mirror sync failed: error_type=%s", type(e).__name__)
+            self._stopped.wait(self.interval)
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+_mirror: Mirror | None = None
+_sync: MirrorSync | None = None
+_mirror_lock = threading.Lock()
+
+
+def current_mirror() -> Mirror | None:
+    """The server's mirror, once :func:`start_mirror` has opened it."""
+    return _mirror
+
+
+def start_mirror() -> Mirror | None:
+    """Open the mirror and start its sync thread when ``MEALIE_MIRROR_PATH`` is set."""
+    global _mirror, _sync
+    from agent_utilities.core.config import setting
+
+    path = setting("MEALIE_MIRROR_PATH", "")
+    if not path:
+        return None
+    with _mirror_lock:
+        if _mirror is None:
+            from mealie_mcp.auth import get_client
+
+            _mirror = Mirror(path)
+            _sync = MirrorSync(
+                _mirror,
+                get_client,
+                interval=float(setting("MEALIE_MIRROR_INTERVAL", 300.0)),
+                reconcile=float(setting("MEALIE_MIRROR_RECONCILE", 3600.0)),
+            )
+            _sync.start()
+        return _mirror
+
+
+def stop_mirror(timeout: float | None = 10.0) -> None:
+    """Stop the sync thread, wait up to ``timeout`` for it and close the mirror."""
+    global _mirror, _sync
+    with _mirror_lock:
+        mirror, thread = _mirror, _sync
+        _mirror = _sync = None
+    if thread is not None:
+        thread.stop()
+        thread.join(timeout)
+    if mirror is not None:
+        mirror.close()
+
+
+atexit.register(stop_mirror)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Compare decode time and peak memory of the Mealie response decoders.
+
+Runs every installed JSON backend, full and with an ``items[*]`` projection,
+over recorded Mealie responses (``--payload``, e.g. a saved
+``GET /api/recipes?perPage=500`` body) or, without any, over synthetic
+recipe and food pages shaped like Mealie's.
+
+    python scripts/benchmark_json_decode.py --payload recipes.json --fields id,slug,name
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mealie_mcp.api.json_codec import BACKENDS, JsonDecoder, _available  # noqa: E402
+
+
+def _recipe(i: int) -> dict:
+    return {
+        "id": f"00000000-0000-0000-0000-{i:012d}",
+        "userId": "u-1",
+        "householdId": "h-1",
+        "groupId": "g-1",
+        "name": f"Recipe {i}",
+        "slug": f"recipe-{i}",
+        "image": "abcd",
+        "recipeServings": 4.0,
+        "recipeYieldQuantity": 0.0,
+        "recipeYield": "4 servings",
+        "totalTime": "45 minutes",
+        "prepTime": "15 minutes",
+        "cookTime": None,
+        "performTime": "30 minutes",
+        "description": "A hearty dish with plenty of vegetables. " * 4,
+        "recipeCategory": [
+            {"id": "c-1", "name": "Dinner", "slug": "dinner", "groupId": "g-1"}
+        ],
+        "tags": [
+            {"id": f"t-{t}", "name": f"Tag {t}", "slug": f"tag-{t}", "groupId": "g-1"}
+            for t in range(3)
+        ],
+        "tools": [],
+        "rating": 4.0,
+        "orgURL": f"https://example.com/recipes/{i}",
+        "dateAdded": "2025-01-01",
+        "dateUpdated": "2025-01-02T10:00:00",
+        "createdAt": "2025-01-01T10:00:00",
+        "updatedAt": "2025-01-02T10:00:00",
+        "lastMade": None,
+    }
+
+
+def _food(i: int) -> dict:
+    return {
+        "id": f"f-{i}",
+        "name": f"food {i}",
+        "pluralName": f"foods {i}",
+        "description": "",
+        "extras": {},
+        "labelId": None,
+        "aliases": [{"name": f"alias {i}"}],
+        "householdsWithIngredientFood": [],
+        "label": None,
+        "createdAt": "2025-01-01T10:00:00",
+        "updatedAt": "2025-01-01T10:00:00",
+    }
+
+
+def _page(items: list) -> bytes:
+    return json.dumps(
+        {
+            "page": 1,
+            "per_page": len(items),
+            "total": len(items),
+            "total_pages": 1,
+            "items": items,
+            "next": None,
+            "previous": None,
+        }
+    ).encode()
+
+
+def _measure(decode, body: bytes, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = decode(body)
+        best = min(best, time.perf_counter() - start)
+        del result
+    tracemalloc.start()
+    result = decode(body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payload", action="append", type=Path, default=[])
+    parser.add_argument("--fields", default="id,slug,name")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payloads = {p.name: p.read_bytes() for p in args.payload} or {
+        "recipes x500 (synthetic)": _page([_recipe(i) for i in range(500)]),
+        "foods x10000 (synthetic)": _page([_food(i) for i in range(10_000)]),
+    }
+    fields = tuple(f for f in args.fields.split(",") if f)
+    backends = [b for b in BACKENDS if _available(b)]
+
+    print(f"{'payload':<28} {'backend':<8} {'mode':<10} {'ms':>9} {'peak MiB':>9}")
+    for name, body in payloads.items():
+        print(f"{name} ({len(body) / 1024 / 1024:.1f} MiB)")
+        # Projected decodes go through msgspec whenever it is installed,
+        # whatever the configured backend, so they are measured once.
+        runs = [(b, JsonDecoder(b), "full", None) for b in backends]
+        projecting = "msgspec" if _available("msgspec") else backends[0]
+        runs.append((projecting, JsonDecoder(), "projected", fields))
+        for backend, decoder, mode, wanted in runs:
+            seconds, peak = _measure(
+                lambda b, w=wanted, d=decoder: d.decode(b, w), body, args.repeat
+            )
+            print(
+                f"{'':<28} {backend:<8} {mode:<10} "
+                f"{seconds * 1000:>9.1f} {peak / 1024 / 1024:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 """Shared test fixtures for Mealie Mcp."""
 
+import httpx
 import pytest
 
 
@@ -8,3 +9,19 @@ def mock_env(monkeypatch):
     """Set standard test environment variables."""
     monkeypatch.setenv("MEALIE_URL", "https://test.example.com")
     monkeypatch.setenv("MEALIE_TOKEN", "test-token-12345")
+
+
+@pytest.fixture
+def mock_client():
+    """Factory for an ``AsyncApi`` whose requests are answered by ``handler``.
+
+    ``handler`` is an ``httpx.MockTransport`` handler; keyword arguments are
+    passed to ``AsyncApi``.
+    """
+    from mealie_mcp.api_client import AsyncApi
+
+    def make(handler, **kwargs):
+        kwargs.setdefault("base_url", "https://mealie.test")
+        return AsyncApi(transport=httpx.MockTransport(handler), **kwargs)
+
+    return make
@@ -0,0 +1,86 @@
+"""Asyncio client twin — same operation surface, awaited on the event loop."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from mealie_mcp.api_client import Api, AsyncApi
+from mealie_mcp.dispatch import run_action
+
+
+def test_async_api_covers_sync_surface():
+    sync_ops = {n for n in dir(Api) if not n.startswith("_")}
+    async_ops = {n for n in dir(AsyncApi) if not n.startswith("_")}
+    assert sync_ops <= async_ops
+
+
+@pytest.mark.asyncio
+async def test_async_operation_is_awaited(mock_client):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"items": [{"slug": "carbonara"}]})
+
+    client = mock_client(handler, token="test-token-12345")
+    result = await client.get_recipes(page=2, per_page=10)
+    await client.aclose()
+
+    assert result == {"items": [{"slug": "carbonara"}]}
+    assert seen[0].url.path == "/api/recipes"
+    assert seen[0].url.params["perPage"] == "10"
+    assert seen[0].headers["Authorization"] == "Bearer test-token-12345"
+
+
+@pytest.mark.asyncio
+async def test_async_error_and_empty_responses(mock_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        return httpx.Response(404)
+
+    client = mock_client(handler, token="test-token-12345")
+    assert await client.delete_recipes_slug(slug="gone") == {"status": "success"}
+    with pytest.raises(Exception, match="API error: 404"):
+        await client.get_recipes_slug(slug="missing")
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_run_action_folds_body_fields(mock_client):
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.content)
+        return httpx.Response(201, json={"id": "f-1"})
+
+    client = mock_client(handler, token="test-token-12345")
+    result = await run_action(client.post_foods, name="Basil")
+    await client.aclose()
+
+    assert result == {"id": "f-1"}
+    assert bodies == [b'{"name":"Basil"}']
+
+
+@pytest.mark.asyncio
+async def test_transport_stats_track_concurrency_and_streams(mock_client):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={})
+
+    client = mock_client(handler, token="test-token-12345")
+    await asyncio.gather(*(client.get_foods(page=p) for p in range(5)))
+    stats = client._stats
+    await stats.trace("connection.connect_tcp.complete", {})
+    await stats.trace("http2.send_connection_init.complete", {})
+    for _ in range(5):
+        await stats.trace("http2.send_request_headers.started", {})
+    await client.aclose()
+
+    snapshot = client.client_stats()["transport"]
+    assert snapshot["requests"] == 5
+    assert snapshot["peak_in_flight"] == 5
+    assert snapshot["in_flight"] == 0
+    assert snapshot["http2_streams"] == 5
+    assert snapshot["multiplexed_streams"] == 4
@@ -0,0 +1,65 @@
+"""Concurrent batch detail fetches."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from mealie_mcp.api.batch import unique_keys
+
+
+def test_unique_keys_keeps_first_occurrence():
+    assert unique_keys(["b", "a", " b ", "", "a", 7]) == ["b", "a", "7"]
+
+
+@pytest.mark.asyncio
+async def test_async_batch_dedupes_bounds_concurrency_and_reports_errors(mock_client):
+
+    in_flight = peak = 0
+    fetched = []
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        slug = request.url.path.rsplit("/", 1)[-1]
+        fetched.append(slug)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if slug == "missing":
+            return httpx.Response(404, json={"detail": "not found"})
+        return httpx.Response(200, json={"slug": slug, "recipeIngredient": []})
+
+    client = mock_client(handler)
+    slugs = ["a", "b", "a", "missing", "c", "d", "e"]
+    result = await client.get_recipes_batch(slugs, concurrency=2)
+    await client.aclose()
+
+    assert sorted(fetched) == ["a", "b", "c", "d", "e", "missing"]
+    assert peak == 2
+    assert list(result["recipes"]) == ["a", "b", "c", "d", "e"]
+    assert result["recipes"]["a"] == {"slug": "a", "recipeIngredient": []}
+    assert result["errors"] == {
+        "missing": {"error": "API error: 404", "status_code": 404}
+    }
+    assert (result["requested"], result["unique"]) == (7, 6)
+
+
+def test_sync_batch_runs_in_worker_threads(monkeypatch):
+    from mealie_mcp.api.errors import MealieApiError
+    from mealie_mcp.api_client import Api
+
+    client = Api(base_url="https://mealie.test")
+
+    def fake_get(slug, accept_language=None):
+        if slug == "gone":
+            raise MealieApiError(404)
+        return {"slug": slug.removeprefix("id-")}
+
+    monkeypatch.setattr(client, "get_recipes_slug", fake_get)
+    result = client.get_recipes_batch(["x", "gone", "x", "id-y"])
+
+    assert result["recipes"] == {"x": {"slug": "x"}, "y": {"slug": "y"}}
+    assert result["slugs"] == {"x": "x", "id-y": "y"}
+    assert result["errors"]["gone"]["status_code"] == 404
+    assert client.get_recipes_batch([])["unique"] == 0
@@ -0,0 +1,88 @@
+"""Catalog cache of organizers, foods, units and labels."""
+
+import httpx
+import pytest
+
+from mealie_mcp.api.catalog import CatalogCache, shared_catalog
+from mealie_mcp.api.client_pool import client_key
+
+
+def _client(mock_client, catalog):
+    lists = []
+    foods = [{"id": "f-1", "slug": "olive-oil", "name": "Olive Oil"}]
+
+    def handler(request):
+        if request.method == "GET":
+            lists.append(request.url.path)
+            return httpx.Response(
+                200, json={"items": list(foods), "total": len(foods), "total_pages": 1}
+            )
+        foods.append({"id": "f-2", "slug": "salt", "name": "Salt"})
+        return httpx.Response(201, json=foods[-1])
+
+    client = mock_client(handler, catalog=catalog)
+    return client, lists
+
+
+@pytest.mark.asyncio
+async def test_lookups_are_served_from_memory_until_a_write(mock_client):
+    client, lists = _client(mock_client, CatalogCache(ttl=60))
+    assert (await client.catalog_lookup("foods", "olive oil"))["id"] == "f-1"
+    assert (await client.catalog_lookup("foods", "olive-oil"))["name"] == "Olive Oil"
+    assert await client.catalog_lookup("foods", "f-1") is not None
+    assert await client.catalog_lookup("foods", "salt") is None
+    assert lists == ["/api/foods"]
+
+    await client.post_foods(data={"name": "Salt"})
+    assert (await client.catalog_lookup("foods", "SALT"))["id"] == "f-2"
+    await client.aclose()
+
+    assert lists == ["/api/foods", "/api/foods"]
+    assert client.client_stats()["catalog"]["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_ttl_expiry_and_no_cache_both_reload(mock_client):
+    client, lists = _client(mock_client, CatalogCache(ttl=0))
+    await client.catalog("foods")
+    await client.catalog("foods")
+    uncached, uncached_lists = _client(mock_client, None)
+    await uncached.catalog("foods")
+    await uncached.catalog("foods")
+    await client.aclose()
+    await uncached.aclose()
+
+    assert len(lists) == 2 and len(uncached_lists) == 2
+
+
+def test_writes_invalidate_only_related_catalogs():
+    cache = CatalogCache()
+    for kind in ("tags", "foods", "units", "labels"):
+        cache.put(kind, [], 0)
+    cache.invalidate_for("GET", "/api/foods")
+    cache.invalidate_for("PUT", "/api/recipes/carbonara")
+    cache.invalidate_for("POST", "/api/groups/seeders/units")
+    cache.invalidate_for("PUT", "/api/foodstuff")
+    assert cache.snapshot()["cached"] == ["foods", "labels"]
+
+
+def test_load_racing_a_write_is_not_kept():
+    cache = CatalogCache()
+    _, generation = cache.get("units")
+    cache.invalidate_for("PUT", "/api/units/merge")
+    cache.put("units", [{"id": "u-1"}], generation)
+    assert cache.get("units")[0] is None
+
+
+def test_tokens_on_one_instance_get_separate_catalogs():
+    alice = shared_catalog(client_key("https://mealie.test", "token-a"))
+    bob = shared_catalog(client_key("https://mealie.test", "token-b"))
+    assert alice is not None and bob is not None and alice is not bob
+    assert shared_catalog(client_key("https://mealie.test", "token-a")) is alice
+
+
+def test_unknown_catalog_is_rejected():
+    from mealie_mcp.api_client import Api
+
+    with pytest.raises(ValueError):
+        Api(base_url="https://mealie.test").catalog("recipes")
@@ -0,0 +1,109 @@
+"""Per-endpoint-group circuit breakers."""
+
+import httpx
+import pytest
+
+from mealie_mcp.api.circuit import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakers,
+    endpoint_group,
+)
+from mealie_mcp.api.errors import CircuitOpenError, MealieApiError
+from mealie_mcp.api.retry import RetryPolicy
+
+
+@pytest.mark.parametrize(
+    ("method", "endpoint", "expected"),
+    [
+        ("POST", "/api/recipes/create/url", "scraper"),
+        ("POST", "/api/recipes/create/url/bulk", "scraper"),
+        ("POST", "/api/recipes/test-scrape-url", "scraper"),
+        ("POST", "/api/recipes/carbonara/image", "scraper"),
+        ("PUT", "/api/recipes/carbonara/image", "recipes"),
+        ("POST", "/api/recipes/create/image", "openai"),
+        ("POST", "/api/admin/debug/openai", "openai"),
+        ("POST", "/api/parser/ingredients", "parser"),
+        ("GET", "/api/foods?page=2", "foods"),
+        ("GET", "/api/admin/about", "admin"),
+    ],
+)
+def test_endpoint_groups(method, endpoint, expected):
+    assert endpoint_group(method, endpoint) == expected
+
+
+def test_opens_after_threshold_and_half_opens_with_one_probe(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("mealie_mcp.api.circuit.time.monotonic", lambda: clock[0])
+    breaker = CircuitBreaker("scraper", failure_threshold=2, reset_timeout=10.0)
+
+    for _ in range(2):
+        breaker.record(False, breaker.before())
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.before()
+    assert excinfo.value.retry_after == "10"
+
+    clock[0] += 10.0
+    assert breaker.before() is True
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before()
+    breaker.record(False, probe=True)
+    assert breaker.state == OPEN
+
+    clock[0] += 10.0
+    breaker.record(True, breaker.before())
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["opened"] == 2
+
+
+def test_abandoned_probe_frees_the_probe_slot():
+    breaker = CircuitBreaker("openai", failure_threshold=1, reset_timeout=0.0)
+    breaker.record(False)
+    breaker.record(None, breaker.before())
+    assert breaker.before() is True
+
+
+@pytest.mark.asyncio
+async def test_open_group_fails_fast_without_touching_other_groups(mock_client):
+
+    sent = []
+
+    def handler(request):
+        sent.append(request.url.path)
+        if request.url.path.startswith("/api/recipes/create"):
+            return httpx.Response(502)
+        return httpx.Response(200, json={})
+
+    client = mock_client(
+        handler,
+        retry=RetryPolicy(max_attempts=1),
+        breakers=CircuitBreakers(failure_threshold=2),
+    )
+    for _ in range(2):
+        with pytest.raises(MealieApiError):
+            await client.parse_recipe_url(data={"url": "https://x"})
+    with pytest.raises(CircuitOpenError):
+        await client.parse_recipe_url(data={"url": "https://x"})
+    assert await client.get_foods() == {}
+    await client.aclose()
+
+    assert sent.count("/api/recipes/create/url") == 2
+    assert client.client_stats()["circuits"]["scraper"]["state"] == OPEN
+
+
+@pytest.mark.asyncio
+async def test_run_action_returns_structured_error_when_open():
+    from mealie_mcp.dispatch import run_action
+
+    async def scrape(data: dict):
+        raise CircuitOpenError("scraper", 12.4)
+
+    result = await run_action(scrape, url="https://x")
+    assert result["error"] == "circuit_open"
+    assert result["group"] == "scraper"
+    assert result["retry_after"] == 12
+    assert result["message"].startswith("API error: 503")
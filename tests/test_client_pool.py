@@ -0,0 +1,63 @@
+"""Pooled client registry — one keep-alive client per connection identity."""
+
+from mealie_mcp.api.client_pool import ClientRegistry, client_key
+
+
+class _FakeClient:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_registry_reuses_client_per_key():
+    registry = ClientRegistry()
+    built = []
+
+    def factory():
+        built.append(_FakeClient())
+        return built[-1]
+
+    key = client_key("https://mealie.test/", "token-a")
+    first = registry.get(key, factory)
+    second = registry.get(client_key("https://mealie.test", "token-a"), factory)
+
+    assert first is second
+    assert len(built) == 1
+    assert len(registry) == 1
+
+
+def test_registry_separates_tokens_and_tls_profiles():
+    registry = ClientRegistry()
+    a = registry.get(client_key("https://mealie.test", "token-a"), _FakeClient)
+    b = registry.get(client_key("https://mealie.test", "token-b"), _FakeClient)
+    c = registry.get(
+        client_key("https://mealie.test", "token-a", ("pki", None)), _FakeClient
+    )
+    assert len({id(a), id(b), id(c)}) == 3
+
+
+def test_client_key_does_not_embed_token():
+    key = client_key("https://mealie.test", "super-secret-token")
+    assert "super-secret-token" not in repr(key)
+
+
+def test_close_all_closes_and_forgets_clients():
+    registry = ClientRegistry()
+    client = registry.get(client_key("https://mealie.test", "t"), _FakeClient)
+    registry.close_all()
+    assert client.closed
+    assert len(registry) == 0
+    registry.close_all()
+
+
+def test_get_client_is_pooled(monkeypatch):
+    from mealie_mcp import auth
+
+    monkeypatch.setenv("MEALIE_BASE_URL", "https://mealie.test")
+    monkeypatch.setenv("MEALIE_TOKEN", "test-token-12345")
+    try:
+        assert auth.get_client() is auth.get_client()
+    finally:
+        auth.close_clients()
@@ -0,0 +1,86 @@
+"""Response byte budget and continuation cursors."""
+
+import pytest
+
+from mealie_mcp.continuation import CursorExpired, ResultBudget, json_size
+
+
+def _page(n):
+    items = [{"id": i, "name": f"recipe {i}", "notes": "x" * 50} for i in range(n)]
+    return {"page": 1, "total": n, "items": items}
+
+
+def test_small_and_non_list_results_pass_through():
+    budget = ResultBudget(max_bytes=200)
+    assert budget.apply("get_foods", _page(1)) == _page(1)
+    detail = {"name": "y" * 500}
+    assert budget.apply("get_recipes_slug", detail) == detail
+
+
+def test_chunks_fit_the_budget_and_resume_in_order():
+    budget = ResultBudget(max_bytes=400)
+    chunk = budget.apply("get_recipes", _page(20))
+    seen = list(chunk["items"])
+    assert chunk["total"] == 20 and chunk["remaining"] == 20 - len(seen)
+    while "cursor" in chunk:
+        assert json_size(chunk) <= 400
+        chunk = budget.resume("get_recipes", chunk["cursor"])
+        seen.extend(chunk["items"])
+    assert seen == _page(20)["items"]
+    assert chunk["total"] == 20
+    assert budget.snapshot()["pending"] == 0
+
+
+def test_zero_budget_on_resume_returns_the_whole_remainder():
+    budget = ResultBudget(max_bytes=300)
+    first = budget.apply("get_recipes", _page(10))
+    rest = budget.resume("get_recipes", first["cursor"], max_bytes=0)
+    assert "cursor" not in rest
+    assert len(first["items"]) + len(rest["items"]) == 10
+
+
+def test_cursor_is_single_use_and_bound_to_its_action():
+    budget = ResultBudget(max_bytes=300)
+    cursor = budget.apply("get_recipes", _page(10))["cursor"]
+    with pytest.raises(CursorExpired):
+        budget.resume("get_foods", cursor)
+    with pytest.raises(CursorExpired):
+        budget.resume("get_recipes", cursor)
+
+
+def test_expired_and_evicted_cursors():
+    budget = ResultBudget(max_bytes=300, ttl=0.0)
+    cursor = budget.apply("get_recipes", _page(10))["cursor"]
+    with pytest.raises(CursorExpired):
+        budget.resume("get_recipes", cursor)
+
+    budget = ResultBudget(max_bytes=300, entries=1)
+    first = budget.apply("get_recipes", _page(10))["cursor"]
+    budget.apply("get_recipes", _page(10))
+    with pytest.raises(CursorExpired):
+        budget.resume("get_recipes", first)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_resumes_without_calling_mealie():
+    from mealie_mcp.dispatch import prepare_call, run_action
+
+    calls = []
+
+    async def get_recipes(**kwargs):
+        calls.append(kwargs)
+        return _page(30)
+
+    first = await run_action(get_recipes, **prepare_call(None, {"max_bytes": 1000}))
+    items = list(first["items"])
+    cursor = first["cursor"]
+    while cursor:
+        kwargs = prepare_call(None, {"cursor": cursor, "max_bytes": 1000})
+        chunk = await run_action(get_recipes, **kwargs)
+        items.extend(chunk["items"])
+        cursor = chunk.get("cursor")
+
+    assert items == _page(30)["items"]
+    assert len(calls) == 1
+    expired = await run_action(get_recipes, **prepare_call(None, {"cursor": "nope"}))
+    assert expired["error"] == "cursor_expired"
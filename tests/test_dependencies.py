@@ -0,0 +1,150 @@
+"""Write -> read dependency map and the response cache that consumes it."""
+
+import re
+from pathlib import Path
+
+import httpx
+import pytest
+
+from mealie_mcp.api.dependencies import (
+    DEPENDENCIES,
+    NO_EFFECT,
+    invalidated_reads,
+    is_stale,
+)
+from mealie_mcp.api.http_cache import HttpCache
+
+_CALL = re.compile(
+    r'self\.(?:request|download|request_bytes)\(\s*"([A-Z]+)",\s*f?"([^"]+)"'
+)
+
+
+def _templates():
+    found = set()
+    api = Path(__file__).parents[1] / "mealie_mcp" / "api"
+    for path in api.glob("api_client_*.py"):
+        found.update(_CALL.findall(path.read_text()))
+    return found
+
+
+def _prefix_of(prefix, template):
+    return template == prefix or template.startswith(prefix + "/")
+
+
+def test_map_keys_are_real_write_templates():
+    writes = [path for method, path in _templates() if method != "GET"]
+    assert writes
+    for prefix in [*DEPENDENCIES, *NO_EFFECT]:
+        assert any(_prefix_of(prefix, w) for w in writes), prefix
+
+
+def test_every_write_action_invalidates_its_resource_reads():
+    templates = _templates()
+    reads = [path for method, path in templates if method == "GET"]
+    for method, write in templates:
+        if method == "GET" or any(_prefix_of(p, write) for p in NO_EFFECT):
+            continue
+        patterns = invalidated_reads(method, re.sub(r"{[^}]+}", "x", write))
+        for read in reads:
+            related = _prefix_of(read, write) and read.count("/") > 1
+            if related or _prefix_of(write, read):
+                concrete = re.sub(r"{[^}]+}", "x", read)
+                assert is_stale(patterns, concrete), (method, write, read)
+
+
+def _client(monkeypatch):
+    """Sync client against a server whose every write bumps a version."""
+    from mealie_mcp.api_client import Api
+
+    state = {"version": 0, "gets": []}
+    client = Api(base_url="https://mealie.test", cache=HttpCache(ttl=60))
+
+    def fake_request(**kwargs):
+        path = httpx.URL(kwargs["url"]).path
+        if kwargs["method"] == "GET":
+            state["gets"].append(path)
+        else:
+            state["version"] += 1
+        response = httpx.Response(200, json={"version": state["version"]})
+        response.read()
+        return response
+
+    monkeypatch.setattr(client._session, "request", fake_request)
+    return client, state
+
+
+# (write method, write path, read path the write must not leave stale)
+DEPENDENT = [
+    ("PATCH", "/api/recipes/pasta", "/api/recipes/pasta"),
+    ("PATCH", "/api/recipes/pasta", "/api/recipes"),
+    ("PATCH", "/api/recipes/pasta", "/api/recipes/suggestions"),
+    ("PATCH", "/api/recipes/pasta", "/api/recipes/9f1c2e"),
+    ("PUT", "/api/recipes/pasta", "/api/organizers/tags"),
+    ("DELETE", "/api/recipes/pasta", "/api/users/self/favorites"),
+    ("POST", "/api/recipes/bulk-actions/tag", "/api/recipes/soup"),
+    ("POST", "/api/recipes/bulk-actions/tag", "/api/organizers/tags"),
+    ("PATCH", "/api/recipes/soup/last-made", "/api/recipes/timeline/events"),
+    ("POST", "/api/recipes/timeline/events", "/api/recipes/soup"),
+    ("POST", "/api/comments", "/api/recipes/soup/comments"),
+    ("PUT", "/api/organizers/tags/t1", "/api/organizers/tags/t1"),
+    ("PUT", "/api/organizers/tags/t1", "/api/organizers/tags/slug/quick"),
+    ("PUT", "/api/organizers/tags/t1", "/api/recipes/soup"),
+    ("POST", "/api/organizers/tags", "/api/organizers/tags/empty"),
+    ("PUT", "/api/foods/f1", "/api/recipes/soup"),
+    ("PUT", "/api/foods/f1", "/api/households/shopping/lists/l1"),
+    ("PUT", "/api/foods/merge", "/api/foods/f2"),
+    ("PUT", "/api/units/merge", "/api/units"),
+    ("POST", "/api/groups/seeders/foods", "/api/foods"),
+    ("PUT", "/api/groups/labels/l1", "/api/households/shopping/items/i1"),
+    ("POST", "/api/households/shopping/items", "/api/households/shopping/lists/l1"),
+    ("DELETE", "/api/households/shopping/lists/l1", "/api/households/shopping/items"),
+    ("PUT", "/api/households/mealplans/5", "/api/households/mealplans"),
+    ("PUT", "/api/households/mealplans/5", "/api/households/mealplans/today"),
+    ("POST", "/api/users/u1/ratings/soup", "/api/recipes/soup"),
+    ("POST", "/api/users/u1/favorites/soup", "/api/users/self/favorites"),
+    ("PUT", "/api/admin/users/u1", "/api/users/self"),
+    ("POST", "/api/admin/backups/b.zip/restore", "/api/foods/f1"),
+]
+
+INDEPENDENT = [
+    ("PUT", "/api/households/shopping/lists/l1", "/api/recipes/soup"),
+    ("PUT", "/api/households/mealplans/5", "/api/foods"),
+    ("PUT", "/api/foods/f1", "/api/foods/f2"),
+    ("POST", "/api/parser/ingredient", "/api/foods"),
+    ("POST", "/api/households/webhooks/w1/test", "/api/households/webhooks/w1"),
+]
+
+
+@pytest.mark.parametrize(("method", "write", "read"), DEPENDENT)
+def test_no_stale_read_after_write(monkeypatch, method, write, read):
+    client, state = _client(monkeypatch)
+    assert client.request("GET", read) == {"version": 0}
+    assert client.request("GET", read) == {"version": 0}
+    client.request(method, write, data={})
+
+    assert client.request("GET", read) == {"version": 1}
+    assert state["gets"] == [read, read]
+
+
+@pytest.mark.parametrize(("method", "write", "read"), INDEPENDENT)
+def test_unrelated_reads_stay_cached(monkeypatch, method, write, read):
+    client, state = _client(monkeypatch)
+    client.request("GET", read)
+    client.request(method, write, data={})
+
+    assert client.request("GET", read) == {"version": 0}
+    assert state["gets"] == [read]
+    assert client.client_stats()["http_cache"]["fresh_hits"] == 1
+
+
+def test_read_racing_a_write_is_not_stored():
+    cache = HttpCache(ttl=60)
+    key = cache.key("/api/foods")
+    generation = cache.generation
+    cache.invalidate_for("POST", "/api/foods")
+    response = httpx.Response(200, json={"items": []})
+    response.read()
+    cache.store(key, response, {"items": []}, generation)
+
+    assert cache.lookup(key) is None
+    assert not is_stale(invalidated_reads("GET", "/api/foods"), "/api/foods")
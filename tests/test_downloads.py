@@ -0,0 +1,101 @@
+"""Binary media responses and streaming downloads to disk."""
+
+import hashlib
+
+import httpx
+import pytest
+
+from mealie_mcp.api.downloads import resolve_target
+from mealie_mcp.api.errors import MealieApiError
+
+_BODY = bytes(range(256)) * 8192  # 2 MiB, more than one chunk
+
+
+@pytest.mark.asyncio
+async def test_backup_streams_to_disk_with_digest(mock_client, tmp_path):
+    def handler(request):
+        assert request.url.path == "/api/admin/backups/nightly.zip"
+        return httpx.Response(
+            200, content=_BODY, headers={"Content-Type": "application/zip"}
+        )
+
+    client = mock_client(handler, download_dir=str(tmp_path))
+    summary = await client.get_admin_backups_file_name("nightly.zip", dest="b.zip")
+    await client.aclose()
+
+    target = tmp_path / "b.zip"
+    assert summary["path"] == str(target)
+    assert summary["size"] == len(_BODY) == target.stat().st_size
+    assert summary["sha256"] == hashlib.sha256(_BODY).hexdigest()
+    assert summary["content_type"] == "application/zip"
+    assert list(tmp_path.iterdir()) == [target]
+
+
+@pytest.mark.asyncio
+async def test_directory_target_uses_content_disposition(mock_client, tmp_path):
+    def handler(request):
+        return httpx.Response(
+            200,
+            content=b"zip",
+            headers={"Content-Disposition": 'attachment; filename="carbonara.zip"'},
+        )
+
+    client = mock_client(handler, download_dir=str(tmp_path))
+    summary = await client.get_shared_recipe_as_zip("tok", dest="shared/")
+    await client.aclose()
+
+    assert summary["path"] == str(tmp_path / "shared" / "carbonara.zip")
+
+
+@pytest.mark.asyncio
+async def test_error_status_leaves_no_partial_file(mock_client, tmp_path):
+    client = mock_client(
+        lambda request: httpx.Response(404), download_dir=str(tmp_path)
+    )
+    with pytest.raises(MealieApiError):
+        await client.download_file(token="t", dest="export.zip")
+    await client.aclose()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_targets_outside_download_dir_are_refused(tmp_path):
+    with pytest.raises(ValueError):
+        resolve_target("../escape.zip", "/api/utils/download", {}, tmp_path)
+    inside = resolve_target("a/b.zip", "/api/utils/download", {}, tmp_path)
+    assert inside == tmp_path.resolve() / "a" / "b.zip"
+
+
+def test_without_dest_the_body_is_returned(monkeypatch, tmp_path):
+    from mealie_mcp.api_client import Api
+
+    client = Api(base_url="https://mealie.test", download_dir=str(tmp_path))
+
+    def fake_request(**kwargs):
+        assert "stream" not in kwargs
+        response = httpx.Response(200, text="plain", request=httpx.Request("GET", "x"))
+        response.read()
+        return response
+
+    monkeypatch.setattr(client._session, "request", fake_request)
+    assert client.download_file(token="t")["text"] == "plain"
+
+
+@pytest.mark.asyncio
+async def test_media_endpoints_return_raw_bytes(mock_client, tmp_path):
+    from mealie_mcp.dispatch import run_action
+
+    def handler(request):
+        return httpx.Response(
+            200, content=b"\x89PNG", headers={"Content-Type": "image/png"}
+        )
+
+    client = mock_client(handler, download_dir=str(tmp_path))
+    image = await client.get_user_image("u-1", "profile.png")
+    result = await run_action(client.get_recipe_img, recipe_id="r-1", file_name="x")
+    asset = await client.get_recipe_asset("r-1", "card.png")
+    await client.aclose()
+
+    assert image.content == b"\x89PNG" and image.content_type == "image/png"
+    assert result == {"content_type": "image/png", "size": 4, "data": "iVBORw=="}
+    assert asset.content == b"\x89PNG"
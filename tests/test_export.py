@@ -0,0 +1,81 @@
+"""JSON Lines catalog export."""
+
+import gzip
+import json
+
+import httpx
+
+from mealie_mcp.api.pagination import parse_timestamp
+from mealie_mcp.export import export_catalog
+
+
+def _client(monkeypatch, records, reject_filter=False, seen=None):
+    from mealie_mcp.api_client import Api
+
+    client = Api(base_url="https://mealie.test")
+
+    def fake_request(**kwargs):
+        params = kwargs["params"]
+        if seen is not None:
+            seen.append(params.get("queryFilter"))
+        if reject_filter and params.get("queryFilter"):
+            response = httpx.Response(400, json={"detail": "bad filter"})
+        else:
+            page, per_page = params["page"], params["perPage"]
+            items = records[(page - 1) * per_page : page * per_page]
+            response = httpx.Response(
+                200,
+                json={
+                    "page": page,
+                    "total": len(records),
+                    "total_pages": -(-len(records) // per_page),
+                    "items": items,
+                },
+            )
+        response.read()
+        return response
+
+    monkeypatch.setattr(client._session, "request", fake_request)
+    return client
+
+
+def test_exports_every_record_one_per_line(monkeypatch, tmp_path):
+    records = [{"id": i, "name": f"food {i}"} for i in range(7)]
+    client = _client(monkeypatch, records)
+    summary = export_catalog(client, tmp_path, entities=["foods"], per_page=3)
+
+    lines = (tmp_path / "foods.jsonl").read_text().splitlines()
+    assert [json.loads(line) for line in lines] == records
+    assert summary["records"] == summary["entities"]["foods"]["records"] == 7
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["foods.jsonl"]
+
+
+def test_since_pushes_filter_and_checks_locally(monkeypatch, tmp_path):
+    records = [
+        {"id": 1, "updatedAt": "2024-12-31T23:59:59"},
+        {"id": 2, "updatedAt": "2025-01-02T08:00:00Z"},
+        {"id": 3},
+    ]
+    seen = []
+    client = _client(monkeypatch, records, reject_filter=True, seen=seen)
+    export_catalog(
+        client,
+        tmp_path,
+        entities=["recipes"],
+        since=parse_timestamp("2025-01-01"),
+        compress=True,
+    )
+
+    with gzip.open(tmp_path / "recipes.jsonl.gz", "rt") as f:
+        assert [json.loads(line)["id"] for line in f] == [2, 3]
+    assert seen[0] == 'updatedAt >= "2025-01-01T00:00:00"'
+    assert seen[-1] is None
+
+
+def test_since_offset_is_converted_to_utc_for_the_filter(monkeypatch, tmp_path):
+    seen = []
+    client = _client(monkeypatch, [], seen=seen)
+    since = parse_timestamp("2025-01-01T00:00:00+05:00")
+    export_catalog(client, tmp_path, entities=["foods"], since=since)
+
+    assert seen[0] == 'updatedAt >= "2024-12-31T19:00:00"'
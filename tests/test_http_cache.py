@@ -0,0 +1,94 @@
+"""Conditional GET revalidation through the validator cache."""
+
+import httpx
+import pytest
+
+from mealie_mcp.api.http_cache import HttpCache
+
+
+def _server(etag='"v1"'):
+    """Mock Mealie answering 304 when the client's validator still matches."""
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json={"items": [1, 2]}, headers={"ETag": etag})
+
+    return handler, seen
+
+
+@pytest.mark.asyncio
+async def test_not_modified_is_served_from_cache(mock_client):
+
+    handler, seen = _server()
+    client = mock_client(handler, cache=HttpCache())
+    first = await client.get_foods(page=1)
+    second = await client.get_foods(page=1)
+    await client.aclose()
+
+    assert first == second == {"items": [1, 2]}
+    assert "If-None-Match" not in seen[0].headers
+    assert seen[1].headers["If-None-Match"] == '"v1"'
+    stats = client.client_stats()["http_cache"]
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_params_and_writes_are_not_conflated(mock_client):
+
+    handler, seen = _server()
+    client = mock_client(handler, cache=HttpCache())
+    await client.get_foods(page=1)
+    await client.get_foods(page=2)
+    await client.post_foods(data={"name": "x"})
+    await client.aclose()
+
+    assert all("If-None-Match" not in r.headers for r in seen)
+
+
+def test_sync_client_sends_last_modified_validator(monkeypatch):
+    from mealie_mcp.api_client import Api
+
+    sent = []
+
+    class _Response:
+        def __init__(self, status, body=b'{"id": 1}'):
+            self.status_code = status
+            self.headers = {"Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+            self.content = body
+
+        def json(self):
+            return {"id": 1}
+
+    client = Api(base_url="https://mealie.test", cache=HttpCache())
+
+    def fake_request(**kwargs):
+        sent.append(kwargs["headers"])
+        return _Response(304 if kwargs["headers"] else 200)
+
+    monkeypatch.setattr(client._session, "request", fake_request)
+    assert (
+        client.get_foods_item_id("f-1") == client.get_foods_item_id("f-1") == {"id": 1}
+    )
+    assert sent[0] is None
+    assert sent[1] == {"If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT"}
+
+
+def test_lru_is_bounded_by_entries_and_bytes():
+    cache = HttpCache(max_entries=2, max_bytes=10)
+
+    class _Response:
+        status_code = 200
+        headers = {"ETag": '"x"'}
+        content = b"1234"
+
+    for page in range(3):
+        cache.store(cache.key("/api/foods", {"page": page}), _Response(), page)
+    assert cache.lookup(cache.key("/api/foods", {"page": 0})) is None
+    assert cache.snapshot()["entries"] == 2 and cache.snapshot()["evictions"] == 1
+
+    _Response.content = b"x" * 11
+    cache.store(cache.key("/api/big"), _Response(), "big")
+    assert cache.lookup(cache.key("/api/big")) is None
@@ -0,0 +1,137 @@
+"""Response decoding backends and ``items[*]`` projection."""
+
+import json
+
+import httpx
+import pytest
+
+from mealie_mcp.api.json_codec import BACKENDS, JsonDecoder, _available, item_fields
+
+_PAGE = {
+    "page": 1,
+    "per_page": 2,
+    "total": 2,
+    "total_pages": 1,
+    "items": [
+        {"id": "r-1", "slug": "carbonara", "name": "Carbonara", "tags": [{"a": 1}]},
+        {"id": "r-2", "slug": "ramen", "description": "x" * 100},
+    ],
+    "next": None,
+    "previous": None,
+}
+_BODY = json.dumps(_PAGE).encode()
+
+_INSTALLED = [b for b in BACKENDS if _available(b)]
+
+
+@pytest.mark.parametrize("backend", _INSTALLED)
+def test_backends_decode_identically(backend):
+    decoder = JsonDecoder(backend)
+    assert decoder.decode(_BODY) == _PAGE
+    assert decoder.decode(b'["a", 1]') == ["a", 1]
+    with pytest.raises(ValueError):
+        decoder.decode(b"<html>")
+
+
+@pytest.mark.parametrize("backend", _INSTALLED)
+def test_projection_keeps_envelope_and_requested_item_fields(backend):
+    projected = JsonDecoder(backend).decode(_BODY, ("slug", "name"))
+    assert projected["items"] == [
+        {"slug": "carbonara", "name": "Carbonara"},
+        {"slug": "ramen"},
+    ]
+    assert {k: v for k, v in projected.items() if k != "items"} == {
+        k: v for k, v in _PAGE.items() if k != "items"
+    }
+
+
+def test_projection_leaves_non_page_bodies_whole():
+    decoder = JsonDecoder()
+    recipe = {"id": "r-1", "slug": "carbonara", "recipeIngredient": []}
+    assert decoder.decode(json.dumps(recipe).encode(), ("slug",)) == recipe
+    odd = {"items": ["a", "b"], "total": 2}
+    assert decoder.decode(json.dumps(odd).encode(), ("slug",)) == odd
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        JsonDecoder("simdjson")
+
+
+@pytest.mark.asyncio
+async def test_client_projects_items_within_scope(mock_client):
+
+    client = mock_client(lambda request: httpx.Response(200, json=_PAGE))
+    with item_fields(["slug"]):
+        projected = await client.get_recipes()
+    full = await client.get_recipes()
+    await client.aclose()
+
+    assert projected["items"] == [{"slug": "carbonara"}, {"slug": "ramen"}]
+    assert full == _PAGE
+
+
+def test_select_fields_on_pages_and_details():
+    from mealie_mcp.api.json_codec import select_fields
+
+    page = select_fields(_PAGE, ["slug", "tags.a"])
+    assert page["items"] == [
+        {"slug": "carbonara", "tags": [{"a": 1}]},
+        {"slug": "ramen"},
+    ]
+    assert page["total"] == 2 and "next" in page
+    assert select_fields(_PAGE, ["items[*].id", "total"]) == {
+        **{k: _PAGE[k] for k in ("page", "per_page", "total", "total_pages")},
+        "next": None,
+        "previous": None,
+        "items": [{"id": "r-1"}, {"id": "r-2"}],
+    }
+    recipe = {
+        "name": "Ramen",
+        "nutrition": {"calories": 1},
+        "steps": [{"text": "a", "id": 1}],
+    }
+    assert select_fields(recipe, "name steps.text".split()) == {
+        "name": "Ramen",
+        "steps": [{"text": "a"}],
+    }
+    assert select_fields({"recipes": {"a": {"x": 1, "y": 2}}}, ["recipes.*.x"]) == {
+        "recipes": {"a": {"x": 1}}
+    }
+
+
+def test_page_item_fields_names_what_a_page_projection_keeps():
+    from mealie_mcp.api.json_codec import page_item_fields
+
+    assert page_item_fields(["slug", "tags.a", "items[*].id", "total"]) == (
+        "id",
+        "slug",
+        "tags",
+    )
+    assert page_item_fields(["total", "page"]) is None
+    assert page_item_fields(["slug", "items"]) is None
+    assert page_item_fields(["*.name"]) is None
+
+
+@pytest.mark.asyncio
+async def test_fields_option_decodes_list_pages_projected(mock_client):
+    from mealie_mcp.dispatch import prepare_call, run_action
+
+    client = mock_client(lambda request: httpx.Response(200, json=_PAGE))
+    decoded = []
+    decode = client.decoder.decode
+
+    def spy(content, fields=None):
+        decoded.append(fields)
+        return decode(content, fields)
+
+    client.decoder.decode = spy
+    kwargs = prepare_call(None, {"fields": ["slug", "total"]})
+    result = await run_action(client.get_recipes, **kwargs)
+    kwargs = prepare_call(None, {"fields": "name", "slug": "carbonara"})
+    await run_action(client.get_recipes_slug, **kwargs)
+    await client.aclose()
+
+    assert decoded == [("slug",), None]
+    assert result["items"] == [{"slug": "carbonara"}, {"slug": "ramen"}]
+    assert result["total"] == 2
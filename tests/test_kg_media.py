@@ -1,7 +1,7 @@
 """Native epistemic-graph media ingestion — Wire-First live-path coverage.
 
 Exercises the real ``ingest_recipe_image`` / ``fetch_recipe_image_bytes`` seam with a
-fake ``MediaStore`` and a fake HTTP session (no engine required).
+fake ``MediaStore`` and a patched HTTP session (no engine required).
 CONCEPT:AU-KG.ingest.list-durable-media.
 """
 
@@ -9,7 +9,11 @@
 
 from dataclasses import dataclass
 
-from mealie_mcp.kg_media import fetch_recipe_image_bytes, ingest_recipe_image
+from mealie_mcp.kg_media import (
+    fetch_recipe_image,
+    fetch_recipe_image_bytes,
+    ingest_recipe_image,
+)
 
 
 @dataclass
@@ -68,38 +72,39 @@ def test_ingest_recipe_image_noops_without_id():
     )
 
 
-class _FakeResp:
-    def __init__(self, status_code, content):
-        self.status_code = status_code
-        self.content = content
+def _client(status_code, content, calls):
+    import httpx
 
+    from mealie_mcp.api_client import Api
 
-class _FakeSession:
-    def __init__(self, resp):
-        self._resp = resp
-        self.calls = []
-
-    def get(self, url, **kw):
-        self.calls.append(url)
-        return self._resp
+    client = Api(base_url="https://mealie.test")
 
+    def fake_request(**kwargs):
+        calls.append(kwargs["url"])
+        response = httpx.Response(
+            status_code, content=content, headers={"Content-Type": "image/webp"}
+        )
+        response.read()
+        return response
 
-class _FakeApiClient:
-    def __init__(self, resp):
-        self.base_url = "https://mealie.test"
-        self._session = _FakeSession(resp)
-        self.proxies = None
+    client._session.request = fake_request
+    return client
 
 
 def test_fetch_recipe_image_bytes_ok():
-    client = _FakeApiClient(_FakeResp(200, b"IMGDATA"))
+    calls = []
+    client = _client(200, b"IMGDATA", calls)
     data = fetch_recipe_image_bytes(client, "r-1")
     assert data == b"IMGDATA"
-    assert client._session.calls == [
-        "https://mealie.test/api/media/recipes/r-1/images/original.webp"
-    ]
+    assert calls == ["https://mealie.test/api/media/recipes/r-1/images/original.webp"]
+
+
+def test_fetch_recipe_image_carries_content_type():
+    image = fetch_recipe_image(_client(200, b"IMGDATA", []), "r-1")
+    assert image.content_type == "image/webp"
+    assert image.size == 7
 
 
 def test_fetch_recipe_image_bytes_error_is_none():
-    client = _FakeApiClient(_FakeResp(404, b""))
+    client = _client(404, b"", [])
     assert fetch_recipe_image_bytes(client, "r-1") is None
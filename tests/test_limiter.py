@@ -0,0 +1,128 @@
+"""Adaptive concurrency limit and interactive reservation."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from mealie_mcp.api.limiter import (
+    BULK,
+    INTERACTIVE,
+    ConcurrencyLimiter,
+    priority,
+    request_priority,
+)
+
+
+def test_bulk_traffic_leaves_interactive_reserve():
+    limiter = ConcurrencyLimiter(initial=4, reserve=0.25)
+    for _ in range(3):
+        limiter.acquire(BULK)
+    assert not limiter._can_admit(BULK)
+    assert limiter._can_admit(INTERACTIVE)
+    limiter.acquire(INTERACTIVE)
+    assert limiter.snapshot()["in_flight"] == 4
+
+
+def test_overload_halves_limit_once_per_congestion_event():
+    limiter = ConcurrencyLimiter(initial=8)
+    starts = [limiter.acquire() for _ in range(3)]
+    limiter.release(starts[0], overloaded=True)
+    assert limiter.limit == 4.0
+    # Requests already in flight when the limit was cut do not cut it again.
+    limiter.release(starts[1], overloaded=True)
+    assert limiter.limit == 4.0
+    limiter.release(limiter.acquire(), overloaded=True)
+    assert limiter.limit == 2.0
+    assert limiter.snapshot()["decreases"] == 2
+
+
+def test_healthy_busy_traffic_grows_limit_up_to_max():
+    limiter = ConcurrencyLimiter(initial=2, max_limit=3)
+    for _ in range(50):
+        a, b = limiter.acquire(), limiter.acquire()
+        limiter.release(a, latency=0.01)
+        limiter.release(b, latency=0.01)
+    assert limiter.limit == 3
+
+
+def test_rising_read_latency_backs_off():
+    limiter = ConcurrencyLimiter(initial=8)
+    for latency in [0.01] * 20 + [0.5] * 20:
+        limiter.release(limiter.acquire(), latency=latency)
+    assert limiter.snapshot()["decreases"] == 1
+
+
+def test_limit_recovers_after_a_lasting_latency_shift():
+    limiter = ConcurrencyLimiter(initial=8)
+    for _ in range(100):
+        limiter.release(limiter.acquire(), latency=0.01)
+    for _ in range(200):
+        limiter.release(limiter.acquire(), latency=0.5)
+    decreases = limiter.snapshot()["decreases"]
+    assert decreases > 0
+
+    for _ in range(200):
+        limiter.release(limiter.acquire(), latency=0.5)
+    assert limiter.snapshot()["decreases"] == decreases
+    assert limiter.limit > 2
+    assert limiter.snapshot()["baseline_p95_seconds"] > 0.25
+
+
+def test_priority_from_context_or_endpoint():
+    assert request_priority("/api/recipes") == INTERACTIVE
+    assert request_priority("/api/recipes/bulk-actions/tag") == BULK
+    assert request_priority("/api/recipes/create/url/bulk") == BULK
+    with priority(BULK):
+        assert request_priority("/api/recipes") == BULK
+
+
+@pytest.mark.asyncio
+async def test_queued_interactive_is_admitted_before_bulk():
+    limiter = ConcurrencyLimiter(initial=2, reserve=0.5)
+    held = await limiter.acquire_async(BULK)
+    await limiter.acquire_async(INTERACTIVE)
+    order = []
+
+    async def wait(level):
+        await limiter.acquire_async(level)
+        order.append(level)
+
+    tasks = [asyncio.create_task(wait(BULK)), asyncio.create_task(wait(INTERACTIVE))]
+    await asyncio.sleep(0)
+    limiter.release(held)
+    await asyncio.sleep(0.01)
+    assert order == [INTERACTIVE]
+    tasks[0].cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    assert limiter.snapshot()["queued"] == {INTERACTIVE: 0, BULK: 0}
+
+
+@pytest.mark.asyncio
+async def test_async_client_reports_overload_to_limiter(mock_client):
+    from mealie_mcp.api.errors import MealieApiError
+    from mealie_mcp.api.retry import RetryPolicy
+
+    limiter = ConcurrencyLimiter(initial=8)
+    client = mock_client(
+        lambda request: httpx.Response(503),
+        limiter=limiter,
+        retry=RetryPolicy(max_attempts=1),
+    )
+    with pytest.raises(MealieApiError):
+        await client.get_foods()
+    await client.aclose()
+
+    stats = client.client_stats()["concurrency"]
+    assert stats["limit"] == 4.0 and stats["in_flight"] == 0
+
+
+def test_prepare_call_consumes_priority_option():
+    from mealie_mcp.dispatch import prepare_call
+
+    assert prepare_call(None, {"priority": "bulk", "page": 1}) == {"page": 1}
+    assert request_priority("/api/recipes") == BULK
+    prepare_call(None, {})
+    assert request_priority("/api/recipes") == INTERACTIVE
+    with pytest.raises(ValueError):
+        prepare_call(None, {"priority": "urgent"})
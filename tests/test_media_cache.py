@@ -0,0 +1,155 @@
+"""Content-addressed on-disk cache for recipe media."""
+
+import hashlib
+import os
+import stat
+
+import httpx
+import pytest
+
+from mealie_mcp.api.media_cache import MediaCache, media_key
+
+_IMAGE = b"\x89PNG" + bytes(range(256)) * 4
+
+
+def _client(mock_client, tmp_path, handler, **cache_options):
+    return mock_client(
+        handler,
+        download_dir=str(tmp_path / "downloads"),
+        media_cache=MediaCache(tmp_path / "media", **cache_options),
+    )
+
+
+def _server(requests):
+    def handler(request):
+        requests.append((request.method, request.url.path, dict(request.headers)))
+        if request.method != "GET":
+            return httpx.Response(200, json={})
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            content=_IMAGE,
+            headers={"Content-Type": "image/webp", "ETag": '"v1"'},
+        )
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_repeated_image_is_served_from_disk(mock_client, tmp_path):
+    requests = []
+    client = _client(mock_client, tmp_path, _server(requests))
+    first = await client.get_recipe_img("id-1", "original.webp")
+    second = await client.get_recipe_img("id-1", "original.webp")
+    stats = client.client_stats()["media_cache"]
+    await client.aclose()
+
+    assert len(requests) == 1
+    assert first.content == second.content == _IMAGE
+    assert second.content_type == "image/webp"
+    assert second.path == first.path and open(second.path, "rb").read() == _IMAGE
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_revalidated_with_its_etag(mock_client, tmp_path):
+    requests = []
+    client = _client(mock_client, tmp_path, _server(requests), ttl=0)
+    await client.get_recipe_img("id-1", "original.webp")
+    again = await client.get_recipe_img("id-1", "original.webp")
+    stats = client.client_stats()["media_cache"]
+    await client.aclose()
+
+    assert requests[1][2]["if-none-match"] == '"v1"'
+    assert again.content == _IMAGE
+    assert stats["revalidated"] == 1
+
+
+@pytest.mark.asyncio
+async def test_image_write_drops_the_recipes_media(mock_client, tmp_path):
+    requests = []
+    client = _client(mock_client, tmp_path, _server(requests))
+    client.slug_index.add("id-1", "pasta")
+    await client.get_recipe_img("id-1", "original.webp")
+    await client.get_recipe_img("id-2", "original.webp")
+    await client.update_recipe_image("pasta", data={})
+    await client.get_recipe_img("id-1", "original.webp")
+    await client.get_recipe_img("id-2", "original.webp")
+    await client.aclose()
+
+    gets = [path for method, path, _ in requests if method == "GET"]
+    assert gets.count("/api/media/recipes/id-1/images/original.webp") == 2
+    assert gets.count("/api/media/recipes/id-2/images/original.webp") == 1
+
+
+@pytest.mark.asyncio
+async def test_asset_download_is_copied_out_of_the_cache(mock_client, tmp_path):
+    requests = []
+    client = _client(mock_client, tmp_path, _server(requests))
+    first = await client.get_recipe_asset("id-1", "card.pdf", dest="a.pdf")
+    second = await client.get_recipe_asset("id-1", "card.pdf", dest="b.pdf")
+    await client.aclose()
+
+    assert len(requests) == 1
+    assert second["cached"] and second["sha256"] == first["sha256"]
+    assert (tmp_path / "downloads" / "b.pdf").read_bytes() == _IMAGE
+
+
+def _headers(**extra):
+    return httpx.Headers({"Content-Type": "image/webp", **extra})
+
+
+def test_same_body_under_two_paths_is_stored_once(tmp_path):
+    cache = MediaCache(tmp_path)
+    a = cache.put("/api/media/recipes/a/images/x.webp", _IMAGE, _headers())
+    b = cache.put("/api/media/recipes/b/images/x.webp", _IMAGE, _headers())
+
+    assert a.path == b.path
+    assert a.path.endswith(hashlib.sha256(_IMAGE).hexdigest())
+    assert cache.snapshot()["blobs"] == 1 and cache.snapshot()["entries"] == 2
+
+
+def test_least_recently_used_entries_are_evicted_under_the_cap(tmp_path):
+    cache = MediaCache(tmp_path, max_bytes=2500)
+    bodies = {name: name.encode() * 1000 for name in ("a", "b", "c")}
+    cache.put("/api/media/recipes/a/images/x", bodies["a"], _headers())
+    cache.put("/api/media/recipes/b/images/x", bodies["b"], _headers())
+    assert cache.get("/api/media/recipes/a/images/x") is not None  # a now newest
+    cache.put("/api/media/recipes/c/images/x", bodies["c"], _headers())
+
+    assert cache.get("/api/media/recipes/b/images/x") is None
+    assert cache.get("/api/media/recipes/a/images/x") is not None
+    assert cache.snapshot()["bytes"] <= 2500 and cache.snapshot()["evictions"] == 1
+    blobs = [p for p in (tmp_path / "blobs").rglob("*") if p.is_file()]
+    assert len(blobs) == 2
+
+
+def test_cache_files_are_private_whatever_the_umask(tmp_path):
+    source = tmp_path / "card.pdf"
+    source.write_bytes(b"%PDF")
+    previous = os.umask(0)
+    try:
+        cache = MediaCache(tmp_path / "media")
+        cache.put("/api/media/recipes/a/images/x.webp", _IMAGE, _headers())
+        digest = hashlib.sha256(b"%PDF").hexdigest()
+        cache.put_file("/api/media/recipes/a/assets/card.pdf", source, digest, {})
+    finally:
+        os.umask(previous)
+
+    def mode(path):
+        return stat.S_IMODE(os.stat(path).st_mode)
+
+    blobs = tmp_path / "media" / "blobs"
+    assert mode(tmp_path / "media") == mode(blobs) == 0o700
+    assert {mode(p) for p in blobs.iterdir()} == {0o700}
+    assert mode(tmp_path / "media" / "index.db") == 0o600
+    files = [p for p in blobs.rglob("*") if p.is_file()]
+    assert len(files) == 2 and {mode(p) for p in files} == {0o600}
+
+
+def test_only_plain_media_gets_are_cacheable():
+    assert media_key("GET", "/api/media/recipes/r/images/x") is not None
+    assert media_key("GET", "/api/media/recipes/r/images/x", {"v": 1}) is None
+    assert media_key("GET", "/api/media/users/u/profile.png") is None
+    assert media_key("POST", "/api/media/recipes/r/images/x") is None
@@ -0,0 +1,183 @@
+"""Local SQLite mirror: delta sync and local-first reads."""
+
+import httpx
+import pytest
+
+from mealie_mcp.mirror import Mirror, sync
+
+
+def _client(monkeypatch, recipes, foods=(), detail_calls=None, mirror=None):
+    from mealie_mcp.api_client import Api
+
+    client = Api(base_url="https://mealie.test", mirror=mirror)
+
+    def page_of(records, params):
+        page, per_page = params.get("page", 1), params.get("perPage", 50)
+        return {
+            "page": page,
+            "total": len(records),
+            "total_pages": max(1, -(-len(records) // per_page)),
+            "items": records[(page - 1) * per_page : page * per_page],
+        }
+
+    def fake_request(**kwargs):
+        path = httpx.URL(kwargs["url"]).path
+        params = kwargs.get("params") or {}
+        if kwargs["method"] != "GET":
+            body = {}
+        elif path == "/api/recipes":
+            assert params["orderBy"] == "dateUpdated"
+            ordered = sorted(recipes, key=lambda r: r["dateUpdated"], reverse=True)
+            body = page_of(ordered, params)
+        elif path.startswith("/api/recipes/"):
+            slug = path.rsplit("/", 1)[1]
+            if detail_calls is not None:
+                detail_calls.append(slug)
+            recipe = next(r for r in recipes if r["slug"] == slug)
+            body = {**recipe, "recipeIngredient": [{"note": slug}]}
+        elif path == "/api/foods":
+            body = page_of(list(foods), params)
+        else:
+            body = page_of([], params)
+        response = httpx.Response(200, json=body)
+        response.read()
+        return response
+
+    monkeypatch.setattr(client._session, "request", fake_request)
+    return client
+
+
+def _recipe(i, updated):
+    return {
+        "id": f"id-{i}",
+        "slug": f"r{i}",
+        "name": f"Recipe {i}",
+        "dateUpdated": updated,
+    }
+
+
+def test_delta_sync_fetches_only_changed_recipes(monkeypatch, tmp_path):
+    recipes = [_recipe(i, f"2025-01-0{i}T00:00:00") for i in range(1, 4)]
+    calls = []
+    client = _client(monkeypatch, recipes, detail_calls=calls)
+    mirror = Mirror(str(tmp_path / "mirror.db"))
+
+    first = sync(mirror, client, full=True)
+    assert first["recipes"] == {"listed": 3, "fetched": 3, "removed": 0}
+    assert sorted(calls) == ["r1", "r2", "r3"]
+
+    calls.clear()
+    recipes[0]["dateUpdated"] = "2025-02-01T00:00:00"
+    second = sync(mirror, client)
+    assert calls == ["r1"]
+    assert second["recipes"]["fetched"] == 1
+    assert mirror.get("recipes", "r1")["recipeIngredient"] == [{"note": "r1"}]
+    assert mirror.get("recipes", "id-1")["dateUpdated"] == "2025-02-01T00:00:00"
+
+
+def test_full_sync_drops_deleted_recipes(monkeypatch, tmp_path):
+    recipes = [_recipe(i, f"2025-01-0{i}T00:00:00") for i in range(1, 4)]
+    client = _client(monkeypatch, recipes)
+    mirror = Mirror(str(tmp_path / "mirror.db"))
+    sync(mirror, client, full=True)
+
+    del recipes[1]
+    assert sync(mirror, client, full=True)["recipes"]["removed"] == 1
+    assert mirror.get("recipes", "r2") is None
+    assert mirror.page("recipes")["total"] == 2
+
+
+def test_sync_thread_is_stopped_and_joined(monkeypatch, tmp_path):
+    import time
+
+    from mealie_mcp import auth
+    from mealie_mcp import mirror as mirror_module
+
+    client = _client(monkeypatch, [_recipe(1, "2025-01-01T00:00:00")])
+    monkeypatch.setattr(auth, "get_client", lambda: client)
+    monkeypatch.setenv("MEALIE_MIRROR_PATH", str(tmp_path / "mirror.db"))
+    monkeypatch.setenv("MEALIE_MIRROR_INTERVAL", "3600")
+
+    mirror = mirror_module.start_mirror()
+    thread = mirror_module._sync
+    assert thread is not None and thread.is_alive()
+    deadline = time.monotonic() + 5
+    while mirror.age("recipes") is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert mirror.get("recipes", "r1") is not None
+
+    mirror_module.stop_mirror()
+    assert not thread.is_alive()
+    assert mirror_module.current_mirror() is None and mirror_module._sync is None
+
+
+def test_local_answers_respect_freshness_and_filters(monkeypatch, tmp_path):
+    foods = [{"id": "f2", "name": "salt"}, {"id": "f1", "name": "Basil"}]
+    client = _client(monkeypatch, [_recipe(1, "2025-01-01T00:00:00")], foods)
+    mirror = Mirror(str(tmp_path / "mirror.db"))
+    assert mirror.answer("get_foods", {}, max_age=60) is None
+
+    sync(mirror, client, full=True)
+    page = mirror.answer("get_foods", {"page": 1, "per_page": 1}, max_age=60)
+    assert page["items"] == [{"id": "f1", "name": "Basil"}]
+    assert page["total"] == 2 and page["total_pages"] == 2
+    recipe = mirror.answer("get_recipes_slug", {"slug": "r1"}, max_age=60)
+    assert recipe["recipeIngredient"] == [{"note": "r1"}]
+
+    assert mirror.answer("get_foods", {"search": "salt"}, max_age=60) is None
+    assert mirror.answer("get_foods", {}, max_age=-1) is None
+    assert mirror.answer("get_shopping_lists", {}, max_age=60) is None
+
+
+def test_writes_through_the_client_keep_local_reads_honest(monkeypatch, tmp_path):
+    recipes = [_recipe(i, f"2025-01-0{i}T00:00:00") for i in range(1, 4)]
+    mirror = Mirror(str(tmp_path / "mirror.db"))
+    foods = [{"id": "f1", "name": "basil"}]
+    client = _client(monkeypatch, recipes, foods, mirror=mirror)
+    sync(mirror, client, full=True)
+
+    client.patch_one("r1", {"name": "Renamed"})
+    assert mirror.answer("get_recipes_slug", {"slug": "r1"}, max_age=60) is None
+    assert mirror.answer("get_foods", {}, max_age=60) is not None
+
+    client.delete_recipes_slug("r2")
+    del recipes[1]
+    assert mirror.get("recipes", "r2") is None
+    assert mirror.snapshot()["recipes"]["age"] is None
+
+    sync(mirror, client)
+    assert mirror.answer("get_recipes_slug", {"slug": "r1"}, max_age=60)
+
+    client.bulk_delete_recipes({"recipes": ["r3"]})
+    del recipes[1]
+    assert mirror.cursor("recipes") is None
+    assert sync(mirror, client)["recipes"]["removed"] == 1
+    assert mirror.page("recipes")["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_local_first_call_option_skips_mealie(mock_client, monkeypatch, tmp_path):
+    from mealie_mcp import dispatch
+
+    mirror = Mirror(str(tmp_path / "mirror.db"))
+    mirror.replace("foods", [{"id": "f1", "name": "basil"}])
+    mirror.mark_synced("foods")
+    monkeypatch.setattr(dispatch, "current_mirror", lambda: mirror)
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        return httpx.Response(200, json={"items": [], "total": 0})
+
+    client = mock_client(handler)
+    local = await dispatch.run_action(
+        client.get_foods, **dispatch.prepare_call(None, {"local_first": True})
+    )
+    remote = await dispatch.run_action(
+        client.get_foods,
+        **dispatch.prepare_call(None, {"local_first": True, "max_age": 0}),
+    )
+    await client.aclose()
+
+    assert local["items"] == [{"id": "f1", "name": "basil"}]
+    assert remote["items"] == [] and requests == ["/api/foods"]
@@ -0,0 +1,222 @@
+"""Auto-paginating ``iter_*`` companions of the list operations."""
+
+import ast
+from pathlib import Path
+
+import httpx
+import pytest
+
+from mealie_mcp.api.pagination import PaginationBase, is_last_page
+
+
+def _paged(total_items, per_page_seen=None, seeds=None):
+    """Mock handler serving ``total_items`` integers Mealie-style."""
+
+    def handler(request):
+        params = request.url.params
+        page, per_page = int(params["page"]), int(params["perPage"])
+        if per_page_seen is not None:
+            per_page_seen.append(page)
+        if seeds is not None:
+            seeds.append(params.get("paginationSeed"))
+        start = (page - 1) * per_page
+        items = list(range(total_items))[start : start + per_page]
+        total_pages = -(-total_items // per_page)
+        return httpx.Response(
+            200,
+            json={
+                "page": page,
+                "per_page": per_page,
+                "total": total_items,
+                "total_pages": total_pages,
+                "items": items,
+            },
+        )
+
+    return handler
+
+
+def test_every_paginated_operation_has_a_companion():
+    operations = set()
+    api_dir = Path(__file__).resolve().parent.parent / "mealie_mcp" / "api"
+    for path in api_dir.glob("api_client_*.py"):
+        for node in ast.walk(ast.parse(path.read_text())):
+            if isinstance(node, ast.FunctionDef):
+                args = {a.arg for a in node.args.args}
+                if {"page", "per_page"} <= args:
+                    operations.add(node.name)
+    assert operations
+    for operation in operations:
+        assert hasattr(PaginationBase, f"iter_{operation.removeprefix('get_')}")
+
+
+def test_sync_iterator_walks_until_total_pages(monkeypatch):
+    from mealie_mcp.api_client import Api
+
+    pages = []
+    handler = _paged(7, pages)
+    client = Api(base_url="https://mealie.test")
+
+    def fake_request(**kwargs):
+        request = httpx.Request(
+            kwargs["method"], kwargs["url"], params=kwargs["params"]
+        )
+        response = handler(request)
+        response.read()
+        return response
+
+    monkeypatch.setattr(client._session, "request", fake_request)
+    assert list(client.iter_foods(per_page=3)) == list(range(7))
+    assert pages == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_async_iterator_keeps_one_seed_for_random_order(mock_client):
+
+    pages, seeds = [], []
+    client = mock_client(_paged(5, pages, seeds))
+    items = [i async for i in client.iter_recipes(per_page=2, order_by="random")]
+    exact = [i async for i in client.iter_units(per_page=5)]
+    await client.aclose()
+
+    assert items == list(range(5)) and pages[:3] == [1, 2, 3]
+    assert seeds[0] and seeds[:3] == [seeds[0]] * 3
+    assert exact == list(range(5)) and pages[3:] == [1]
+    assert seeds[3] is None
+
+
+def test_last_page_detection():
+    assert is_last_page({"items": [], "total_pages": 9}, 1)
+    assert is_last_page({"items": [1], "total_pages": 2}, 2)
+    assert not is_last_page({"items": [1], "total_pages": 2}, 1)
+    assert is_last_page([1, 2], 1)
+    assert is_last_page({"items": [1]}, 1)
+
+
+@pytest.mark.asyncio
+async def test_async_prefetch_is_bounded_and_in_order(mock_client):
+    import asyncio
+
+    serve = _paged(40)
+    in_flight = peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later pages answer faster, so out-of-order completion is exercised.
+        await asyncio.sleep(0.02 / int(request.url.params["page"]))
+        in_flight -= 1
+        return serve(request)
+
+    client = mock_client(handler, prefetch_pages=3)
+    items = [i async for i in client.iter_foods(per_page=4)]
+    await client.aclose()
+
+    assert items == list(range(40))
+    assert peak == 3
+
+
+def test_sync_prefetch_carries_context_into_workers(monkeypatch):
+    import threading
+
+    from mealie_mcp.api.json_codec import item_fields
+    from mealie_mcp.api_client import Api
+
+    threads, fields_seen = set(), []
+    client = Api(base_url="https://mealie.test", prefetch_pages=2)
+
+    def fake_get_units(page, per_page, **kwargs):
+        from mealie_mcp.api.json_codec import current_item_fields
+
+        threads.add(threading.current_thread().name)
+        fields_seen.append(current_item_fields())
+        return {"items": [page], "total_pages": 5}
+
+    monkeypatch.setattr(client, "get_units", fake_get_units)
+    with item_fields(["id"]):
+        assert list(client.iter_units()) == [1, 2, 3, 4, 5]
+    assert any(name.startswith("mealie-prefetch") for name in threads)
+    assert set(fields_seen) == {("id",)}
+
+
+def test_consistent_scan_dedupes_and_reports_mid_scan_changes(monkeypatch):
+    from datetime import UTC, datetime
+
+    from mealie_mcp.api_client import Api
+
+    old, new = "2024-01-01T00:00:00", "2999-01-01T00:00:00"
+    # Page 2 was served after "b" was edited and "a" deleted, so "c" shifted
+    # back onto it and shows up twice.
+    pages = {
+        1: [{"id": "a", "updatedAt": old}, {"id": "b", "updatedAt": old}],
+        2: [{"id": "b", "updatedAt": new}, {"id": "c", "updatedAt": old}],
+        3: [{"id": "c", "updatedAt": old}, {"id": "d", "updatedAt": new}],
+    }
+    sent = []
+    client = Api(base_url="https://mealie.test")
+
+    def fake_request(**kwargs):
+        params = kwargs["params"]
+        sent.append(params)
+        page = params["page"]
+        response = httpx.Response(
+            200,
+            json={
+                "items": pages[page],
+                "total": 5 if page == 1 else 4,
+                "total_pages": 3,
+            },
+        )
+        response.read()
+        return response
+
+    monkeypatch.setattr(client._session, "request", fake_request)
+    scan = client.scan(
+        "get_recipes", per_page=2, cutoff=datetime(2025, 1, 1, tzinfo=UTC)
+    )
+    assert [item["id"] for item in scan] == ["a", "b", "c", "d"]
+
+    report = scan.report()
+    assert report["duplicates"] == 2
+    assert report["changed"] == ["b", "d"]
+    assert (report["total_at_start"], report["total_at_end"]) == (5, 4)
+    assert report["possibly_missed"]
+    assert {p["orderBy"] for p in sent} == {"id"}
+    assert len({p["paginationSeed"] for p in sent}) == 1
+
+
+def _scan_over(monkeypatch, listing, delete_after_page=None):
+    """Scan a server whose id-ordered ``listing`` may lose its first row."""
+    from mealie_mcp.api_client import Api
+
+    rows = list(listing)
+    client = Api(base_url="https://mealie.test")
+
+    def fake_request(**kwargs):
+        page, per_page = kwargs["params"]["page"], kwargs["params"]["perPage"]
+        body = {
+            "items": rows[(page - 1) * per_page : page * per_page],
+            "total": len(rows),
+            "total_pages": -(-len(listing) // per_page),
+        }
+        if page == delete_after_page:
+            del rows[0]
+        response = httpx.Response(200, json=body)
+        response.read()
+        return response
+
+    monkeypatch.setattr(client._session, "request", fake_request)
+    return client.scan("get_recipes", per_page=2, prefetch=0)
+
+
+def test_consistent_scan_flags_rows_skipped_by_a_mid_scan_delete(monkeypatch):
+    listing = [{"id": i} for i in "abcde"]
+    scan = _scan_over(monkeypatch, listing, delete_after_page=1)
+    # "c" shifted back onto page 1 after it was read and is never delivered.
+    assert [item["id"] for item in scan] == ["a", "b", "d", "e"]
+    assert scan.report()["possibly_missed"]
+
+    steady = _scan_over(monkeypatch, listing)
+    assert [item["id"] for item in steady] == list("abcde")
+    assert not steady.report()["possibly_missed"]
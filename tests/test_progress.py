@@ -0,0 +1,92 @@
+"""Progress notifications, page streaming and partial results in dispatch."""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from mealie_mcp.dispatch import prepare_call, run_action
+
+
+class _Ctx:
+    def __init__(self, timeout=None):
+        self.progress = []
+        self.logs = []
+        meta = {"timeout": timeout} if timeout is not None else None
+        self.request_context = SimpleNamespace(meta=meta)
+
+    async def report_progress(self, progress, total=None, message=None):
+        self.progress.append((progress, total))
+
+    async def log(self, message, level=None, logger_name=None, extra=None):
+        self.logs.append((logger_name, extra))
+
+
+def _client(mock_client, delay=0.0):
+    async def handler(request):
+        await asyncio.sleep(delay)
+        page = int(request.url.params.get("page", 1))
+        per_page = int(request.url.params["perPage"])
+        items = list(range(5))[(page - 1) * per_page : page * per_page]
+        return httpx.Response(
+            200,
+            json={"items": items, "total": 5, "total_pages": 3, "page": page},
+        )
+
+    client = mock_client(handler)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_all_pages_reports_progress_and_streams_pages(mock_client):
+    client = _client(mock_client)
+    ctx = _Ctx()
+    kwargs = prepare_call(ctx, {"all_pages": True, "stream": True, "per_page": 2})
+    result = await run_action(client.get_foods, **kwargs)
+    await client.aclose()
+
+    assert result == {"items": [0, 1, 2, 3, 4], "total": 5, "pages": 3}
+    assert ctx.progress == [(1, 3), (2, 3), (3, 3)]
+    assert [extra["items"] for _, extra in ctx.logs] == [[0, 1], [2, 3], [4]]
+    assert {name for name, _ in ctx.logs} == {"mealie_mcp.page"}
+
+
+@pytest.mark.asyncio
+async def test_all_pages_returns_partial_result_when_deadline_passes(mock_client):
+    client = _client(mock_client, delay=0.04)
+    kwargs = prepare_call(_Ctx(timeout=0.06), {"all_pages": True, "per_page": 2})
+    result = await run_action(client.get_foods, **kwargs)
+    await client.aclose()
+
+    assert result["truncated"] is True
+    assert result["items"] == [0, 1, 2, 3][: 2 * result["pages"]]
+    assert result["next_page"] == result["pages"] + 1
+
+
+@pytest.mark.asyncio
+async def test_without_all_pages_only_the_requested_page_is_fetched(mock_client):
+    client = _client(mock_client)
+    ctx = _Ctx()
+    kwargs = prepare_call(ctx, {"per_page": 2})
+    result = await run_action(client.get_foods, **kwargs)
+    await client.aclose()
+
+    assert result["items"] == [0, 1]
+    assert ctx.progress == []
+
+
+@pytest.mark.asyncio
+async def test_fields_option_projects_result_and_counts_bytes_saved(mock_client):
+    from mealie_mcp.dispatch import projection_stats
+
+    client = _client(mock_client)
+    kwargs = prepare_call(_Ctx(), {"per_page": 5, "fields": "total"})
+    result = await run_action(client.get_foods, **kwargs)
+    plain = await run_action(client.get_foods, **prepare_call(_Ctx(), {"per_page": 5}))
+    await client.aclose()
+
+    assert result == {"total": 5, "page": 1, "total_pages": 3}
+    assert plain["items"] == [0, 1, 2, 3, 4]
+    stats = projection_stats()["get_foods"]
+    assert stats["calls"] == 1 and stats["bytes_saved"] > 0
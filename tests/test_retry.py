@@ -0,0 +1,197 @@
+"""Retry policy — backoff, Retry-After, budget and idempotency awareness."""
+
+import httpx
+import pytest
+
+from mealie_mcp.api.errors import MealieApiError
+from mealie_mcp.api.retry import (
+    RetryBudget,
+    RetryPolicy,
+    parse_retry_after,
+    retry_safe,
+)
+
+_FAST = RetryPolicy(max_attempts=3, backoff_base=0.0)
+
+
+def test_idempotent_methods_retry_by_default():
+    policy = RetryPolicy()
+    for method in ("GET", "PUT", "DELETE"):
+        assert policy.allows(method, "/api/recipes/carbonara")
+    assert not policy.allows("POST", "/api/recipes")
+    assert not policy.allows("POST", "/api/recipes/create/url/bulk")
+
+
+def test_post_retries_only_when_marked_safe():
+    policy = RetryPolicy()
+    assert policy.allows("POST", "/api/parser/ingredients")
+    assert policy.allows("POST", "/api/recipes", retry_safe=True)
+    assert not policy.allows("GET", "/api/recipes", retry_safe=False)
+    with retry_safe():
+        assert policy.allows("POST", "/api/recipes/create/url/bulk")
+    assert not policy.allows("POST", "/api/recipes/create/url/bulk")
+
+
+def test_backoff_honours_retry_after_and_attempt_cap():
+    policy = RetryPolicy(max_attempts=3, backoff_base=1.0, max_retry_after=10)
+    assert policy.backoff(1, "2") == 2.0
+    assert policy.backoff(1, "120") is None
+    assert 0.0 <= policy.backoff(2) <= 2.0
+    assert policy.backoff(3) is None
+
+
+def test_parse_retry_after_http_date():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("not-a-date") is None
+    assert parse_retry_after(None) is None
+
+
+def test_retry_budget_caps_retries():
+    budget = RetryBudget(ratio=0.5, reserve=1.0)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+    assert budget.snapshot()["budget_exhausted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_survives_transient_503(mock_client):
+    statuses = iter([503, 502, 200])
+
+    def handler(request):
+        return httpx.Response(next(statuses), json={"items": []})
+
+    client = mock_client(handler, token="t", retry=_FAST)
+    assert await client.get_foods() == {"items": []}
+    assert client.client_stats()["retry"]["retries"] == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_unsafe_post_is_not_replayed(mock_client):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    client = mock_client(handler, token="t", retry=_FAST)
+    with pytest.raises(MealieApiError) as exc:
+        await client.post_recipes(data={"name": "Carbonara"})
+    assert exc.value.status_code == 503
+    assert len(calls) == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_connect_errors_retry_even_for_post(mock_client):
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(201, json={"slug": "carbonara"})
+
+    client = mock_client(handler, token="t", retry=_FAST)
+    assert await client.post_recipes(data={"name": "Carbonara"}) == {
+        "slug": "carbonara"
+    }
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_errors_after_sending_do_not_replay_post(mock_client):
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        raise httpx.ReadError("reset", request=request)
+
+    client = mock_client(handler, token="t", retry=_FAST)
+    with pytest.raises(httpx.ReadError):
+        await client.post_recipes(data={"name": "Carbonara"})
+    assert len(attempts) == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_retry_safe_call_option_replays_post(mock_client):
+    from mealie_mcp.dispatch import prepare_call, run_action
+
+    statuses = iter([503, 201])
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(next(statuses), json={"slug": "carbonara"})
+
+    client = mock_client(handler, token="t", retry=_FAST)
+    kwargs = prepare_call(None, {"data": {"name": "Carbonara"}, "retry_safe": True})
+    assert kwargs == {"data": {"name": "Carbonara"}}
+    assert await run_action(client.post_recipes, **kwargs) == {"slug": "carbonara"}
+    assert len(calls) == 2
+    await client.aclose()
+
+
+class _FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = b'{"ok": true}'
+        self.text = self.content.decode()
+
+    def close(self):
+        pass
+
+
+def test_sync_client_retries_429_with_retry_after(monkeypatch):
+    from mealie_mcp.api_client import Api
+
+    client = Api(base_url="https://mealie.test", token="t", retry=_FAST)
+    responses = iter([_FakeResponse(429, {"Retry-After": "0"}), _FakeResponse(200)])
+    monkeypatch.setattr(client._session, "request", lambda **kw: next(responses))
+    assert client.get_units() == {"ok": True}
+    client.close()
+
+
+def _sync_post(monkeypatch, error):
+    from mealie_mcp.api_client import Api
+
+    client = Api(base_url="https://mealie.test", token="t", retry=_FAST)
+    attempts = []
+
+    def fake_request(**kwargs):
+        attempts.append(kwargs)
+        if len(attempts) == 1:
+            raise error
+        return _FakeResponse(201)
+
+    monkeypatch.setattr(client._session, "request", fake_request)
+    return client, attempts
+
+
+def test_sync_refused_connection_is_replayed_for_post(monkeypatch):
+    import requests
+    from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+    refused = NewConnectionError(None, "Connection refused")
+    error = requests.ConnectionError(MaxRetryError(None, "/api/recipes", refused))
+    client, attempts = _sync_post(monkeypatch, error)
+    assert client.post_recipes(data={"name": "Carbonara"}) == {"ok": True}
+    assert len(attempts) == 2
+    client.close()
+
+
+def test_sync_reset_after_sending_is_not_replayed_for_post(monkeypatch):
+    import requests
+    from urllib3.exceptions import ProtocolError
+
+    error = requests.ConnectionError(ProtocolError("Connection aborted."))
+    client, attempts = _sync_post(monkeypatch, error)
+    with pytest.raises(requests.ConnectionError):
+        client.post_recipes(data={"name": "Carbonara"})
+    assert len(attempts) == 1
+    client.close()
@@ -0,0 +1,157 @@
+"""Identical concurrent reads share one upstream call."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from mealie_mcp.api.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_share_one_request(mock_client):
+    calls = []
+
+    async def handler(request):
+        calls.append(str(request.url))
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"items": []})
+
+    client = mock_client(handler)
+    results = await asyncio.gather(
+        *(client.get_foods(page=1) for _ in range(5)), client.get_foods(page=2)
+    )
+    await client.aclose()
+
+    assert len(calls) == 2
+    assert all(r is results[0] for r in results[:5])
+    assert client.client_stats()["single_flight"] == {"leaders": 2, "collapsed": 4}
+
+
+@pytest.mark.asyncio
+async def test_writes_and_disabled_client_are_not_coalesced(mock_client):
+    calls = []
+
+    async def handler(request):
+        calls.append(request.method)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={})
+
+    client = mock_client(handler)
+    await asyncio.gather(*(client.post_foods(data={"name": "x"}) for _ in range(3)))
+    await client.aclose()
+    assert calls == ["POST"] * 3
+
+    calls.clear()
+    client = mock_client(handler, coalesce=False)
+    await asyncio.gather(*(client.get_foods() for _ in range(3)))
+    await client.aclose()
+    assert calls == ["GET"] * 3
+    assert "single_flight" not in client.client_stats()
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_leader_does_not_fail_followers(mock_client):
+    release = asyncio.Event()
+
+    async def handler(request):
+        await release.wait()
+        return httpx.Response(200, json={"ok": True})
+
+    client = mock_client(handler)
+    leader = asyncio.create_task(client.get_foods())
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(client.get_foods())
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+    assert await follower == {"ok": True}
+    await client.aclose()
+
+
+def test_sync_flight_shares_result_and_error():
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return {"items": []}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flights.do("k", slow)))
+    leader.start()
+    started.wait()
+    follower = threading.Thread(target=lambda: results.append(flights.do("k", slow)))
+    follower.start()
+    while flights.collapsed == 0:
+        pass
+    release.set()
+    leader.join()
+    follower.join()
+    assert len(calls) == 1 and results[0] is results[1]
+
+    def boom():
+        raise RuntimeError("down")
+
+    with pytest.raises(RuntimeError):
+        flights.do("k", boom)
+
+
+def test_sync_flight_with_an_earlier_deadline_is_not_joined():
+    flights = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append("leader")
+        started.set()
+        release.wait()
+        return "leader"
+
+    def own():
+        calls.append("own")
+        return "own"
+
+    leader = threading.Thread(target=lambda: flights.do("k", slow, deadline=1.0))
+    leader.start()
+    started.wait()
+    # The leader is still in flight, but gives up before this caller would.
+    assert flights.do("k", own, deadline=None) == "own"
+    release.set()
+    leader.join()
+    assert calls == ["leader", "own"] and flights.collapsed == 0
+
+
+@pytest.mark.asyncio
+async def test_callers_only_join_flights_that_run_on_their_terms(mock_client):
+    from mealie_mcp.api.limiter import priority
+    from mealie_mcp.api.timeouts import deadline
+
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"items": []})
+
+    client = mock_client(handler)
+
+    async def under(seconds=None, level=None, timeout=None):
+        with deadline(seconds), priority(level):
+            return await client.request("GET", "/api/foods", timeout=timeout)
+
+    await asyncio.gather(under(), under(level="bulk"), under(timeout=99))
+    assert len(calls) == 3
+
+    calls.clear()
+    # A short-deadline flight cannot serve an unbounded caller, but the
+    # unbounded one serves the short and later callers.
+    await asyncio.gather(under(seconds=5), under(), under(seconds=1), under())
+    await client.aclose()
+    assert len(calls) == 2
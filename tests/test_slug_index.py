@@ -0,0 +1,115 @@
+"""Recipe slug <-> id index and resolver."""
+
+import httpx
+import pytest
+
+from mealie_mcp.api.slug_index import SlugIndex
+
+RECIPES = [
+    {"id": f"id-{i}", "slug": f"recipe-{i}", "name": f"Recipe {i}"} for i in range(5)
+]
+
+
+def test_learns_from_pages_renames_and_deletes():
+    index = SlugIndex()
+    index.learn("GET", "/api/recipes", None, {"items": RECIPES[:2], "total": 2})
+    index.learn(
+        "GET",
+        "/api/households/mealplans",
+        None,
+        {"items": [{"id": 7, "recipeId": "id-4", "recipe": RECIPES[4]}]},
+    )
+    index.learn("GET", "/api/foods", None, {"items": [{"id": "f", "slug": "salt"}]})
+    assert index.resolve("recipe-0") == {"id": "id-0", "slug": "recipe-0"}
+    assert index.resolve("id-4")["slug"] == "recipe-4"
+    assert index.resolve("7") is None and index.resolve("salt") is None
+
+    renamed = {**RECIPES[1], "slug": "new-name"}
+    index.learn("PATCH", "/api/recipes/recipe-1", {}, renamed)
+    assert index.resolve("recipe-1") is None
+    assert index.resolve("id-1")["slug"] == "new-name"
+
+    index.learn("DELETE", "/api/recipes/new-name", None, RECIPES[1])
+    index.learn(
+        "POST", "/api/recipes/bulk-actions/delete", {"recipes": ["recipe-0"]}, {}
+    )
+    assert index.resolve("id-1") is None and index.resolve("id-0") is None
+
+
+def test_rewrites_keys_to_what_the_endpoint_expects():
+    index = SlugIndex()
+    index.add("id-0", "recipe-0")
+
+    assert index.canonical("PATCH", "/api/recipes/id-0") == "/api/recipes/recipe-0"
+    assert index.canonical("GET", "/api/recipes/id-0") == "/api/recipes/id-0"
+    assert (
+        index.canonical("GET", "/api/media/recipes/recipe-0/images/original.webp")
+        == "/api/media/recipes/id-0/images/original.webp"
+    )
+    assert (
+        index.canonical("POST", "/api/users/u/favorites/id-0")
+        == "/api/users/u/favorites/recipe-0"
+    )
+    assert (
+        index.canonical("GET", "/api/users/self/ratings/recipe-0")
+        == "/api/users/self/ratings/id-0"
+    )
+    assert index.canonical("GET", "/api/users/self/ratings/id-0") == (
+        "/api/users/self/ratings/id-0"
+    )
+    assert index.canonical("POST", "/api/recipes/bulk-actions/tag") == (
+        "/api/recipes/bulk-actions/tag"
+    )
+    assert index.snapshot() == {"entries": 1, "rewrites": 4}
+
+
+def test_bounded_drops_oldest_pair():
+    index = SlugIndex(max_entries=2)
+    for recipe in RECIPES[:3]:
+        index.add(recipe["id"], recipe["slug"])
+    assert index.resolve("recipe-0") is None
+    assert index.resolve("id-2") is not None
+
+
+def _client(mock_client, paths):
+    def handler(request):
+        paths.append(request.url.path)
+        if request.url.path == "/api/recipes":
+            page = int(request.url.params.get("page", 1))
+            per_page = 2  # Mealie caps the page; forces several pages.
+            items = RECIPES[(page - 1) * per_page : page * per_page]
+            return httpx.Response(
+                200,
+                json={"page": page, "total": 5, "total_pages": 3, "items": items},
+            )
+        key = request.url.path.rsplit("/", 1)[1]
+        recipe = next((r for r in RECIPES if key in (r["id"], r["slug"])), None)
+        if recipe is None:
+            return httpx.Response(404, json={"detail": "not found"})
+        return httpx.Response(200, json={**recipe, "recipeIngredient": []})
+
+    client = mock_client(handler, prefetch_pages=0)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_resolver_fetches_one_detail_or_walks_list_pages(mock_client):
+    paths = []
+    client = _client(mock_client, paths)
+
+    single = await client.resolve_recipes(["recipe-3"])
+    assert single == {
+        "resolved": {"recipe-3": {"id": "id-3", "slug": "recipe-3"}},
+        "missing": [],
+    }
+    assert paths == ["/api/recipes/recipe-3"]
+
+    paths.clear()
+    many = await client.resolve_recipes(["id-0", "recipe-2", "recipe-3"])
+    assert many["resolved"]["recipe-2"]["id"] == "id-2"
+    assert paths == ["/api/recipes", "/api/recipes"]
+
+    paths.clear()
+    assert (await client.resolve_recipes(["id-0", "nope"]))["missing"] == ["nope"]
+    await client.aclose()
+    assert paths == ["/api/recipes/nope"]
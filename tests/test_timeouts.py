@@ -0,0 +1,79 @@
+"""Endpoint-class timeouts, per-call overrides and deadline propagation."""
+
+import httpx
+import pytest
+
+from mealie_mcp.api.errors import DeadlineExceeded
+from mealie_mcp.api.timeouts import TimeoutPolicy, deadline, request_timeout
+
+_POLICY = TimeoutPolicy(connect=2.0, fast=10.0, write=20.0, slow=90.0, download=300.0)
+
+
+@pytest.mark.parametrize(
+    ("method", "endpoint", "expected"),
+    [
+        ("GET", "/api/recipes", "fast"),
+        ("GET", "/api/foods/f-1", "fast"),
+        ("POST", "/api/foods", "write"),
+        ("PUT", "/api/recipes/carbonara/image", "write"),
+        ("POST", "/api/recipes/carbonara/image", "slow"),
+        ("POST", "/api/recipes/create/image", "slow"),
+        ("POST", "/api/recipes/create/url/bulk", "slow"),
+        ("POST", "/api/admin/debug/openai", "slow"),
+        ("GET", "/api/admin/backups/mealie.zip", "download"),
+        ("POST", "/api/admin/backups", "download"),
+        ("GET", "/api/utils/download", "download"),
+        ("GET", "/api/media/recipes/r-1/images/original.webp", "download"),
+    ],
+)
+def test_endpoint_classes(method, endpoint, expected):
+    assert _POLICY.classify(method, endpoint) == expected
+
+
+def test_override_replaces_class_timeout():
+    assert _POLICY.resolve("GET", "/api/recipes") == (2.0, 10.0)
+    assert _POLICY.resolve("GET", "/api/recipes", 3.0) == (2.0, 3.0)
+    with request_timeout(45.0):
+        assert _POLICY.resolve("POST", "/api/recipes/create/url") == (2.0, 45.0)
+
+
+def test_deadline_caps_timeout_and_fails_fast_when_spent():
+    with deadline(1.0):
+        connect, read = _POLICY.resolve("GET", "/api/admin/backups/x.zip")
+        assert connect <= 1.0 and read <= 1.0
+    with deadline(0.0), pytest.raises(DeadlineExceeded):
+        _POLICY.resolve("GET", "/api/recipes")
+
+
+def test_nested_deadline_keeps_the_earlier_one():
+    with deadline(1.0), deadline(60.0):
+        assert _POLICY.resolve("GET", "/api/recipes")[1] <= 1.0
+
+
+@pytest.mark.asyncio
+async def test_async_client_sends_resolved_timeout(mock_client):
+
+    seen = []
+
+    def handler(request):
+        seen.append(request.extensions["timeout"])
+        return httpx.Response(200, json={})
+
+    client = mock_client(handler, timeouts=_POLICY)
+    await client.create_recipe_from_image(data={})
+    await client.get_units()
+    await client.aclose()
+
+    assert seen[0]["read"] == 90.0
+    assert seen[1]["read"] == 10.0
+    assert seen[1]["connect"] == 2.0
+
+
+def test_prepare_call_consumes_timeout_option():
+    from mealie_mcp.dispatch import prepare_call
+
+    kwargs = prepare_call(None, {"slug": "carbonara", "timeout": 5})
+    assert kwargs == {"slug": "carbonara"}
+    assert _POLICY.resolve("GET", "/api/recipes/carbonara")[1] == 5.0
+    prepare_call(None, {})
+    assert _POLICY.resolve("GET", "/api/recipes/carbonara")[1] == 10.0